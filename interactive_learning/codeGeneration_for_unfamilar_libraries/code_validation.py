@@ -0,0 +1,210 @@
+# code_validation.py
+# Purpose: Check generated code examples before they are shown or saved.
+# Each check runs in a worker process: the code must parse, and optionally it
+# is executed in a separate, resource-limited subprocess with a timeout.
+# Imports that do not resolve in this interpreter (often the very library being
+# learned) leave the example unverified rather than failed. Kept free of DSPy
+# imports so pool workers start cheaply.
+
+import ast
+import atexit
+import importlib.util
+import multiprocessing
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+
+try:
+    import resource
+except ImportError:  # Windows: run without rlimits
+    resource = None
+
+DEFAULT_TIMEOUT = float(os.getenv("VALIDATE_TIMEOUT", "10"))
+DEFAULT_MEMORY_MB = int(os.getenv("VALIDATE_MEMORY_MB", "512"))
+
+# The pool is created from generate_examples' threads, and forking a threaded
+# process can deadlock; workers start from a fork server (spawn without one).
+PROCESS_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+# A whole example wrapped in a markdown code fence, as LMs often return it.
+FENCED_RE = re.compile(r"\A\s*```[\w+.-]*[ \t]*\r?\n(.*?)\r?\n?[ \t]*```\s*\Z", re.S)
+
+
+def _unfence(code: str) -> str:
+    match = FENCED_RE.match(code)
+    return match.group(1) if match else code
+
+
+def _modules_in(source: str) -> set[str]:
+    """Top-level module names imported by `source` (absolute imports only)."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return set()
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def _listed_modules(imports) -> set[str]:
+    """
+    Module names from CodeGenerator's imports_needed ("import x",
+    "from y import z" or "x").
+    """
+    names = set()
+    for entry in imports or []:
+        entry = str(entry).strip().strip("`")
+        found = _modules_in(entry)
+        if not found and entry.split() and entry.split()[0].isidentifier():
+            found = {entry.split()[0].split(".")[0]}
+        names |= found
+    return names
+
+
+def _resolves(module: str) -> bool:
+    try:
+        return importlib.util.find_spec(module) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _limit_resources(memory_mb: int, cpu_seconds: int):
+    def apply():
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+
+    return apply
+
+
+def _run_isolated(code: str, timeout: float, memory_mb: int) -> tuple[str, str | None]:
+    """
+    Runs `code` in a fresh, isolated interpreter in an empty temp dir; returns
+    (status, error) with status "passed", "failed" or "unverified".
+    """
+    with tempfile.TemporaryDirectory(prefix="example_") as workdir:
+        path = os.path.join(workdir, "example.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(code)
+        try:
+            completed = subprocess.run(
+                [sys.executable, "-I", path],
+                cwd=workdir,
+                stdin=subprocess.DEVNULL,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                preexec_fn=(
+                    _limit_resources(memory_mb, int(timeout) + 1) if resource else None
+                ),
+            )
+        except subprocess.TimeoutExpired:
+            # Servers and UIs block by design: not a failure, but not a pass.
+            return "unverified", f"execution timed out after {timeout:g}s"
+    if completed.returncode != 0:
+        lines = completed.stderr.strip().splitlines()
+        last = lines[-1] if lines else f"exit code {completed.returncode}"
+        return "failed", f"execution failed: {last}"
+    return "passed", None
+
+
+def check_example(
+    code: str,
+    imports,
+    execute=False,
+    timeout=DEFAULT_TIMEOUT,
+    memory_mb=DEFAULT_MEMORY_MB,
+) -> dict:
+    """
+    Validates one example; runs in a pool worker, so it takes and returns
+    picklable values. Returns {"status": "passed" | "failed" | "unverified",
+    "errors": [...]}. Only a syntax error or a failed run counts as failed;
+    imports that are not installed here cannot be told apart from made-up
+    ones, so they leave the example unverified and it is not executed.
+    A markdown fence around the whole example is stripped first.
+    """
+    code = _unfence(code)
+    errors, unchecked = [], []
+    try:
+        ast.parse(code)
+    except SyntaxError as e:
+        errors.append(f"syntax error on line {e.lineno}: {e.msg}")
+    modules = _modules_in(code) | _listed_modules(imports)
+    missing = sorted(m for m in modules if not _resolves(m))
+    if missing:
+        unchecked.append(f"unresolved imports: {', '.join(missing)}")
+    if execute and not errors and not unchecked:
+        status, error = _run_isolated(code, timeout, memory_mb)
+        if status == "failed":
+            errors.append(error)
+        elif status == "unverified":
+            unchecked.append(error)
+    status = "failed" if errors else "unverified" if unchecked else "passed"
+    return {"status": status, "errors": errors + unchecked}
+
+
+class CodeValidator:
+    """
+    Runs check_example in a process pool. `check()` is safe to call from many
+    threads at once (generate_examples does), so examples are validated in
+    parallel as they are generated. With `execute`, snippets also run in a
+    subprocess capped at `timeout` seconds and `memory_mb` of address space.
+    """
+
+    def __init__(
+        self,
+        execute=False,
+        timeout=DEFAULT_TIMEOUT,
+        memory_mb=DEFAULT_MEMORY_MB,
+        max_workers=None,
+    ):
+        self.execute = execute
+        self.timeout = timeout
+        self.memory_mb = memory_mb
+        self.max_workers = max_workers
+        self._pool = None
+        self._lock = threading.Lock()
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context(PROCESS_START_METHOD),
+                )
+                atexit.register(self._pool.shutdown)
+            return self._pool
+
+    def check(self, example: dict) -> dict:
+        future = self.pool.submit(
+            check_example,
+            example.get("code") or "",
+            example.get("imports") or [],
+            self.execute,
+            self.timeout,
+            self.memory_mb,
+        )
+        try:
+            return future.result(timeout=self.timeout + 30)
+        except FutureTimeout:
+            return {"status": "unverified", "errors": ["validation timed out"]}
+        except Exception as e:
+            return {"status": "unverified", "errors": [f"validation crashed: {e}"]}
+
+    def close(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
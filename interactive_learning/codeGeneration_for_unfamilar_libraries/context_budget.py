@@ -0,0 +1,229 @@
+# context_budget.py
+# Purpose: Assemble bounded documentation_content for LibraryAnalyzer by
+# ranking heading-sized chunks with BM25 and filling a token budget, either as
+# one context or as several context-sized shards for map-reduce analysis.
+
+import math
+import os
+import re
+import textwrap
+from collections import Counter
+
+from dedup import split_blocks
+
+DEFAULT_CONTEXT_TOKENS = int(os.getenv("DOCS_CONTEXT_TOKENS", "12000"))
+DEFAULT_MAX_SHARDS = int(os.getenv("DOCS_MAX_SHARDS", "4"))
+MAX_CHUNK_TOKENS = 800
+# Terms every analysis wants covered, on top of the library name.
+QUERY_TERMS = (
+    "api reference example usage install quickstart class function method "
+    "parameters returns"
+)
+PRIORITY_RE = re.compile(
+    r"\b(api|reference|examples?|usage|quick ?start|tutorial|getting started)\b", re.I
+)
+PRIORITY_BOOST = 1.5
+CODE_BOOST = 1.3
+_TOKEN_RE = re.compile(r"[a-z0-9_]+")
+_HEADING_RE = re.compile(r"^#{1,6} ")
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly four characters per token, which is close enough for budgeting."""
+    return len(text) // 4 + 1
+
+
+def _terms(text: str) -> list[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _split_block(block: str, max_tokens: int) -> list[str]:
+    """
+    Splits a block too big for one chunk (a long code fence, text without
+    blank lines) at line breaks, wrapping single overlong lines at spaces.
+    Pieces of a code fence are fenced again so each one still reads as code.
+    """
+    limit = max_tokens * 4 - 1  # the most characters estimate_tokens allows
+    if len(block) <= limit:
+        return [block]
+    lines = block.splitlines()
+    fence = ""
+    if lines[0].lstrip().startswith("```") and len(lines) > 1:
+        fence, lines = lines[0], lines[1:]
+        if lines[-1].strip().startswith("```"):
+            lines = lines[:-1]
+    # A piece is wrapped as f"{fence}\n{text}\n```" when fenced.
+    room = max(1, limit - (len(fence) + 5 if fence else 0))
+
+    pieces, current, size = [], [], 0
+    for line in lines:
+        segments = textwrap.wrap(
+            line, room, replace_whitespace=False, drop_whitespace=False
+        )
+        for segment in segments or [""]:
+            if current and size + 1 + len(segment) > room:
+                pieces.append("\n".join(current))
+                current, size = [], 0
+            size += len(segment) + (1 if current else 0)
+            current.append(segment)
+    if current:
+        pieces.append("\n".join(current))
+    return [f"{fence}\n{piece}\n```" if fence else piece for piece in pieces]
+
+
+def chunk_document(doc: dict, max_tokens: int = MAX_CHUNK_TOKENS) -> list[dict]:
+    """
+    Splits a document at headings, then packs oversized sections by block.
+    No chunk is larger than `max_tokens`; bigger blocks are split first.
+    """
+    sections, heading, current = [], "", []
+    for block in split_blocks(doc["content"]):
+        if _HEADING_RE.match(block) and current:
+            sections.append((heading, current))
+            current = []
+        if _HEADING_RE.match(block):
+            heading = block.splitlines()[0].lstrip("#").strip()
+        current.append(block)
+    if current:
+        sections.append((heading, current))
+
+    chunks = []
+    for heading, blocks in sections:
+        part = []
+        for block in blocks:
+            for piece in _split_block(block, max_tokens):
+                if part and estimate_tokens("\n\n".join(part + [piece])) > max_tokens:
+                    chunks.append((heading, "\n\n".join(part)))
+                    part = []
+                part.append(piece)
+        chunks.append((heading, "\n\n".join(part)))
+
+    return [
+        {
+            "url": doc["url"],
+            "heading": heading,
+            "text": text,
+            "tokens": estimate_tokens(text),
+            "position": i,
+        }
+        for i, (heading, text) in enumerate(chunks)
+    ]
+
+
+class BM25:
+    """Okapi BM25 over a fixed list of term lists."""
+
+    def __init__(self, corpus: list[list[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1, self.b = k1, b
+        self.tf = [Counter(terms) for terms in corpus]
+        self.lengths = [len(terms) for terms in corpus]
+        self.avg_length = sum(self.lengths) / len(corpus) if corpus else 0
+        df = Counter(term for tf in self.tf for term in tf)
+        n = len(corpus)
+        self.idf = {t: math.log(1 + (n - f + 0.5) / (f + 0.5)) for t, f in df.items()}
+
+    def score(self, query: list[str], index: int) -> float:
+        tf, length = self.tf[index], self.lengths[index]
+        norm = self.k1 * (1 - self.b + self.b * length / (self.avg_length or 1))
+        return sum(
+            self.idf[t] * tf[t] * (self.k1 + 1) / (tf[t] + norm)
+            for t in set(query)
+            if t in tf
+        )
+
+
+def _priority(chunk: dict) -> float:
+    boost = 1.0
+    if PRIORITY_RE.search(chunk["heading"]) or PRIORITY_RE.search(chunk["url"]):
+        boost *= PRIORITY_BOOST
+    if "```" in chunk["text"] or re.search(r"^(    |>>> )", chunk["text"], re.M):
+        boost *= CODE_BOOST
+    return boost
+
+
+def _pack(chunks: list[dict], selected: set, max_tokens: int) -> list[list[dict]]:
+    """Packs the selected chunks, in document order, into shards of `max_tokens`."""
+    shards, current, current_tokens = [], [], 0
+    for i, chunk in enumerate(chunks):
+        if i not in selected:
+            continue
+        if current and current_tokens + chunk["tokens"] > max_tokens:
+            shards.append(current)
+            current, current_tokens = [], 0
+        current.append(chunk)
+        current_tokens += chunk["tokens"]
+    if current:
+        shards.append(current)
+    return shards
+
+
+def _render(chunks: list[dict]) -> str:
+    by_url = {}
+    for chunk in chunks:
+        by_url.setdefault(chunk["url"], []).append(chunk["text"])
+    return "\n\n---\n\n".join(
+        f"SOURCE: {url}\n\n" + "\n\n".join(texts) for url, texts in by_url.items()
+    )
+
+
+def assemble_shards(
+    docs: list[dict],
+    library_name: str,
+    max_tokens: int = DEFAULT_CONTEXT_TOKENS,
+    max_shards: int = 1,
+):
+    """
+    Returns (shards, report). Chunks are ranked by BM25 against the library
+    name plus QUERY_TERMS, boosted for API-reference and example material, and
+    taken greedily until `max_tokens * max_shards` is spent. The selected
+    chunks keep their original order and are packed into at most `max_shards`
+    shards of at most `max_tokens` each, under their SOURCE headers.
+    """
+    chunk_tokens = min(MAX_CHUNK_TOKENS, max_tokens)
+    chunks = [chunk for doc in docs for chunk in chunk_document(doc, chunk_tokens)]
+    index = BM25([_terms(c["heading"] + " " + c["text"]) for c in chunks])
+    query = _terms(library_name) + _terms(QUERY_TERMS)
+    ranked = sorted(
+        range(len(chunks)),
+        key=lambda i: (index.score(query, i) + 1e-6) * _priority(chunks[i]),
+        reverse=True,
+    )
+
+    selected, used = set(), 0
+    for i in ranked:
+        tokens = chunks[i]["tokens"]
+        if tokens <= max_tokens and used + tokens <= max_tokens * max_shards:
+            selected.add(i)
+            used += tokens
+
+    # Packing in document order can strand a little space per shard; when
+    # that needs an extra shard, the lowest-ranked chunks are dropped.
+    packed = _pack(chunks, selected, max_tokens)
+    by_rank = [i for i in ranked if i in selected]
+    dropped = 0
+    while len(packed) > max_shards:
+        i = by_rank.pop()
+        selected.discard(i)
+        used -= chunks[i]["tokens"]
+        dropped += 1
+        packed = _pack(chunks, selected, max_tokens)
+    shards = [_render(shard) for shard in packed]
+
+    report = {
+        "chunks_in": len(chunks),
+        "chunks_used": len(selected),
+        "chunks_dropped": dropped,
+        "tokens_in": sum(c["tokens"] for c in chunks),
+        "tokens_used": used,
+        "budget": max_tokens * max_shards,
+        "shards": len(shards),
+    }
+    return shards, report
+
+
+def assemble_context(
+    docs: list[dict], library_name: str, max_tokens: int = DEFAULT_CONTEXT_TOKENS
+):
+    """Returns (documentation_content, report) for a single analysis call."""
+    shards, report = assemble_shards(docs, library_name, max_tokens)
+    return (shards[0] if shards else ""), report
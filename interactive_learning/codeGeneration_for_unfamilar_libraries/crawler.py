@@ -0,0 +1,172 @@
+# crawler.py
+# Purpose: Bounded, concurrent documentation crawler feeding learn_from_urls.
+# Starts from a docs root, uses sitemap.xml when the site has one and otherwise
+# follows same-site links breadth-first, within depth/page/byte limits.
+
+import asyncio
+import hashlib
+import re
+import xml.etree.ElementTree as ET
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Links that never lead to documentation pages.
+SKIP_EXTENSIONS = (
+    ".png",
+    ".jpg",
+    ".jpeg",
+    ".gif",
+    ".svg",
+    ".ico",
+    ".webp",
+    ".css",
+    ".js",
+    ".json",
+    ".xml",
+    ".pdf",
+    ".zip",
+    ".gz",
+    ".tgz",
+    ".whl",
+    ".mp4",
+    ".woff2",
+)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalizes a URL for deduplication: lowercase scheme and host, no default
+    port, no fragment, sorted query, and no trailing slash or index.html.
+    """
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    netloc = (parts.hostname or "").lower()
+    if parts.port and parts.port != {"http": 80, "https": 443}.get(scheme):
+        netloc += f":{parts.port}"
+    path = re.sub(r"/index\.html?$", "/", parts.path)
+    path = path.rstrip("/") or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, netloc, path, query, ""))
+
+
+def _scope(root_url: str):
+    """The (host, path prefix) a crawl from `root_url` is allowed to visit."""
+    parts = urlsplit(canonicalize_url(root_url))
+    path = parts.path
+    if "." in path.rsplit("/", 1)[-1]:
+        path = path.rsplit("/", 1)[0]  # a page, not a directory: crawl its siblings
+    return parts.netloc, path.rstrip("/") + "/"
+
+
+def in_scope(url: str, scope) -> bool:
+    netloc, prefix = scope
+    parts = urlsplit(canonicalize_url(url))
+    if parts.scheme not in ("http", "https") or parts.netloc != netloc:
+        return False
+    if parts.path.lower().endswith(SKIP_EXTENSIONS):
+        return False
+    return (parts.path.rstrip("/") + "/").startswith(prefix)
+
+
+def parse_sitemap(xml_text: str):
+    """Returns (page URLs, nested sitemap URLs) from a sitemap or sitemap index."""
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        return [], []
+    locs = [el.text.strip() for el in root.iter() if el.tag.endswith("loc") and el.text]
+    if root.tag.endswith("sitemapindex"):
+        return [], locs
+    return locs, []
+
+
+async def _sitemap_urls(fetcher, client, limiter, root_url, scope, limit):
+    """
+    Collects in-scope page URLs from the site's sitemap.xml (one index level).
+    Sitemaps are fetched like pages, so the cache, offline mode and per-host
+    politeness apply to them too.
+    """
+    parts = urlsplit(root_url)
+    queue = [f"{parts.scheme}://{parts.netloc}/sitemap.xml"]
+    pages = []
+    for _ in range(2):
+        nested = []
+        sitemaps = await asyncio.gather(
+            *(
+                fetcher.afetch_website_url(client, url, limiter, convert=False)
+                for url in queue
+            )
+        )
+        for sitemap in sitemaps:
+            if not sitemap["success"]:
+                continue
+            found, children = parse_sitemap(sitemap["content"])
+            pages += [u for u in found if in_scope(u, scope)]
+            nested += children
+        if len(pages) >= limit or not nested:
+            break
+        queue = nested
+    return pages[:limit]
+
+
+async def acrawl_site(
+    fetcher, client, limiter, root_url, max_depth=2, max_pages=50, max_bytes=5_000_000
+):
+    """
+    Crawls one docs site and returns successful documents in crawl order.
+    Pages are fetched a BFS level at a time, concurrently, through
+    `fetcher.afetch_website_url` (so caching and per-host politeness apply).
+    Variants of the same URL are fetched once, and pages whose content hashes
+    to an already-seen page (redirect targets, mirrors) are dropped.
+    """
+    scope = _scope(root_url)
+    print(f"🕸️  Crawling {root_url} (depth ≤ {max_depth}, pages ≤ {max_pages})")
+
+    seen_urls = {canonicalize_url(root_url)}
+    seen_hashes = set()
+    documents = []
+    total_bytes = 0
+    budget_spent = False
+
+    frontier = [root_url]
+    sitemap = await _sitemap_urls(fetcher, client, limiter, root_url, scope, max_pages)
+    if sitemap:
+        print(f"🗺️  Using sitemap.xml: {len(sitemap)} in-scope pages")
+        for url in sitemap:
+            key = canonicalize_url(url)
+            if key not in seen_urls:
+                seen_urls.add(key)
+                frontier.append(url)
+        max_depth = 0  # the sitemap already enumerates the site
+
+    for _ in range(max_depth + 1):
+        frontier = frontier[: max_pages - len(documents)]
+        if not frontier or budget_spent:
+            break
+        results = await asyncio.gather(
+            *(fetcher.afetch_website_url(client, url, limiter) for url in frontier)
+        )
+        next_frontier = []
+        for doc in results:
+            if not doc["success"] or len(documents) >= max_pages:
+                continue
+            digest = hashlib.sha256(doc["content"].encode("utf-8")).hexdigest()
+            if digest in seen_hashes:
+                continue
+            size = doc.get("bytes", len(doc["content"].encode("utf-8")))
+            if total_bytes + size > max_bytes and documents:
+                budget_spent = True  # keep what fits, stop after this level
+                continue
+            seen_hashes.add(digest)
+            documents.append(doc)
+            total_bytes += size
+            for link in doc.get("links", []):
+                key = canonicalize_url(link)
+                if key not in seen_urls and in_scope(link, scope):
+                    seen_urls.add(key)
+                    next_frontier.append(link)
+        frontier = next_frontier
+
+    print(
+        f"🕸️  Crawled {len(documents)} pages ({total_bytes // 1024} KiB) from {root_url}"
+    )
+    return documents
@@ -0,0 +1,113 @@
+# dedup.py
+# Purpose: Remove cross-page boilerplate and near-duplicate pages before the
+# fetched documentation is combined for LibraryAnalyzer.
+
+import hashlib
+import math
+import random
+import re
+
+SHINGLE_WORDS = 5
+NUM_PERMUTATIONS = 64
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(1729)  # fixed seed: signatures must be stable across runs
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+
+def split_blocks(text: str) -> list[str]:
+    """Splits markdown on blank lines, keeping fenced code blocks whole."""
+    blocks, current, in_fence = [], [], False
+    for line in text.splitlines():
+        if line.lstrip().startswith("```"):
+            in_fence = not in_fence
+        if not line.strip() and not in_fence:
+            if current:
+                blocks.append("\n".join(current))
+                current = []
+            continue
+        current.append(line)
+    if current:
+        blocks.append("\n".join(current))
+    return blocks
+
+
+def _normalize(block: str) -> str:
+    return " ".join(block.lower().split())
+
+
+def _hash64(value: str) -> int:
+    digest = hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def minhash_signature(text: str) -> list[int]:
+    """MinHash over word shingles; equal slots estimate Jaccard similarity."""
+    words = re.findall(r"\w+", text.lower())
+    shingles = {
+        _hash64(" ".join(words[i : i + SHINGLE_WORDS]))
+        for i in range(max(1, len(words) - SHINGLE_WORDS + 1))
+    }
+    return [
+        min((a * s + b) % _MERSENNE_PRIME for s in shingles) for a, b in _PERMUTATIONS
+    ]
+
+
+def estimated_similarity(sig_a: list[int], sig_b: list[int]) -> float:
+    return sum(x == y for x, y in zip(sig_a, sig_b, strict=True)) / len(sig_a)
+
+
+def dedupe_documents(docs: list[dict], near_duplicate=0.9, boilerplate_ratio=0.3):
+    """
+    Returns (docs, report) with near-duplicate pages dropped and boilerplate
+    removed. A page is a near duplicate when its estimated Jaccard similarity
+    to an earlier kept page is at least `near_duplicate`. A block is
+    boilerplate when it appears in at least max(2, boilerplate_ratio * pages)
+    pages; its first occurrence is kept so no content disappears entirely.
+    """
+    bytes_before = sum(len(doc["content"].encode("utf-8")) for doc in docs)
+
+    kept, signatures, dropped_pages = [], [], []
+    for doc in docs:
+        signature = minhash_signature(doc["content"])
+        similarities = (estimated_similarity(signature, s) for s in signatures)
+        if any(similarity >= near_duplicate for similarity in similarities):
+            dropped_pages.append(doc["url"])
+            continue
+        kept.append(doc)
+        signatures.append(signature)
+
+    page_blocks = [split_blocks(doc["content"]) for doc in kept]
+    pages_with_block = {}
+    for blocks in page_blocks:
+        for key in {_normalize(b) for b in blocks}:
+            pages_with_block[key] = pages_with_block.get(key, 0) + 1
+    threshold = max(2, math.ceil(boilerplate_ratio * len(kept)))
+    boilerplate = {key for key, count in pages_with_block.items() if count >= threshold}
+
+    seen, removed_blocks, result = set(), 0, []
+    for doc, blocks in zip(kept, page_blocks, strict=True):
+        out = []
+        for block in blocks:
+            key = _normalize(block)
+            if key in boilerplate:
+                if key in seen:
+                    removed_blocks += 1
+                    continue
+                seen.add(key)
+            out.append(block)
+        result.append({**doc, "content": "\n\n".join(out) + "\n"})
+
+    bytes_after = sum(len(doc["content"].encode("utf-8")) for doc in result)
+    report = {
+        "pages_in": len(docs),
+        "pages_out": len(result),
+        "near_duplicate_pages": dropped_pages,
+        "boilerplate_blocks_removed": removed_blocks,
+        "bytes_before": bytes_before,
+        "bytes_after": bytes_after,
+        "bytes_saved": bytes_before - bytes_after,
+    }
+    return result, report
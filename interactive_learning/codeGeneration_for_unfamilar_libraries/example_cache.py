@@ -0,0 +1,228 @@
+# example_cache.py
+# Purpose: Persist generated examples so that a use case asked for again, or
+# one worded almost the same way, is answered without calling the LM.
+# Entries are keyed by a fingerprint of the library_info they were generated
+# from, the normalized use case and the normalized requirements; use cases
+# are matched by cosine similarity of character n-gram TF-IDF vectors, and
+# must also share most of their words.
+
+import hashlib
+import json
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+DEFAULT_EXAMPLE_CACHE_PATH = os.getenv(
+    "EXAMPLE_CACHE_PATH",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "dspy_workspace", "examples.sqlite"
+    ),
+)
+# Cosine similarity a cached use case needs to be served for a new one.
+DEFAULT_SIMILARITY = float(os.getenv("EXAMPLE_CACHE_SIMILARITY", "0.8"))
+# Share of distinct words the two use cases must have in common. Character
+# n-grams alone rate "async http client" and "sync http client" as near
+# duplicates; a cache miss only costs one generation, a wrong hit a wrong
+# example.
+DEFAULT_WORD_OVERLAP = float(os.getenv("EXAMPLE_CACHE_WORD_OVERLAP", "0.75"))
+NGRAM = 3
+
+# Words that change the wording of a use case but not what is asked for.
+_FILLER = {
+    "a",
+    "an",
+    "and",
+    "the",
+    "example",
+    "examples",
+    "demo",
+    "simple",
+    "please",
+    "show",
+    "me",
+    "how",
+    "to",
+}
+
+
+def normalize_use_case(text: str) -> str:
+    words = re.findall(r"[a-z0-9]+", text.lower())
+    return " ".join(word for word in words if word not in _FILLER) or " ".join(words)
+
+
+def _normalize_requirements(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def library_fingerprint(library_info: dict) -> str:
+    """Hash of the analysis an example is generated from."""
+    encoded = json.dumps(library_info, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def char_ngrams(text: str) -> Counter:
+    padded = f" {text} "
+    count = max(1, len(padded) - NGRAM + 1)
+    return Counter(padded[i : i + NGRAM] for i in range(count))
+
+
+def word_overlap(a: str, b: str) -> float:
+    """Jaccard overlap of the distinct words of two normalized use cases."""
+    words_a, words_b = set(a.split()), set(b.split())
+    return len(words_a & words_b) / (len(words_a | words_b) or 1)
+
+
+def tfidf_similarities(query: str, documents: list[str]) -> list[float]:
+    """
+    Cosine similarity of `query` to each document, with smoothed IDF over all
+    of them.
+    """
+    grams = [char_ngrams(doc) for doc in documents]
+    query_grams = char_ngrams(query)
+    df = Counter()
+    for counts in grams + [query_grams]:
+        df.update(counts.keys())
+    total = len(grams) + 1
+
+    def vector(counts):
+        weights = {
+            g: tf * (math.log((1 + total) / (1 + df[g])) + 1)
+            for g, tf in counts.items()
+        }
+        norm = math.sqrt(sum(w * w for w in weights.values())) or 1.0
+        return {g: w / norm for g, w in weights.items()}
+
+    q = vector(query_grams)
+    return [
+        sum(q.get(g, 0.0) * w for g, w in vector(counts).items()) for counts in grams
+    ]
+
+
+class ExampleCache:
+    """
+    SQLite-backed cache of generated examples. Like KnowledgeStore it is
+    shared by worker threads, so every access holds a lock; the use cases of
+    each library are kept in memory after the first lookup.
+    """
+
+    def __init__(
+        self,
+        path=DEFAULT_EXAMPLE_CACHE_PATH,
+        similarity=DEFAULT_SIMILARITY,
+        word_overlap=DEFAULT_WORD_OVERLAP,
+    ):
+        self.path = path
+        self.similarity = similarity
+        self.word_overlap = word_overlap
+        self._db = None
+        self._lock = threading.Lock()
+        self._entries = {}  # fingerprint -> {(use_case, requirements): example}
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS examples (
+                    fingerprint TEXT NOT NULL,
+                    use_case TEXT NOT NULL,
+                    requirements TEXT NOT NULL,
+                    example TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    PRIMARY KEY (fingerprint, use_case, requirements)
+                )"""
+            )
+        return self._db
+
+    def _library(self, fingerprint):
+        if fingerprint not in self._entries:
+            rows = self.db.execute(
+                "SELECT use_case, requirements, example FROM examples"
+                " WHERE fingerprint = ?",
+                (fingerprint,),
+            )
+            self._entries[fingerprint] = {
+                (use_case, requirements): example
+                for use_case, requirements, example in rows
+            }
+        return self._entries[fingerprint]
+
+    def _match(self, entries, use_case, requirements):
+        """
+        Key of the most similar cached use case with the same requirements, if
+        close enough.
+        """
+        if (use_case, requirements) in entries:
+            return (use_case, requirements)
+        candidates = [
+            key
+            for key in entries
+            if key[1] == requirements
+            and word_overlap(use_case, key[0]) >= self.word_overlap
+        ]
+        if not candidates:
+            return None
+        scores = tfidf_similarities(use_case, [cached for cached, _ in candidates])
+        score, key = max(zip(scores, candidates, strict=True))
+        return key if score >= self.similarity else None
+
+    def get(self, library_info: dict, use_case: str, requirements: str = ""):
+        """
+        Returns a copy of the cached example for this or a near-identical use
+        case, or None.
+        """
+        with self._lock:
+            entries = self._library(library_fingerprint(library_info))
+            key = self._match(
+                entries,
+                normalize_use_case(use_case),
+                _normalize_requirements(requirements),
+            )
+            return json.loads(entries[key]) if key else None
+
+    def put(self, library_info: dict, use_case: str, requirements: str, example: dict):
+        fingerprint = library_fingerprint(library_info)
+        key = (normalize_use_case(use_case), _normalize_requirements(requirements))
+        encoded = json.dumps(example, default=str)
+        with self._lock:
+            self._library(fingerprint)[key] = encoded
+            with self.db:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO examples VALUES (?, ?, ?, ?, ?)",
+                    (fingerprint, *key, encoded, time.time()),
+                )
+
+    def discard(self, library_info: dict, use_case: str, requirements: str = ""):
+        """
+        Drops the entry `get` would serve for this use case, e.g. after it
+        failed validation.
+        """
+        fingerprint = library_fingerprint(library_info)
+        with self._lock:
+            entries = self._library(fingerprint)
+            key = self._match(
+                entries,
+                normalize_use_case(use_case),
+                _normalize_requirements(requirements),
+            )
+            if key is None:
+                return
+            del entries[key]
+            with self.db:
+                self.db.execute(
+                    "DELETE FROM examples"
+                    " WHERE fingerprint = ? AND use_case = ? AND requirements = ?",
+                    (fingerprint, *key),
+                )
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+            self._entries.clear()
@@ -0,0 +1,116 @@
+# fetch_resilience.py
+# Purpose: Keeps one slow or failing docs host from stalling a whole
+# learn_from_urls call: jittered exponential backoff, a per-host circuit
+# breaker, and hedged requests once a fetch runs past the observed p95.
+
+import asyncio
+import random
+import time
+from collections import deque
+
+
+def backoff_delay(attempt: int, base: float = 1.0, cap: float = 10.0) -> float:
+    """Full-jitter exponential backoff: uniform in [0, min(cap, base * 2**attempt)]."""
+    return random.uniform(0, min(cap, base * 2**attempt))
+
+
+class CircuitBreaker:
+    """
+    Per-host failure counter. After `threshold` consecutive failures a host
+    is "open" and fetches to it fail fast; after `reset_after` seconds one
+    probe request is let through, and its result closes or re-opens it.
+    """
+
+    def __init__(self, threshold=3, reset_after=30.0):
+        self.threshold = threshold
+        self.reset_after = reset_after
+        self._failures = {}  # host -> consecutive failures
+        self._opened_at = {}  # host -> monotonic time the circuit opened
+
+    def allow(self, host: str) -> bool:
+        opened_at = self._opened_at.get(host)
+        if opened_at is None:
+            return True
+        if time.monotonic() - opened_at >= self.reset_after:
+            # Half-open: let this request probe, and fail fast for the rest
+            # until it reports back.
+            self._opened_at[host] = time.monotonic()
+            return True
+        return False
+
+    def is_open(self, host: str) -> bool:
+        return host in self._opened_at
+
+    def record_success(self, host: str) -> None:
+        self._failures.pop(host, None)
+        self._opened_at.pop(host, None)
+
+    def record_failure(self, host: str) -> None:
+        failures = self._failures.get(host, 0) + 1
+        self._failures[host] = failures
+        if failures >= self.threshold:
+            self._opened_at[host] = time.monotonic()
+
+
+class LatencyTracker:
+    """Sliding window of fetch latencies (seconds) with percentile lookups."""
+
+    def __init__(self, window=200, min_samples=8):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def percentile(self, q: float):
+        """The q-th percentile (0-100), or None before `min_samples` samples."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q / 100 * len(ordered)))]
+
+    def summary(self) -> str:
+        if len(self._samples) < self.min_samples:
+            return f"{len(self._samples)} fetches"
+        return (
+            f"{len(self._samples)} fetches: p50 {self.percentile(50) * 1000:.0f} ms, "
+            f"p95 {self.percentile(95) * 1000:.0f} ms, "
+            f"max {max(self._samples) * 1000:.0f} ms"
+        )
+
+
+def retry_after(response, cap: float = 10.0):
+    """Seconds from a numeric Retry-After header (capped), or None."""
+    value = response.headers.get("Retry-After", "")
+    return min(cap, float(value)) if value.isdigit() else None
+
+
+async def hedged(request, hedge_after=None):
+    """
+    Awaits `request()`; if it is still running after `hedge_after` seconds,
+    starts a second identical request and returns whichever succeeds first.
+    Returns `(result, hedged)`. The losing request is cancelled.
+    """
+    first = asyncio.ensure_future(request())
+    tasks = {first}
+    try:
+        if hedge_after is None:
+            return await first, False
+        done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+        if done:
+            return first.result(), False
+        tasks.add(asyncio.ensure_future(request()))
+        error = None
+        while tasks:
+            done, tasks = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result(), True
+                error = task.exception()
+        raise error
+    finally:
+        for task in tasks:
+            task.cancel()
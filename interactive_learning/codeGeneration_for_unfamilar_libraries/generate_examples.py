@@ -1,14 +1,13 @@
 # generate_examples.py
 # Purpose: Generate code examples for any learned library
 
-from learn_library import fastapi_info, streamlit_info, agent
+from learn_library import EXAMPLE_LIBRARIES
+from main import get_agent
 
 
-def generate_examples_for_library(library_info: dict, library_name: str):
-    """Generate code examples for any library based on its documentation."""
-
-    # Define generic use cases that can apply to most libraries
-    use_cases = [
+def default_use_cases(library_name: str) -> list[dict]:
+    """Generic use cases that can apply to most libraries."""
+    return [
         {
             "name": "Basic Setup and Hello World",
             "description": f"Create a minimal working example with {library_name}",
@@ -26,19 +25,33 @@ def generate_examples_for_library(library_info: dict, library_name: str):
         },
     ]
 
-    generated_examples = []
+
+def generate_examples_for_library(library_info: dict, library_name: str):
+    """Generate code examples for any library based on its documentation."""
+
+    use_cases = default_use_cases(library_name)
 
     print(f"\n🔧 Generating examples for {library_name}...")
 
-    for use_case in use_cases:
+    results = get_agent().generate_examples(
+        library_info,
+        [(use_case["description"], use_case["requirements"]) for use_case in use_cases],
+    )
+    return print_examples(use_cases, results)
+
+
+def print_examples(use_cases: list[dict], results: list[dict]) -> list[dict]:
+    """Prints generated examples next to their use cases; returns the successful ones."""
+    generated_examples = []
+
+    for use_case, example in zip(use_cases, results):
         print(f"\n📝 {use_case['name']}")
         print(f"Description: {use_case['description']}")
 
-        example = agent.generate_example(
-            library_info=library_info,
-            use_case=use_case["description"],
-            requirements=use_case["requirements"],
-        )
+        if "error" in example:
+            print(f"❌ Generation failed: {example['error']}")
+            print("-" * 80)
+            continue
 
         print("\n💻 Generated Code:")
         print("```python")
@@ -71,9 +84,25 @@ def generate_examples_for_library(library_info: dict, library_name: str):
     return generated_examples
 
 
-# Generate examples for both libraries
-print("🎯 Generating FastAPI Examples:")
-fastapi_examples = generate_examples_for_library(fastapi_info, "FastAPI")
-
-print("\n\n🎯 Generating Streamlit Examples:")
-streamlit_examples = generate_examples_for_library(streamlit_info, "Streamlit")
+if __name__ == "__main__":
+    # Learn both libraries and generate their examples concurrently
+    results = get_agent().learn_libraries(
+        [
+            {
+                "library": name,
+                "urls": urls,
+                "use_cases": [
+                    (use_case["description"], use_case["requirements"])
+                    for use_case in default_use_cases(name)
+                ],
+            }
+            for name, urls in EXAMPLE_LIBRARIES.items()
+        ]
+    )
+
+    for result in results:
+        print(f"\n\n🎯 {result['library']} Examples:")
+        if "error" in result:
+            print(f"❌ Could not learn {result['library']}: {result['error']}")
+            continue
+        print_examples(default_use_cases(result["library"]), result["examples"])
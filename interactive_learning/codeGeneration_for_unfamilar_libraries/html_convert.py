@@ -0,0 +1,396 @@
+# html_convert.py
+# Purpose: Convert fetched HTML pages to markdown in a single parse.
+# Kept free of DSPy/LM imports so process-pool workers start cheaply.
+
+import re
+import time
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+import html2text
+from html2text.utils import pad_tables_in_text
+
+# Page chrome that is dropped together with everything inside it.
+STRIP_TAGS = frozenset({"script", "style", "nav", "footer", "header"})
+
+VOID_TAGS = frozenset(
+    {
+        "area",
+        "base",
+        "br",
+        "col",
+        "embed",
+        "hr",
+        "img",
+        "input",
+        "link",
+        "meta",
+        "param",
+        "source",
+        "track",
+        "wbr",
+    }
+)
+# Blocks whose text is scored, and the containers that collect their scores.
+PARAGRAPH_TAGS = frozenset({"p", "pre", "td", "blockquote"})
+TAG_WEIGHTS = {
+    "article": 25,
+    "main": 25,
+    "div": 5,
+    "section": 5,
+    "pre": 3,
+    "td": 3,
+    "blockquote": 3,
+    "ul": -3,
+    "ol": -3,
+    "dl": -3,
+    "li": -3,
+    "form": -3,
+    "aside": -10,
+}
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+# Parts of a list, definition list or table: the whole structure is kept, so a
+# kept <dd> never loses the <dt> signature it documents.
+PART_TAGS = frozenset({"dd", "dt", "li", "tr", "td", "th", "thead", "tbody"})
+# Repeated units of a page (one per function, class or section): keeping one
+# keeps its siblings.
+UNIT_TAGS = frozenset({"dl", "section", "article", "table"})
+POSITIVE_RE = re.compile(
+    r"(?:^|[-_ ])(article|body|content|document|docs?|entry|main|markdown|page|post"
+    r"|text)(?:[-_ ]|$)"
+)
+NEGATIVE_RE = re.compile(
+    r"(?:^|[-_ ])(ads?|banner|breadcrumbs?|comments?|consent|cookies?|edit|feedback"
+    r"|footer|header|menu|modal|nav|navbar|popup|related|search|share|sidebar"
+    r"|social|toc)(?:[-_ ]|$)"
+)
+# Below this many characters of text a scored or declared main block is not
+# trusted; the whole page is kept, minus its chrome.
+MIN_MAIN_TEXT = 250
+
+
+class _Block:
+    __slots__ = (
+        "tag",
+        "label",
+        "role",
+        "parent",
+        "children",
+        "start",
+        "end",
+        "text",
+        "link_text",
+        "code_text",
+        "commas",
+        "score",
+        "candidate",
+    )
+
+    def __init__(self, tag, attrs, parent, start):
+        attrs = dict(attrs)
+        self.tag = tag
+        names = ("id", "class", "role", "title", "aria-label")
+        self.label = " ".join(filter(None, (attrs.get(n) for n in names))).lower()
+        self.role = (attrs.get("role") or "").lower()
+        self.parent = parent
+        self.children = []
+        self.start = start
+        self.end = None
+        self.text = self.link_text = self.code_text = self.commas = 0
+        self.score = 0.0
+        self.candidate = False
+
+    @property
+    def link_density(self) -> float:
+        return self.link_text / self.text if self.text else 0.0
+
+    def weight(self) -> float:
+        weight = TAG_WEIGHTS.get(self.tag, 0)
+        if self.role == "main":
+            weight += 25
+        if POSITIVE_RE.search(self.label):
+            weight += 25
+        if NEGATIVE_RE.search(self.label):
+            weight -= 25
+        return weight
+
+    def final_score(self) -> float:
+        return (self.score + self.weight()) * (1 - self.link_density)
+
+
+class _PageRecorder(HTMLParser):
+    """
+    Tokenizes the page once, recording the parser events for replay into
+    html2text and, alongside, a block tree with text/link/code lengths that
+    readability-style scoring runs on.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)  # html2text decodes refs itself
+        self.events = []
+        self.root = _Block("#root", (), None, 0)
+        self._stack = [self.root]
+        self._strip_depth = 0
+        self._link_depth = 0
+        self._code_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        self.events.append(("starttag", (tag, attrs)))
+        if tag in STRIP_TAGS:
+            self._strip_depth += 1
+        elif tag == "a":
+            self._link_depth += 1
+        elif tag in ("pre", "code"):
+            self._code_depth += 1
+        if tag in VOID_TAGS:
+            return
+        if tag in ("p", "li") and self._stack[-1].tag == tag:
+            self._close_block(len(self.events) - 2)  # implicitly closed
+        block = _Block(tag, attrs, self._stack[-1], len(self.events) - 1)
+        self._stack[-1].children.append(block)
+        self._stack.append(block)
+
+    def handle_startendtag(self, tag, attrs):
+        self.events.append(("startendtag", (tag, attrs)))
+
+    def handle_endtag(self, tag):
+        self.events.append(("endtag", (tag,)))
+        if tag in STRIP_TAGS:
+            self._strip_depth = max(0, self._strip_depth - 1)
+        elif tag == "a":
+            self._link_depth = max(0, self._link_depth - 1)
+        elif tag in ("pre", "code"):
+            self._code_depth = max(0, self._code_depth - 1)
+        if any(block.tag == tag for block in self._stack[1:]):
+            while self._stack[-1].tag != tag:
+                self._close_block(len(self.events) - 1)
+            self._close_block(len(self.events) - 1)
+
+    def _count(self, length, commas=0):
+        if self._strip_depth:
+            return
+        block = self._stack[-1]
+        block.text += length
+        block.commas += commas
+        if self._link_depth:
+            block.link_text += length
+        if self._code_depth:
+            block.code_text += length
+
+    def handle_data(self, data):
+        self.events.append(("data", (data,)))
+        self._count(len(data.strip()), data.count(","))
+
+    def handle_charref(self, name):
+        self.events.append(("charref", (name,)))
+        self._count(1)
+
+    def handle_entityref(self, name):
+        self.events.append(("entityref", (name,)))
+        self._count(1)
+
+    def _close_block(self, end):
+        block = self._stack.pop()
+        block.end = end
+        parent = block.parent
+        parent.text += block.text
+        parent.link_text += block.link_text
+        parent.code_text += block.code_text
+        parent.commas += block.commas
+        if block.tag in PARAGRAPH_TAGS and block.text >= 25:
+            # Paragraph-like text scores its parent fully and grandparent half.
+            score = 1 + block.commas + min(3, block.text // 100)
+            parent.score += score
+            parent.candidate = True
+            if parent.parent is not None:
+                parent.parent.score += score / 2
+                parent.parent.candidate = True
+
+    def finish(self):
+        self.close()
+        while len(self._stack) > 1:
+            self._close_block(len(self.events) - 1)
+        self.root.end = len(self.events) - 1
+
+
+def _walk(block):
+    yield block
+    for child in block.children:
+        yield from _walk(child)
+
+
+def _ancestors(block):
+    path = []
+    while block is not None:
+        path.append(block)
+        block = block.parent
+    return path[::-1]
+
+
+def _common_ancestor(blocks):
+    paths = [_ancestors(block) for block in blocks]
+    common = paths[0][0]
+    for level in zip(*paths, strict=False):
+        if any(b is not level[0] for b in level):
+            break
+        common = level[0]
+    return common
+
+
+def _declared_main(page: _Block):
+    """The page's own <main> / role="main" container, else its <article>(s)."""
+    blocks = list(_walk(page))
+    mains = [b for b in blocks if b.tag == "main" or b.role == "main"]
+    if mains:
+        return max(mains, key=lambda b: b.text)
+    articles = [b for b in blocks if b.tag == "article"]
+    return _common_ancestor(articles) if articles else None
+
+
+def _widen(block, page: _Block):
+    """
+    Climbs from a scored block to the unit it belongs to: out of list items
+    and definitions, and up to a parent holding its heading or sibling units.
+    """
+    while block.parent is not None and block.parent is not page:
+        parent = block.parent
+        if NEGATIVE_RE.search(parent.label):
+            break
+        siblings = [s for s in parent.children if s is not block]
+        if block.tag in PART_TAGS or any(
+            s.tag in HEADING_TAGS or (block.tag in UNIT_TAGS and s.tag == block.tag)
+            for s in siblings
+        ):
+            block = parent
+        else:
+            break
+    return block
+
+
+def main_content_mask(recorder: _PageRecorder):
+    """
+    Keeps the page's declared main container (<main>, role="main" or its
+    <article>s) or, without one, the common ancestor of the best-scoring
+    blocks, widened to the unit they belong to; a page with no convincing
+    main block is kept whole. Link-heavy or chrome-labelled sub-blocks that
+    carry no code are dropped either way; headings and <dl> signatures are
+    never dropped. Returns (keep mask over recorder.events, kept / total text).
+    """
+    page = recorder.root
+    total = page.text
+    root = _declared_main(page)
+    if root is None or root.text < MIN_MAIN_TEXT:
+        blocks = [b for b in _walk(page) if b.candidate and b is not page]
+        best = max(blocks, key=_Block.final_score, default=None)
+        if best is None or best.text < MIN_MAIN_TEXT:
+            root = page
+        else:
+            threshold = max(10, best.final_score() * 0.2)
+            strong = [b for b in blocks if b is best or b.final_score() >= threshold]
+            root = _widen(_common_ancestor(strong), page)
+
+    keep = bytearray(len(recorder.events))
+    keep[root.start : root.end + 1] = b"\x01" * (root.end + 1 - root.start)
+    kept = root.text
+    for block in _walk(root):
+        if block is root or block.code_text or block.tag == "pre":
+            continue
+        if block.tag in ("dt", "dd") or block.tag in HEADING_TAGS:
+            continue
+        chrome = NEGATIVE_RE.search(block.label) or (
+            block.tag in ("div", "ul", "ol", "section", "aside", "table")
+            and block.link_density > 0.5
+        )
+        if chrome and block.end is not None and keep[block.start]:
+            keep[block.start : block.end + 1] = bytes(block.end + 1 - block.start)
+            kept -= block.text
+    return keep, (kept / total if total else 1.0)
+
+
+class _StrippingHTML2Text(html2text.HTML2Text):
+    """
+    HTML2Text that skips STRIP_TAGS subtrees and captures <title> and link
+    targets while it converts. It is driven by replaying a _PageRecorder's
+    events, so the page is tokenized exactly once even though main-content
+    scoring needs the whole page before conversion can start.
+    Links are collected from stripped chrome too: sidebars map the docs site.
+    """
+
+    def __init__(self, base_url=""):
+        super().__init__()
+        self.base_url = base_url
+        self.ignore_links = False
+        self.ignore_images = True
+        self._skip_depth = 0
+        self._in_title = False
+        self.page_title = ""
+        self.links = {}  # absolute URL -> None, in document order
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href and not href.startswith(("#", "mailto:", "javascript:")):
+                self.links[urljoin(self.base_url, href).split("#", 1)[0]] = None
+        if tag in STRIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = not self.page_title  # first <title> wins
+        elif not self._skip_depth:
+            super().handle_starttag(tag, attrs)
+
+    def handle_endtag(self, tag):
+        if tag in STRIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag == "title":
+            self._in_title = False
+        elif not self._skip_depth:
+            super().handle_endtag(tag)
+
+    def handle_data(self, data, entity_char=False):
+        if self._in_title:
+            self.page_title += data
+        elif not self._skip_depth:
+            super().handle_data(data, entity_char)
+
+    def replay(self, events, keep=None) -> str:
+        """Converts recorded events; those outside `keep` only feed title/links."""
+        self.start = True
+        for i, (kind, args) in enumerate(events):
+            handler = getattr(self, "handle_" + kind)
+            if keep is None or keep[i]:
+                handler(*args)
+            else:
+                self._skip_depth += 1
+                handler(*args)
+                self._skip_depth -= 1
+        markdown = self.optwrap(self.finish())
+        return pad_tables_in_text(markdown) if self.pad_tables else markdown
+
+
+def html_to_document(
+    url: str, html: str, base_url: str = None, main_content: bool = True
+) -> dict:
+    """
+    Converts one HTML page to the fetcher's document dict. Runs in a worker
+    process, so it only takes and returns picklable values. `convert_ms` is
+    the CPU time spent converting this page; `base_url` (the URL after
+    redirects) resolves relative links. With `main_content`, only the main
+    article is kept and `content_ratio` is the share of page text it holds.
+    """
+    start = time.perf_counter()
+    recorder = _PageRecorder()
+    recorder.feed(html)
+    recorder.finish()
+    keep, ratio = main_content_mask(recorder) if main_content else (None, 1.0)
+    converter = _StrippingHTML2Text(base_url or url)
+    markdown_content = converter.replay(recorder.events, keep)
+    title = " ".join(converter.page_title.split())
+    return {
+        "url": url,
+        "title": title or "No title",
+        "content": markdown_content,
+        "success": True,
+        "links": list(converter.links),
+        "content_ratio": round(ratio, 3),
+        "convert_ms": round((time.perf_counter() - start) * 1000, 2),
+    }
@@ -0,0 +1,186 @@
+# http_cache.py
+# Purpose: Persistent on-disk HTTP cache for DocumentationFetcher.
+# Stores the raw response bytes and the converted document side by side so a
+# cache hit skips both the download and the HTML-to-markdown conversion.
+
+import json
+import os
+import re
+import sqlite3
+import time
+from email.utils import parsedate_to_datetime
+
+DEFAULT_CACHE_PATH = os.getenv(
+    "DOCS_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "dspy_workspace", "docs.sqlite"),
+)
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# RFC 9111 heuristic freshness: 10% of the time since Last-Modified, capped.
+HEURISTIC_FRACTION = 0.1
+HEURISTIC_MAX_AGE = 24 * 60 * 60
+
+
+def _http_date(value):
+    try:
+        return parsedate_to_datetime(value).timestamp() if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def freshness_lifetime(headers, now=None):
+    """
+    Returns how many seconds a response stays fresh, 0 if it must be
+    revalidated before reuse, or None if it must not be stored at all.
+    """
+    now = time.time() if now is None else now
+    cache_control = headers.get("cache-control", "").lower()
+    if "no-store" in cache_control:
+        return None
+    if "no-cache" in cache_control:
+        return 0
+    match = re.search(r"(?:s-maxage|max-age)\s*=\s*(\d+)", cache_control)
+    if match:
+        return int(match.group(1))
+    expires = _http_date(headers.get("expires"))
+    if expires is not None:
+        return max(0, expires - now)
+    last_modified = _http_date(headers.get("last-modified"))
+    if last_modified is not None:
+        age = max(0, now - last_modified)
+        return min(HEURISTIC_MAX_AGE, age * HEURISTIC_FRACTION)
+    return 0
+
+
+class CacheEntry:
+    def __init__(self, url, etag, last_modified, expires, body, document):
+        self.url = url
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires = expires
+        self.body = body
+        self.document = document
+
+    @property
+    def fresh(self) -> bool:
+        return self.expires > time.time()
+
+    def validators(self) -> dict:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """
+    SQLite-backed response cache with a total size cap and LRU eviction.
+    Not safe for use from several threads at once; the fetcher only touches
+    it from its event loop.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._db = None
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS entries (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    expires REAL NOT NULL,
+                    last_access REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    body BLOB,
+                    document TEXT NOT NULL
+                )"""
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access)"
+            )
+        return self._db
+
+    def get(self, url):
+        row = self.db.execute(
+            "SELECT etag, last_modified, expires, body, document FROM entries"
+            " WHERE url = ?",
+            (url,),
+        ).fetchone()
+        if row is None:
+            return None
+        with self.db:
+            self.db.execute(
+                "UPDATE entries SET last_access = ? WHERE url = ?", (time.time(), url)
+            )
+        etag, last_modified, expires, body, document = row
+        return CacheEntry(url, etag, last_modified, expires, body, json.loads(document))
+
+    def put(self, url, headers, body, document, lifetime=None):
+        """
+        Stores a response. `lifetime` overrides the header-derived freshness
+        (used for responses without HTTP semantics, e.g. GitHub aggregates).
+        """
+        if lifetime is None:
+            lifetime = freshness_lifetime(headers)
+            if lifetime is None:
+                return
+        document_json = json.dumps(document, default=str)
+        size = len(body or b"") + len(document_json)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    url,
+                    headers.get("etag"),
+                    headers.get("last-modified"),
+                    now + lifetime,
+                    now,
+                    size,
+                    body,
+                    document_json,
+                ),
+            )
+        self._evict()
+
+    def refresh(self, url, headers):
+        """Extends freshness after a 304 Not Modified revalidation."""
+        lifetime = freshness_lifetime(headers) or 0
+        now = time.time()
+        with self.db:
+            self.db.execute(
+                "UPDATE entries SET expires = ?, last_access = ? WHERE url = ?",
+                (now + lifetime, now, url),
+            )
+
+    def _evict(self):
+        query = "SELECT COALESCE(SUM(size), 0) FROM entries"
+        (total,) = self.db.execute(query).fetchone()
+        if total <= self.max_bytes:
+            return
+        victims = []
+        for url, size in self.db.execute(
+            "SELECT url, size FROM entries ORDER BY last_access"
+        ):
+            if total <= self.max_bytes:
+                break
+            victims.append((url,))
+            total -= size
+        with self.db:
+            self.db.executemany("DELETE FROM entries WHERE url = ?", victims)
+
+    def close(self):
+        if self._db is not None:
+            self._db.close()
+            self._db = None
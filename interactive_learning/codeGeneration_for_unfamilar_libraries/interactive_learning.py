@@ -1,7 +1,7 @@
 # interactive_learning.py
 # Purpose: Run a full interactive session for learning any Python library from docs
 
-from main import agent
+from main import get_agent
 from typing import Dict
 
 
@@ -22,23 +22,25 @@ def learn_any_library(
 
     try:
         # Step 1: Learn from documentation
+        agent = get_agent()
         library_info = agent.learn_from_urls(library_name, documentation_urls)
 
-        # Step 2: Generate examples for each use case
-        all_examples = []
-
-        for i, use_case in enumerate(use_cases, 1):
-            print(f"\n📝 Generating example {i}/{len(use_cases)}: {use_case}")
-
-            example = agent.generate_example(
-                library_info=library_info,
-                use_case=use_case,
-                requirements="Include error handling, comments, and follow best practices",
-            )
+        # Step 2: Generate examples for all use cases concurrently
+        print(f"\n📝 Generating {len(use_cases)} examples...")
+        results = agent.generate_examples(
+            library_info,
+            use_cases,
+            requirements="Include error handling, comments, and follow best practices",
+        )
 
+        all_examples = []
+        for i, example in enumerate(results, 1):
+            if "error" in example:
+                print(f"⚠️  Example {i}/{len(use_cases)} failed ({example['use_case']}): {example['error']}")
+                continue
             all_examples.append(
                 {
-                    "use_case": use_case,
+                    "use_case": example["use_case"],
                     "code": example["code"],
                     "imports": example["imports"],
                     "explanation": example["explanation"],
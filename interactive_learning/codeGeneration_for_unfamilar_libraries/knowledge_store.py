@@ -0,0 +1,124 @@
+# knowledge_store.py
+# Purpose: Persist learned library analyses so learn_from_urls can reuse them
+# instead of fetching and calling the LM again.
+# Entries are keyed by library name and the normalized source URL set, and
+# remember a fingerprint of the documentation they were built from.
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from crawler import canonicalize_url
+
+DEFAULT_STORE_PATH = os.getenv(
+    "KNOWLEDGE_STORE_PATH",
+    os.path.join(
+        os.path.expanduser("~"), ".cache", "dspy_workspace", "knowledge.sqlite"
+    ),
+)
+# How long a stored analysis is trusted before the docs are re-fetched to
+# check whether they changed.
+DEFAULT_TTL = int(os.getenv("KNOWLEDGE_TTL", str(7 * 24 * 60 * 60)))
+
+
+def library_key(library_name: str, urls: list[str], crawl: bool = False) -> str:
+    sources = sorted({canonicalize_url(url) for url in urls})
+    return json.dumps([library_name.strip().lower(), sources, crawl])
+
+
+def content_fingerprint(docs: list[dict]) -> str:
+    """Order-independent hash of the documents an analysis is built from."""
+    digest = hashlib.sha256()
+    pages = sorted((canonicalize_url(d["url"]), d["content"]) for d in docs)
+    for url, content in pages:
+        digest.update(url.encode("utf-8") + b"\0" + content.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+class StoredLibrary:
+    def __init__(self, key, fingerprint, info, checked_at, ttl):
+        self.key = key
+        self.fingerprint = fingerprint
+        self.info = info
+        self.checked_at = checked_at
+        self.ttl = ttl
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() - self.checked_at < self.ttl
+
+
+class KnowledgeStore:
+    """
+    SQLite-backed store of `library_info` dicts. learn_libraries writes to it
+    from worker threads while the event loop reads it, so every access holds
+    a lock.
+    """
+
+    def __init__(self, path=DEFAULT_STORE_PATH, ttl=DEFAULT_TTL):
+        self.path = path
+        self.ttl = ttl
+        self._db = None
+        self._lock = threading.Lock()
+
+    @property
+    def db(self) -> sqlite3.Connection:
+        if self._db is None:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute(
+                """CREATE TABLE IF NOT EXISTS libraries (
+                    key TEXT PRIMARY KEY,
+                    library TEXT NOT NULL,
+                    fingerprint TEXT NOT NULL,
+                    info TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    checked_at REAL NOT NULL
+                )"""
+            )
+        return self._db
+
+    def get(self, library_name, urls, crawl=False):
+        key = library_key(library_name, urls, crawl)
+        with self._lock:
+            row = self.db.execute(
+                "SELECT fingerprint, info, checked_at FROM libraries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            return None
+        fingerprint, info, checked_at = row
+        return StoredLibrary(key, fingerprint, json.loads(info), checked_at, self.ttl)
+
+    def put(self, library_name, urls, crawl, fingerprint, info):
+        now = time.time()
+        row = (
+            library_key(library_name, urls, crawl),
+            library_name,
+            fingerprint,
+            json.dumps(info, default=str),
+            now,
+            now,
+        )
+        with self._lock, self.db:
+            self.db.execute(
+                "INSERT OR REPLACE INTO libraries VALUES (?, ?, ?, ?, ?, ?)", row
+            )
+
+    def touch(self, stored: StoredLibrary):
+        """Marks an entry as revalidated: its docs were re-fetched and unchanged."""
+        stored.checked_at = time.time()
+        with self._lock, self.db:
+            self.db.execute(
+                "UPDATE libraries SET checked_at = ? WHERE key = ?",
+                (stored.checked_at, stored.key),
+            )
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
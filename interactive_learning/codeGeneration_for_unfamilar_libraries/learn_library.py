@@ -1,7 +1,7 @@
 # learn_library.py
 # Purpose: Utility to learn any library from a set of documentation URLs using the agent
 
-from main import agent  # Import the previously defined agent
+from main import get_agent
 from typing import Dict
 
 
@@ -9,16 +9,8 @@ def learn_library_from_urls(library_name: str, documentation_urls: list[str]) ->
     """Learn about any library from its documentation URLs."""
 
     try:
-        library_info = agent.learn_from_urls(library_name, documentation_urls)
-
-        print(f"\n🔍 Library Analysis Results for {library_name}:")
-        print(f"Sources: {len(library_info['source_urls'])} successful fetches")
-        print(f"Core Concepts: {library_info['core_concepts']}")
-        print(f"Common Patterns: {library_info['patterns']}")
-        print(f"Key Methods: {library_info['methods']}")
-        print(f"Installation: {library_info['installation']}")
-        print(f"Found {len(library_info['examples'])} code examples")
-
+        library_info = get_agent().learn_from_urls(library_name, documentation_urls)
+        print_library_info(library_name, library_info)
         return library_info
 
     except Exception as e:
@@ -26,23 +18,50 @@ def learn_library_from_urls(library_name: str, documentation_urls: list[str]) ->
         raise
 
 
-# Example 1: Learn FastAPI from official documentation
-fastapi_urls = [
+def print_library_info(library_name: str, library_info: Dict) -> None:
+    print(f"\n🔍 Library Analysis Results for {library_name}:")
+    print(f"Sources: {len(library_info['source_urls'])} successful fetches")
+    print(f"Core Concepts: {library_info['core_concepts']}")
+    print(f"Common Patterns: {library_info['patterns']}")
+    print(f"Key Methods: {library_info['methods']}")
+    print(f"Installation: {library_info['installation']}")
+    print(f"Found {len(library_info['examples'])} code examples")
+
+
+# Example 1: FastAPI official documentation
+FASTAPI_URLS = [
     "https://fastapi.tiangolo.com/",
     "https://fastapi.tiangolo.com/tutorial/first-steps/",
     "https://fastapi.tiangolo.com/tutorial/path-params/",
     "https://fastapi.tiangolo.com/tutorial/query-params/",
 ]
 
-print("🚀 Learning FastAPI from official documentation...")
-fastapi_info = learn_library_from_urls("FastAPI", fastapi_urls)
-
-# Example 2: Learn a different library (you can replace with any library)
-streamlit_urls = [
+# Example 2: a different library (you can replace with any library)
+STREAMLIT_URLS = [
     "https://docs.streamlit.io/",
     "https://docs.streamlit.io/get-started",
     "https://docs.streamlit.io/develop/api-reference",
 ]
 
-print("\n\n📊 Learning Streamlit from official documentation...")
-streamlit_info = learn_library_from_urls("Streamlit", streamlit_urls)
+
+EXAMPLE_LIBRARIES = {"FastAPI": FASTAPI_URLS, "Streamlit": STREAMLIT_URLS}
+
+
+def learn_examples() -> tuple[Dict, Dict]:
+    """
+    Learns the two example libraries concurrently; returns
+    (fastapi_info, streamlit_info).
+    """
+    print("🚀 Learning FastAPI and Streamlit from their official documentation...")
+    results = get_agent().learn_libraries(
+        [{"library": name, "urls": urls} for name, urls in EXAMPLE_LIBRARIES.items()]
+    )
+    for result in results:
+        if "error" in result:
+            raise RuntimeError(f"Could not learn {result['library']}: {result['error']}")
+        print_library_info(result["library"], result["library_info"])
+    return tuple(result["library_info"] for result in results)
+
+
+if __name__ == "__main__":
+    learn_examples()
@@ -3,146 +3,345 @@
 # Now with integrated GitHub repository analysis.
 
 import dspy
-import requests
-from bs4 import BeautifulSoup
-import html2text
-from typing import List, Dict, Any
+import httpx
+from dspy.utils.callback import BaseCallback
+from dspy.utils.parallelizer import ParallelExecutor
+from typing import Dict
+import asyncio
+import atexit
+import contextvars
+import itertools
 import json
+import multiprocessing
+import os
+import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, nullcontext
+from urllib.parse import urlparse
 
 # Import the GitHub helper functions
-from repo_helpers import gather_repository_info
+from repo_helpers import agather_repository_info
+from html_convert import html_to_document
+from http_cache import DEFAULT_CACHE_PATH, DEFAULT_MAX_BYTES, HttpCache
+from crawler import acrawl_site
+from dedup import dedupe_documents
+from fetch_resilience import (
+    CircuitBreaker,
+    LatencyTracker,
+    backoff_delay,
+    hedged,
+    retry_after,
+)
+from context_budget import DEFAULT_CONTEXT_TOKENS, DEFAULT_MAX_SHARDS, assemble_shards
+from knowledge_store import DEFAULT_STORE_PATH, DEFAULT_TTL, KnowledgeStore, content_fingerprint
+from profiles import BackendProfile, PROFILES, load_profile
+from structured_output import StructuredOutputAdapter
+from session_journal import DEFAULT_JOURNAL_PATH, SessionJournal, replay
+from code_validation import CodeValidator
+from example_cache import DEFAULT_EXAMPLE_CACHE_PATH, DEFAULT_SIMILARITY, ExampleCache
 
 # --- DSPy Configuration ---
-# Replace with your actual LM provider if not using a local one
-    # For models like Llama
-lm = dspy.LM(
-        "ollama_chat/hf.co/Mungert/osmosis-mcp-4b-GGUF:Q4_K_M",
-        api_base="http://localhost:11434",  # Local Ollama server URL
-        api_key="EMPTY",  # Usually empty for local Ollama; remove if you do not have a key
+# The LM and its tuning come from a backend profile (see profiles.py); pick
+# one with --backend or LLM_BACKEND.
+
+# Every request carries its own signature's output schema (structured_output.py).
+structured_adapter = StructuredOutputAdapter()
+
+_profile = None
+
+
+def use_profile(name_or_path=None) -> BackendProfile:
+    """Selects the backend profile used by build_lm() and get_agent()."""
+    global _profile
+    _profile = load_profile(name_or_path)
+    return _profile
+
+
+def get_profile() -> BackendProfile:
+    return _profile or use_profile()
+
+
+def build_lm(profile: BackendProfile | None = None) -> dspy.LM:
+    """Creates the profile's LM. Nothing is constructed at import time."""
+    profile = profile or get_profile()
+    return dspy.LM(
+        profile.model,
         streaming=False,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "project": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "description": {"type": "string"},
-                            },
-                            "required": ["name", "description"],
-                        },
-                        "key_concepts": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                        "architecture_overview": {"type": "string"},
-                        "important_directories": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                        "entry_points": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                        "development_info": {
-                            "type": "object",
-                            "properties": {
-                                "test_dependencies": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "minItems": 1,
-                                },
-                                "linting_tools": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "minItems": 1,
-                                },
-                                "optional_dependencies": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                },
-                            },
-                            "required": ["test_dependencies", "linting_tools"],
-                        },
-                        "usage_examples": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                    },
-                    "required": [
-                        "project",
-                        "key_concepts",
-                        "architecture_overview",
-                        "important_directories",
-                        "entry_points",
-                        "development_info",
-                        "usage_examples",
-                    ],
-                }
-            },
-        },
+        **profile.lm_kwargs(),
     )
-dspy.configure(lm=lm)
+
+
+def configure_lm(lm: dspy.LM | None = None) -> dspy.LM:
+    """
+    Configures DSPy with `lm`, or with build_lm() if no LM has been
+    configured yet, and with the per-signature structured-output adapter.
+    Called lazily by get_agent().
+    """
+    if lm is None:
+        if dspy.settings.lm is not None:
+            return dspy.settings.lm
+        lm = build_lm()
+    dspy.configure(lm=lm, adapter=structured_adapter)
+    return lm
 
 
 # --- Data Fetching Classes ---
 
 
+class HostRateLimiter:
+    """
+    Per-host politeness: caps in-flight requests to each host and spaces
+    request starts to the same host at least `min_interval` seconds apart.
+    Requests to different hosts never wait on each other.
+
+    Semaphores bind to the running event loop, so use one limiter per
+    `asyncio.run`.
+    """
+
+    def __init__(self, max_per_host=4, min_interval=0.25):
+        self.max_per_host = max_per_host
+        self.min_interval = min_interval
+        self._slots = {}  # host -> asyncio.Semaphore
+        self._next_start = {}  # host -> earliest monotonic start time
+
+    @asynccontextmanager
+    async def slot(self, url: str):
+        host = urlparse(url).netloc.lower()
+        semaphore = self._slots.setdefault(host, asyncio.Semaphore(self.max_per_host))
+        async with semaphore:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(host, now))
+            self._next_start[host] = start + self.min_interval
+            if start > now:
+                await asyncio.sleep(start - now)
+            yield
+
+
+# Process pools are created lazily from worker threads, and forking a threaded
+# process can deadlock; workers start from a fork server (spawn without one).
+PROCESS_START_METHOD = (
+    "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+)
+
+
 class DocumentationFetcher:
     """
     Fetches and processes documentation from both standard URLs and GitHub repositories.
+
+    The engine is asyncio + httpx over HTTP/2, so all pages on one host are
+    multiplexed over a single connection. The `fetch_*` methods are sync
+    wrappers around the `afetch_*` coroutines.
+
+    With `crawl=True`, each website URL is treated as a docs root and crawled
+    within `crawl_max_depth`/`crawl_max_pages`/`crawl_max_bytes`.
+
+    Responses are kept in an on-disk HttpCache (pass `cache_path=None` to
+    disable). In `offline` mode (or with DOCS_OFFLINE=1) only cached
+    documents are returned and the network is never touched.
+
+    Website fetches retry transient errors with jittered exponential backoff
+    (`delay` doubling up to `max_delay`) within `fetch_deadline` seconds per
+    URL, fail fast once a host's CircuitBreaker opens, and, with `hedge`,
+    send a second request when one runs past the observed p95 latency.
+
+    With `main_content`, pages are cut down to their main article (and its
+    code blocks) before conversion; see html_convert.main_content_mask.
     """
 
-    def __init__(self, max_retries=3, delay=1):
-        self.session = requests.Session()
-        self.session.headers.update(
-            {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
-        )
+    def __init__(
+        self,
+        max_retries=3,
+        delay=1,
+        max_delay=10,
+        fetch_deadline=30,
+        breaker_threshold=3,
+        breaker_reset=30,
+        hedge=True,
+        main_content=True,
+        max_per_host=4,
+        min_interval=0.25,
+        timeout=15,
+        convert_workers=None,
+        cache_path=DEFAULT_CACHE_PATH,
+        cache_max_bytes=DEFAULT_MAX_BYTES,
+        offline=None,
+        github_ttl=3600,
+        crawl_max_depth=2,
+        crawl_max_pages=50,
+        crawl_max_bytes=5_000_000,
+    ):
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+        }
         self.max_retries = max_retries
         self.delay = delay
-        self.html_converter = html2text.HTML2Text()
-        self.html_converter.ignore_links = False
-        self.html_converter.ignore_images = True
+        self.max_delay = max_delay
+        self.fetch_deadline = fetch_deadline
+        self.breaker = CircuitBreaker(breaker_threshold, breaker_reset)
+        self.hedge = hedge
+        self.main_content = main_content
+        self.latency = LatencyTracker()
+        self.fetch_stats = {"retries": 0, "hedged": 0, "circuit_open": 0}
+        self.max_per_host = max_per_host
+        self.min_interval = min_interval
+        self.timeout = timeout
+        self.convert_workers = convert_workers
+        self._convert_pool = None
+        self.cache = HttpCache(cache_path, cache_max_bytes) if cache_path else None
+        if offline is None:
+            offline = os.getenv("DOCS_OFFLINE", "") not in ("", "0")
+        self.offline = offline
+        self.github_ttl = github_ttl  # GitHub aggregates carry no HTTP cache headers
+        self.crawl_max_depth = crawl_max_depth
+        self.crawl_max_pages = crawl_max_pages
+        self.crawl_max_bytes = crawl_max_bytes
 
-    def fetch_website_url(self, url: str) -> dict:
-        """Fetches and cleans content from a standard website URL."""
-        for attempt in range(self.max_retries):
-            try:
-                print(f"📡 Fetching Website: {url} (attempt {attempt + 1})")
-                response = self.session.get(url, timeout=15)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, "html.parser")
-                for script in soup(["script", "style", "nav", "footer", "header"]):
-                    script.decompose()
-                markdown_content = self.html_converter.handle(str(soup))
-                return {
-                    "url": url,
-                    "title": soup.title.string if soup.title else "No title",
-                    "content": markdown_content,
-                    "success": True,
-                }
-            except Exception as e:
-                print(f"❌ Error fetching {url}: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(self.delay)
-        return {"url": url, "title": "Failed to fetch", "content": "", "success": False}
+    def new_client(self) -> httpx.AsyncClient:
+        """One HTTP/2 connection per host; requests to it share that connection."""
+        return httpx.AsyncClient(
+            http2=True,
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+        )
 
-    def fetch_github_repo(self, url: str) -> dict:
+    @property
+    def convert_pool(self) -> ProcessPoolExecutor:
+        """Worker processes for HTML-to-markdown conversion, created on first use."""
+        if self._convert_pool is None:
+            self._convert_pool = ProcessPoolExecutor(
+                max_workers=self.convert_workers,
+                mp_context=multiprocessing.get_context(PROCESS_START_METHOD),
+            )
+            atexit.register(self._convert_pool.shutdown)
+        return self._convert_pool
+
+    def close(self):
+        if self._convert_pool is not None:
+            self._convert_pool.shutdown()
+            self._convert_pool = None
+        if self.cache is not None:
+            self.cache.close()
+
+    def _from_cache(self, url: str):
+        """
+        Returns (document, entry). `document` is set when the cache can answer
+        without the network; `entry` is a stale entry worth revalidating.
+        """
+        entry = self.cache.get(url) if self.cache else None
+        if entry and (entry.fresh or self.offline):
+            print(f"💾 Cache hit: {url}")
+            return {**entry.document, "cache": "hit"}, entry
+        if self.offline:
+            print(f"📴 Offline and not cached: {url}")
+            return (
+                {"url": url, "title": "Not cached", "content": "", "success": False},
+                None,
+            )
+        return None, entry
+
+    async def afetch_website_url(
+        self, client: httpx.AsyncClient, url: str, limiter=None, convert=True
+    ) -> dict:
+        """
+        Fetches and cleans content from a standard website URL. With
+        `convert=False` the body is returned as is (e.g. a sitemap), still
+        through the cache, offline mode, retries and `limiter`.
+        """
+        document, cached = self._from_cache(url)
+        if document is not None:
+            return document
+        failed = {"url": url, "title": "Failed to fetch", "content": "", "success": False}
+        host = urlparse(url).netloc.lower()
+        if not self.breaker.allow(host):
+            self.fetch_stats["circuit_open"] += 1
+            print(f"⛔ Circuit open for {host}, skipping {url}")
+            return failed
+        headers = cached.validators() if cached else None
+        deadline = time.monotonic() + self.fetch_deadline
+        response = None
+        async with limiter.slot(url) if limiter else nullcontext():
+            for attempt in range(self.max_retries):
+                wait = None
+                try:
+                    print(f"📡 Fetching Website: {url} (attempt {attempt + 1})")
+                    start = time.monotonic()
+                    response, was_hedged = await asyncio.wait_for(
+                        hedged(
+                            lambda: client.get(url, headers=headers),
+                            self.latency.percentile(95) if self.hedge else None,
+                        ),
+                        timeout=max(0.0, deadline - start),
+                    )
+                    self.latency.record(time.monotonic() - start)
+                    self.fetch_stats["hedged"] += was_hedged
+                except Exception as e:
+                    response, error = None, str(e) or type(e).__name__
+                else:
+                    if response.status_code == 304 and cached:
+                        self.breaker.record_success(host)
+                        self.cache.refresh(url, response.headers)
+                        return {**cached.document, "cache": "revalidated"}
+                    if response.is_success:
+                        self.breaker.record_success(host)
+                        break
+                    if response.status_code != 429 and response.status_code < 500:
+                        # The host answered; only this page is missing.
+                        print(f"❌ Error fetching {url}: HTTP {response.status_code}")
+                        self.breaker.record_success(host)
+                        return failed
+                    error, wait = f"HTTP {response.status_code}", retry_after(
+                        response, self.max_delay
+                    )
+                print(f"❌ Error fetching {url}: {error}")
+                self.breaker.record_failure(host)
+                if wait is None:
+                    wait = backoff_delay(attempt, self.delay, self.max_delay)
+                if (
+                    attempt == self.max_retries - 1
+                    or self.breaker.is_open(host)
+                    or time.monotonic() + wait >= deadline
+                ):
+                    return failed
+                self.fetch_stats["retries"] += 1
+                await asyncio.sleep(wait)
+            else:
+                return failed
+        if not convert:
+            document = {"url": url, "title": "", "content": response.text, "success": True}
+        else:
+            # Conversion is CPU-bound; run it in a worker process so pages
+            # convert in parallel and the event loop keeps downloading.
+            document = await asyncio.get_running_loop().run_in_executor(
+                self.convert_pool,
+                html_to_document,
+                url,
+                response.text,
+                str(response.url),
+                self.main_content,
+            )
+            if document["content_ratio"] < 1:
+                print(f"✂️  Kept {document['content_ratio']:.0%} of the text on {url}")
+        document["bytes"] = len(response.content)
+        if self.cache:
+            self.cache.put(url, response.headers, response.content, document)
+        return document
+
+    async def afetch_github_repo(
+        self, client: httpx.AsyncClient, url: str, limiter=None
+    ) -> dict:
         """Fetches and consolidates content from a GitHub repository."""
+        document, _ = self._from_cache(url)
+        if document is not None:
+            return document
         print(f"📦 Fetching GitHub Repo: {url}")
         try:
             # Use the helper function to get README and example files
-            combined_content, details = gather_repository_info(url)
+            async with limiter.slot(url) if limiter else nullcontext():
+                combined_content, details = await agather_repository_info(client, url)
             if "Could not access" in combined_content:
                 return {
                     "url": url,
@@ -151,13 +350,16 @@ class DocumentationFetcher:
                     "success": False,
                 }
 
-            return {
+            document = {
                 "url": url,
                 "title": f"GitHub Repo: {url.split('/')[-1]}",
                 "content": combined_content,
                 "success": True,
                 "details": details,
             }
+            if self.cache:
+                self.cache.put(url, {}, None, document, lifetime=self.github_ttl)
+            return document
         except Exception as e:
             print(f"❌ Error fetching GitHub repo {url}: {e}")
             return {
@@ -167,21 +369,82 @@ class DocumentationFetcher:
                 "success": False,
             }
 
-    def fetch_documentation(self, urls: list[str]) -> list[dict]:
+    async def afetch_documentation(
+        self, urls: list[str], crawl: bool = False, limiter=None, client=None
+    ) -> list[dict]:
         """
-        Fetches documentation from a list of URLs, routing to the correct
-        fetcher (website or GitHub) based on the URL.
+        Fetches documentation from a list of URLs concurrently, routing to the
+        correct fetcher (website or GitHub) based on the URL. Different hosts
+        proceed in parallel while each host is throttled by a HostRateLimiter.
+        Results are returned in the same order as `urls`; a crawled root
+        expands in place into the pages found under it. Concurrent calls can
+        share one `limiter` and `client` so per-host limits hold across them.
         """
-        results = []
-        for url in urls:
+        limiter = limiter or HostRateLimiter(self.max_per_host, self.min_interval)
+
+        async def fetch_one(client, url):
+            # The limiter is only held for network work; cache hits skip it.
             if "github.com" in url:
-                result = self.fetch_github_repo(url)
-            else:
-                result = self.fetch_website_url(url)
+                return [await self.afetch_github_repo(client, url, limiter)]
+            if crawl:
+                pages = await acrawl_site(
+                    self,
+                    client,
+                    limiter,
+                    url,
+                    max_depth=self.crawl_max_depth,
+                    max_pages=self.crawl_max_pages,
+                    max_bytes=self.crawl_max_bytes,
+                )
+                if pages:
+                    return pages
+            return [await self.afetch_website_url(client, url, limiter)]
+
+        async with self.new_client() if client is None else nullcontext(client) as client:
+            batches = await asyncio.gather(*(fetch_one(client, u) for u in urls))
+        docs = [doc for batch in batches for doc in batch]
+
+        convert_ms = [
+            doc["convert_ms"] for doc in docs if "convert_ms" in doc and "cache" not in doc
+        ]
+        cache_hits = sum(1 for doc in docs if "cache" in doc)
+        if cache_hits:
+            print(f"💾 {cache_hits}/{len(docs)} documents served from cache")
+        if convert_ms:
+            print(
+                f"🧮 Converted {len(convert_ms)} pages: "
+                f"{sum(convert_ms):.0f} ms total, {max(convert_ms):.0f} ms slowest"
+            )
+        ratios = [doc["content_ratio"] for doc in docs if "content_ratio" in doc]
+        if ratios:
+            print(
+                f"✂️  Main-content extraction kept {sum(ratios) / len(ratios):.0%} "
+                f"of page text on average ({len(ratios)} pages)"
+            )
+        if len(self.latency):
+            stats = self.fetch_stats
+            print(
+                f"⏱️  Fetch latency over {self.latency.summary()} "
+                f"({stats['hedged']} hedged, {stats['retries']} retries, "
+                f"{stats['circuit_open']} skipped by open circuits)"
+            )
+        return docs
 
-            results.append(result)
-            time.sleep(self.delay)  # Be respectful to servers
-        return results
+    async def _with_client(self, fetch, url):
+        async with self.new_client() as client:
+            return await fetch(client, url)
+
+    def fetch_website_url(self, url: str) -> dict:
+        return asyncio.run(self._with_client(self.afetch_website_url, url))
+
+    def fetch_github_repo(self, url: str) -> dict:
+        return asyncio.run(self._with_client(self.afetch_github_repo, url))
+
+    def fetch_documentation(self, urls: list[str], crawl: bool = False) -> list[dict]:
+        """Sync wrapper around `afetch_documentation` (not callable from a running loop)."""
+        if not urls:
+            return []
+        return asyncio.run(self.afetch_documentation(urls, crawl=crawl))
 
 
 # --- DSPy Signatures and Modules ---
@@ -212,6 +475,40 @@ class LibraryAnalyzer(dspy.Signature):
     )
 
 
+def _merge_key(item) -> str:
+    return " ".join(str(item).lower().split())
+
+
+def merge_analyses(analyses: list) -> dspy.Prediction:
+    """
+    Reduce step for map-reduce analysis: list fields are unioned and deduped
+    case- and whitespace-insensitively, with items found in more shards first;
+    installation_info is the most common non-empty answer.
+    """
+    merged = {}
+    for field in ("core_concepts", "common_patterns", "key_methods", "code_examples"):
+        counts, first = {}, {}
+        for analysis in analyses:
+            for item in getattr(analysis, field) or []:
+                key = _merge_key(item)
+                if not key:
+                    continue
+                first.setdefault(key, item)
+                counts[key] = counts.get(key, 0) + 1
+        position = {key: i for i, key in enumerate(first)}
+        merged[field] = [
+            first[key] for key in sorted(first, key=lambda k: (-counts[k], position[k]))
+        ]
+
+    installs = [a.installation_info for a in analyses if (a.installation_info or "").strip()]
+    merged["installation_info"] = (
+        max(installs, key=lambda s: sum(_merge_key(s) == _merge_key(o) for o in installs))
+        if installs
+        else ""
+    )
+    return dspy.Prediction(**merged)
+
+
 class CodeGenerator(dspy.Signature):
     """Generate a complete, working code example for a specific use case."""
 
@@ -239,36 +536,219 @@ class CodeGenerator(dspy.Signature):
     )
 
 
+class LMConcurrencyLimiter(BaseCallback):
+    """
+    DSPy callback that holds every LM call until one of `limit` slots is free,
+    so concurrent libraries, shards and examples share one cap on the backend.
+    """
+
+    def __init__(self, limit: int):
+        self._slots = threading.BoundedSemaphore(limit)
+        self._held = set()
+        self._lock = threading.Lock()
+
+    def on_lm_start(self, call_id, instance, inputs):
+        self._slots.acquire()
+        with self._lock:
+            self._held.add(call_id)
+
+    def on_lm_end(self, call_id, outputs, exception=None):
+        with self._lock:
+            if call_id not in self._held:
+                return
+            self._held.discard(call_id)
+        self._slots.release()
+
+
 class DocumentationLearningAgent(dspy.Module):
     """Agent that learns from documentation and generates code."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        context_tokens: int = DEFAULT_CONTEXT_TOKENS,
+        max_shards: int = DEFAULT_MAX_SHARDS,
+        analysis_concurrency: int = int(os.getenv("DOCS_ANALYSIS_CONCURRENCY", "2")),
+        example_concurrency: int = int(os.getenv("EXAMPLE_CONCURRENCY", "8")),
+        lm_concurrency: int = int(os.getenv("LM_CONCURRENCY", "8")),
+        knowledge_path=DEFAULT_STORE_PATH,
+        knowledge_ttl=DEFAULT_TTL,
+        validate_examples: bool = os.getenv("VALIDATE_EXAMPLES", "1") != "0",
+        execute_examples: bool = os.getenv("VALIDATE_EXECUTE", "0") not in ("", "0"),
+        max_regenerations: int = 1,
+        example_cache_path=DEFAULT_EXAMPLE_CACHE_PATH,
+        example_similarity: float = DEFAULT_SIMILARITY,
+    ):
         super().__init__()
         self.fetcher = DocumentationFetcher()
+        # Learned analyses persist across runs; pass knowledge_path=None to disable.
+        self.knowledge = (
+            KnowledgeStore(knowledge_path, knowledge_ttl) if knowledge_path else None
+        )
+        # Token budget for each documentation_content handed to LibraryAnalyzer;
+        # docs beyond one budget are analyzed as up to `max_shards` shards.
+        self.context_tokens = context_tokens
+        self.max_shards = max_shards
+        self.analysis_concurrency = analysis_concurrency
+        # Use cases generated at once by generate_examples.
+        self.example_concurrency = example_concurrency
+        # LM calls in flight across all libraries of a learn_libraries job.
+        self.lm_concurrency = lm_concurrency
+        # Generated examples are checked in a process pool; only those that
+        # fail are regenerated, at most `max_regenerations` times each.
+        self.validator = (
+            CodeValidator(execute=execute_examples) if validate_examples else None
+        )
+        self.max_regenerations = max_regenerations
+        # Generated examples persist across runs and are served again for the
+        # same analysis and a near-identical use case; None disables.
+        self.example_cache = (
+            ExampleCache(example_cache_path, example_similarity)
+            if example_cache_path
+            else None
+        )
         self.analyze_docs = dspy.ChainOfThought(LibraryAnalyzer)
         self.generate_code = dspy.ChainOfThought(CodeGenerator)
 
-    def learn_from_urls(self, library_name: str, doc_urls: list[str]) -> Dict:
-        """Learns about a library from documentation URLs and GitHub repos."""
+    def learn_from_urls(
+        self,
+        library_name: str,
+        doc_urls: list[str],
+        crawl: bool = False,
+        refresh: bool = False,
+        prefetched: dict | None = None,
+    ) -> Dict:
+        """
+        Learns about a library from documentation URLs and GitHub repos.
+        With `crawl=True`, website URLs are docs roots crawled by the fetcher.
+        A stored analysis for the same library and sources is returned as is
+        within its TTL; after that the docs are re-fetched and only re-analyzed
+        if their content changed. `refresh=True` ignores the store.
+        `prefetched` maps URLs to documents already fetched for them, which
+        are used instead of fetching those URLs again (not when crawling).
+        """
+        stored = self._stored(library_name, doc_urls, crawl, refresh)
+        if stored is not None and stored.fresh:
+            print(f"🧠 Using stored analysis of {library_name}")
+            return stored.info
+
         print(f"📚 Learning about {library_name} from {len(doc_urls)} sources...")
-        docs = self.fetcher.fetch_documentation(doc_urls)
-
-        combined_content = "\n\n---\n\n".join(
-            [
-                f"SOURCE: {doc['url']}\n\n{doc['content']}"
-                for doc in docs
-                if doc["success"]
-            ]
-        )
+        if crawl or not prefetched:
+            docs = self.fetcher.fetch_documentation(doc_urls, crawl=crawl)
+        else:
+            missing = [url for url in doc_urls if url not in prefetched]
+            fetched = iter(self.fetcher.fetch_documentation(missing))
+            docs = [prefetched.get(url) or next(fetched) for url in doc_urls]
+        return self._learn_from_docs(library_name, doc_urls, crawl, docs, stored)
+
+    def learn_libraries(
+        self, jobs: list[Dict], crawl: bool = False, max_per_host: int | None = None
+    ) -> list[Dict]:
+        """
+        Learns several libraries at once. A job is a dict with "library" and
+        "urls", plus optional "use_cases" and "requirements" as taken by
+        generate_examples. All fetches share one event loop, HTTP client and
+        HostRateLimiter (`max_per_host`, default the fetcher's), so per-host
+        limits hold across libraries; each library's analysis and examples
+        start as soon as its own docs arrive, and every LM call waits for one
+        of `lm_concurrency` slots. Results keep the job order and are
+        `{"library", "library_info", "examples"}` or `{"library", "error"}`.
+        """
+        if not jobs:
+            return []
+        return asyncio.run(self._alearn_libraries(jobs, crawl, max_per_host))
+
+    async def _alearn_libraries(self, jobs, crawl, max_per_host):
+        fetcher = self.fetcher
+        limiter = HostRateLimiter(max_per_host or fetcher.max_per_host, fetcher.min_interval)
+
+        async def run(job, client):
+            library_name, urls = job["library"], job["urls"]
+            try:
+                stored = self._stored(library_name, urls, crawl, refresh=False)
+                if stored is not None and stored.fresh:
+                    print(f"🧠 Using stored analysis of {library_name}")
+                    library_info = stored.info
+                else:
+                    print(f"📚 Learning about {library_name} from {len(urls)} sources...")
+                    docs = await fetcher.afetch_documentation(
+                        urls, crawl, limiter=limiter, client=client
+                    )
+                    # Analysis and generation block on the LM; run them in
+                    # threads (which inherit the dspy context) so the loop
+                    # keeps fetching other libraries.
+                    library_info = await asyncio.to_thread(
+                        self._learn_from_docs, library_name, urls, crawl, docs, stored
+                    )
+                examples = []
+                if job.get("use_cases"):
+                    examples = await asyncio.to_thread(
+                        self.generate_examples,
+                        library_info,
+                        job["use_cases"],
+                        job.get("requirements", ""),
+                    )
+                return {
+                    "library": library_name,
+                    "library_info": library_info,
+                    "examples": examples,
+                }
+            except Exception as e:
+                print(f"❌ Error learning {library_name}: {e}")
+                return {"library": library_name, "error": f"{type(e).__name__}: {e}"}
+
+        lm_limiter = LMConcurrencyLimiter(self.lm_concurrency)
+        with dspy.context(callbacks=[*dspy.settings.get("callbacks", []), lm_limiter]):
+            async with fetcher.new_client() as client:
+                return await asyncio.gather(*(run(job, client) for job in jobs))
+
+    def _stored(self, library_name, doc_urls, crawl, refresh):
+        if self.knowledge is None or refresh:
+            return None
+        return self.knowledge.get(library_name, doc_urls, crawl)
+
+    def _learn_from_docs(self, library_name, doc_urls, crawl, docs, stored=None) -> Dict:
+        """Analyzes fetched docs, unless they still match the `stored` analysis."""
+        docs = [doc for doc in docs if doc["success"]]
+        fingerprint = content_fingerprint(docs)
+        if stored is not None and stored.fingerprint == fingerprint:
+            self.knowledge.touch(stored)
+            print(f"🧠 Documentation unchanged; reusing stored analysis of {library_name}")
+            return stored.info
+
+        docs, report = dedupe_documents(docs)
+        if report["bytes_before"]:
+            print(
+                f"🧹 Removed {report['boilerplate_blocks_removed']} boilerplate blocks and "
+                f"{len(report['near_duplicate_pages'])} near-duplicate pages, saving "
+                f"{report['bytes_saved'] / 1024:.1f} KiB "
+                f"({report['bytes_saved'] / report['bytes_before']:.0%})"
+            )
 
-        if not combined_content:
+        if not docs:
             raise ValueError("No documentation could be fetched successfully.")
 
-        analysis = self.analyze_docs(
-            library_name=library_name, documentation_content=combined_content
+        shards, usage = assemble_shards(
+            docs, library_name, max_tokens=self.context_tokens, max_shards=self.max_shards
         )
+        print(
+            f"🎯 Using {usage['chunks_used']}/{usage['chunks_in']} chunks, "
+            f"~{usage['tokens_used']}/{usage['tokens_in']} tokens "
+            f"(budget {usage['budget']}) in {usage['shards']} shard(s)"
+        )
+        if usage["chunks_dropped"]:
+            print(
+                f"✂️  Dropped {usage['chunks_dropped']} low-ranked chunks that "
+                f"did not fit in {self.max_shards} shard(s)"
+            )
+        if not shards:
+            raise ValueError(
+                f"The fetched documentation for {library_name} has no text to "
+                f"analyze within the {usage['budget']}-token budget."
+            )
 
-        return {
+        analysis = self.analyze_shards(library_name, shards)
+
+        library_info = {
             "library": library_name,
             "source_urls": [doc["url"] for doc in docs if doc["success"]],
             "core_concepts": analysis.core_concepts,
@@ -277,21 +757,75 @@ class DocumentationLearningAgent(dspy.Module):
             "installation": analysis.installation_info,
             "examples": analysis.code_examples,
         }
+        if self.knowledge is not None:
+            self.knowledge.put(library_name, doc_urls, crawl, fingerprint, library_info)
+        return library_info
+
+    def analyze_shards(self, library_name: str, shards: list[str]):
+        """
+        Runs LibraryAnalyzer once per shard, at most `analysis_concurrency` at a
+        time, and merges the partial analyses. Failed shards are skipped unless
+        every shard fails.
+        """
+        if not shards:
+            raise ValueError(f"No documentation shards to analyze for {library_name}.")
+        if len(shards) == 1:
+            return self.analyze_docs(
+                library_name=library_name, documentation_content=shards[0]
+            )
+
+        examples = [
+            dspy.Example(
+                library_name=library_name, documentation_content=shard
+            ).with_inputs("library_name", "documentation_content")
+            for shard in shards
+        ]
+        # timeout=0 turns off straggler resubmission, as in generate_examples:
+        # a slow shard must not be analyzed twice by a saturated backend.
+        results, _, errors = self.analyze_docs.batch(
+            examples,
+            num_threads=self.analysis_concurrency,
+            max_errors=len(examples),
+            return_failed_examples=True,
+            disable_progress_bar=True,
+            timeout=0,
+        )
+        results = [result for result in results if result is not None]
+        if not results:
+            raise ValueError("Documentation analysis failed for every shard.") from (
+                errors[0] if errors else None
+            )
+        if errors:
+            print(f"⚠️ {len(errors)}/{len(shards)} shards failed analysis and were skipped")
+        return merge_analyses(results)
 
     def generate_example(
         self, library_info: Dict, use_case: str, requirements: str = ""
     ) -> Dict:
-        """Generates a code example for a specific use case."""
-        info_text = f"""
-        Library: {library_info["library"]}
-        Core Concepts: {", ".join(library_info["core_concepts"])}
-        Common Patterns: {", ".join(library_info["patterns"])}
-        Key Methods: {", ".join(library_info["methods"])}
-        Installation: {library_info["installation"]}
         """
+        Generates a code example for a specific use case. An example cached
+        for the same library_info, requirements and a use case worded nearly
+        the same way is returned without calling the LM.
+        """
+        if self.example_cache is not None:
+            cached = self.example_cache.get(library_info, use_case, requirements)
+            if cached is not None:
+                print(f"⚡ Using cached example for '{use_case}'")
+                return cached
+
+        example = self._generate_code_example(library_info, use_case, requirements)
+        if self.example_cache is not None:
+            self.example_cache.put(library_info, use_case, requirements, example)
+        return example
 
+    def _generate_code_example(
+        self, library_info: Dict, use_case: str, requirements: str
+    ) -> Dict:
+        """Calls the LM for one example, bypassing the example cache."""
         code_result = self.generate_code(
-            library_info=info_text, use_case=use_case, requirements=requirements
+            library_info=self._library_info_text(library_info),
+            use_case=use_case,
+            requirements=requirements,
         )
 
         return {
@@ -301,17 +835,257 @@ class DocumentationLearningAgent(dspy.Module):
             "imports": code_result.imports_needed,
         }
 
+    def generate_examples(
+        self,
+        library_info: Dict,
+        use_cases: list,
+        requirements: str = "",
+        num_threads: int | None = None,
+        on_example=None,
+    ) -> list[Dict]:
+        """
+        Generates examples for many use cases concurrently, up to `num_threads`
+        (default `example_concurrency`) in flight. A use case is a string or a
+        `(use_case, requirements)` pair. Results keep the input order; each is
+        `{"use_case": ..., **example}`, or `{"use_case": ..., "error": ...}` if
+        that one generation failed. `on_example(result)` is called from the
+        worker thread as soon as each result is ready.
+        """
+        # timeout=0 turns off straggler resubmission: a slow local generation
+        # must not be sent to the backend twice.
+        executor = ParallelExecutor(
+            num_threads=num_threads or self.example_concurrency,
+            disable_progress_bar=True,
+            timeout=0,
+        )
+        return executor.execute(
+            self._example_job(library_info, on_example),
+            self._example_items(use_cases, requirements),
+        )
+
+    def iter_examples(
+        self,
+        library_info: Dict,
+        use_cases: list,
+        requirements: str = "",
+        lookahead: int | None = None,
+        on_example=None,
+    ):
+        """
+        Like generate_examples, but yields results in order as the caller
+        consumes them, keeping up to `lookahead` (default `example_concurrency`)
+        generations running ahead of the one being read. Closing the generator
+        early cancels the use cases that have not started yet and waits for the
+        running ones, so `on_example` is never called after close returns.
+        """
+        generate = self._example_job(library_info, on_example)
+        items = iter(self._example_items(use_cases, requirements))
+        lookahead = lookahead or self.example_concurrency
+        pool = ThreadPoolExecutor(max_workers=lookahead, thread_name_prefix="example")
+        in_flight = deque()
+
+        def submit(count):
+            for item in itertools.islice(items, count):
+                # Carry dspy.context() overrides into the worker thread.
+                in_flight.append(pool.submit(contextvars.copy_context().run, generate, item))
+
+        try:
+            submit(lookahead)
+            while in_flight:
+                result = in_flight.popleft().result()
+                submit(1)
+                yield result
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def _example_items(use_cases: list, requirements: str) -> list[tuple]:
+        return [
+            (item, requirements) if isinstance(item, str) else tuple(item)
+            for item in use_cases
+        ]
+
+    def _example_job(self, library_info: Dict, on_example):
+        def generate(item):
+            use_case, item_requirements = item
+            try:
+                example = self.generate_example(library_info, use_case, item_requirements)
+                if self.validator is not None:
+                    example = self._validated(
+                        library_info, use_case, item_requirements, example
+                    )
+            except Exception as e:
+                result = {"use_case": use_case, "error": f"{type(e).__name__}: {e}"}
+            else:
+                result = {"use_case": use_case, **example}
+            if on_example is not None:
+                on_example(result)
+            return result
+
+        return generate
+
+    def _validated(
+        self, library_info: Dict, use_case: str, requirements: str, example: Dict
+    ) -> Dict:
+        """
+        Validates an example and regenerates it, with the problems found as
+        extra requirements, only while it fails. The last report is attached
+        as `example["validation"]`. A failing example is dropped from the
+        example cache, and a regenerated one that passes takes its place;
+        regeneration bypasses the cache, so the feedback never becomes a key.
+        """
+        report = self.validator.check(example)
+        if report["status"] == "failed" and self.example_cache is not None:
+            self.example_cache.discard(library_info, use_case, requirements)
+        for _ in range(self.max_regenerations):
+            if report["status"] != "failed":
+                break
+            problems = "; ".join(report["errors"])
+            print(f"🔁 Regenerating '{use_case}': {problems}")
+            feedback = (
+                f"A previous attempt failed validation ({problems}); "
+                "fix these problems."
+            )
+            example = self._generate_code_example(
+                library_info, use_case, f"{requirements}\n{feedback}".strip()
+            )
+            report = self.validator.check(example)
+            if report["status"] != "failed" and self.example_cache is not None:
+                self.example_cache.put(library_info, use_case, requirements, example)
+        return {**example, "validation": report}
+
+    @staticmethod
+    def _library_info_text(library_info: Dict) -> str:
+        return f"""
+        Library: {library_info["library"]}
+        Core Concepts: {", ".join(library_info["core_concepts"])}
+        Common Patterns: {", ".join(library_info["patterns"])}
+        Key Methods: {", ".join(library_info["methods"])}
+        Installation: {library_info["installation"]}
+        """
+
+
+_agent = None
+
+
+def get_agent() -> DocumentationLearningAgent:
+    """
+    Returns the shared agent, configuring the LM on first use. The agent is
+    tuned by the active backend profile, so select it with use_profile() first.
+    """
+    global _agent
+    if _agent is None:
+        configure_lm()
+        _agent = DocumentationLearningAgent(**get_profile().agent_kwargs())
+    return _agent
+
 
 # --- Interactive Session Logic ---
 
 
-def interactive_learning_session():
-    """Main interactive session for the library learning system."""
+_muted = contextvars.ContextVar("muted", default=False)
+
+
+class _MutedStdout:
+    """Wraps a stream, dropping writes made where `_muted` is set."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        return len(text) if _muted.get() else self._stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+class SessionPrefetcher:
+    """
+    One background thread that works while the user is typing. Each URL
+    handed to `prefetch()` is fetched (together with any others queued
+    meanwhile) and its document kept in memory until `take()` claims it.
+    `submit()` runs a job after all prefetches queued before it; `learn()` is
+    such a job, handing the prefetched documents to learn_from_urls so no page
+    is downloaded twice. Prefetches print nothing, so they don't interleave
+    with the user's prompts.
+    """
+
+    def __init__(self, fetcher: DocumentationFetcher):
+        self.fetcher = fetcher
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._lock = threading.Lock()
+        self._pending = []
+        self._documents = {}
+
+    def prefetch(self, url: str) -> None:
+        with self._lock:
+            self._pending.append(url)
+        self._executor.submit(self._drain)
+
+    def _drain(self) -> None:
+        with self._lock:
+            urls, self._pending = self._pending, []
+        if not urls:
+            return
+        token = _muted.set(True)
+        stdout, sys.stdout = sys.stdout, _MutedStdout(sys.stdout)
+        try:
+            docs = self.fetcher.fetch_documentation(urls)
+        except Exception:
+            return  # learn_from_urls fetches again and reports real failures.
+        finally:
+            sys.stdout = stdout
+            _muted.reset(token)
+        with self._lock:
+            for url, doc in zip(urls, docs, strict=False):
+                if doc["success"]:
+                    self._documents[url] = doc
+
+    def take(self, urls: list[str]) -> dict:
+        """Removes and returns the prefetched documents for `urls`, by URL."""
+        with self._lock:
+            return {
+                url: self._documents.pop(url) for url in urls if url in self._documents
+            }
+
+    def submit(self, fn, *args, **kwargs):
+        return self._executor.submit(contextvars.copy_context().run, fn, *args, **kwargs)
+
+    def learn(self, agent, library_name, urls, crawl=False) -> Dict:
+        return agent.learn_from_urls(
+            library_name, urls, crawl=crawl, prefetched=self.take(urls)
+        )
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+def interactive_learning_session(journal_path=DEFAULT_JOURNAL_PATH, resume=False):
+    """
+    Main interactive session for the library learning system. Learned
+    libraries and examples are appended to the JSONL journal at
+    `journal_path` as they complete; with `resume=True` the journal is
+    replayed first, and replayed libraries and use cases are not re-run.
+
+    The session is pipelined so the user rarely waits: each URL is fetched
+    in the background as soon as it is entered, analysis starts when URL
+    entry ends while use cases are still being typed, and the next examples
+    are generated while the current one is being read.
+    """
     print("🎯 Welcome to the Interactive Library Learning System!")
     print("This system now supports learning from websites AND GitHub repositories.\n")
 
-    agent = DocumentationLearningAgent()
-    learned_libraries = {}
+    agent = get_agent()
+    learned_libraries = replay(journal_path) if journal_path and resume else {}
+    if learned_libraries:
+        print(
+            f"📼 Resumed {len(learned_libraries)} libraries from {journal_path}: "
+            f"{list(learned_libraries.keys())}"
+        )
+    journal = SessionJournal(journal_path) if journal_path else None
+    if journal is not None:
+        journal.session_started()
+    prefetcher = SessionPrefetcher(agent.fetcher)
 
     while True:
         print("\n" + "=" * 60)
@@ -324,24 +1098,43 @@ def interactive_learning_session():
         print(
             f"\n🔗 Enter documentation URLs or a GitHub repo URL for {library_name} (one per line, empty line to finish):"
         )
+        previous = learned_libraries.get(library_name)
         urls = []
         while True:
             url = input("  URL: ").strip()
             if not url:
                 break
             urls.append(url)
+            if previous is None:
+                prefetcher.prefetch(url)
 
         if not urls:
             continue
 
+        crawl = (
+            input("   Crawl the docs sites under these URLs? (y/n): ").strip().lower()
+            in ["y", "yes"]
+        )
+
+        examples = None
         try:
-            # Step 1: Learn about the library from the provided sources
-            library_info = agent.learn_from_urls(library_name, urls)
-            print(f"\n✅ Successfully learned {library_name}!")
-            print(f"   - Core Concepts: {library_info.get('core_concepts', 'N/A')}")
-            print(f"   - Installation: {library_info.get('installation', 'N/A')}")
+            # Step 1: Learn about the library from the provided sources in
+            # the background, unless the journal already holds it for the
+            # same sources and crawl setting.
+            if (
+                previous is not None
+                and sorted(previous["sources"]) == sorted(urls)
+                and previous.get("crawl", False) == crawl
+            ):
+                learning = None
+                print(f"📼 Replayed {library_name} from the session journal")
+            else:
+                previous = None
+                learning = prefetcher.submit(
+                    prefetcher.learn, agent, library_name, urls, crawl=crawl
+                )
 
-            # Step 2: Get all use cases from the user upfront
+            # Step 2: Get all use cases from the user while it learns
             print(
                 f"\n🎯 Define use cases for {library_name} (one per line, empty line to finish):"
             )
@@ -352,36 +1145,74 @@ def interactive_learning_session():
                     break
                 use_cases.append(use_case)
 
+            if learning is None:
+                library_info = previous["library_info"]
+            else:
+                if not learning.done():
+                    print(f"⏳ Still learning {library_name}...")
+                library_info = learning.result()
+                if journal is not None:
+                    journal.library_learned(library_name, urls, library_info, crawl)
+            print(f"\n✅ Successfully learned {library_name}!")
+            print(f"   - Core Concepts: {library_info.get('core_concepts', 'N/A')}")
+            print(f"   - Installation: {library_info.get('installation', 'N/A')}")
+
             if not use_cases:
                 print("No use cases provided. Moving on.")
                 continue
 
-            # Step 3: Generate and display all examples
-            print(f"\n🔧 Generating {len(use_cases)} examples for {library_name}...")
+            # Step 3: Generate (or replay) and display the examples one at a
+            # time; later ones generate while the current one is read.
+            done = {e["use_case"]: e for e in previous["examples"]} if previous else {}
+            todo = [use_case for use_case in use_cases if use_case not in done]
+            if len(todo) < len(use_cases):
+                print(f"📼 {len(use_cases) - len(todo)} examples replayed from the journal")
+
+            def record(example, library_name=library_name):
+                if journal is not None and "error" not in example:
+                    journal.example_generated(library_name, example)
+
+            print(f"\n🔧 Generating {len(todo)} examples for {library_name}...")
+            examples = agent.iter_examples(library_info, todo, on_example=record)
             all_examples = []
             for i, use_case in enumerate(use_cases, 1):
-                print(f"\n--- EXAMPLE {i}/{len(use_cases)}: {use_case} ---")
+                example = done[use_case] if use_case in done else next(examples)
+                all_examples.append(example)
+                print(f"\n--- EXAMPLE {i}/{len(use_cases)}: {example['use_case']} ---")
 
-                example = agent.generate_example(library_info, use_case)
-                all_examples.append({"use_case": use_case, **example})
+                if "error" in example:
+                    print(f"❌ Generation failed: {example['error']}")
+                else:
+                    print("\n💻 Code Example:")
+                    print(f"```python\n{example['code']}\n```")
 
-                print("\n💻 Code Example:")
-                print(f"```python\n{example['code']}\n```")
+                    print("\n📦 Required Imports:")
+                    print("\n".join([f"  • {imp}" for imp in example["imports"]]))
 
-                print("\n📦 Required Imports:")
-                print("\n".join([f"  • {imp}" for imp in example["imports"]]))
+                    print("\n📝 Explanation:")
+                    print(example["explanation"])
 
-                print("\n📝 Explanation:")
-                print(example["explanation"])
+                    print("\n✅ Best Practices:")
+                    print("\n".join([f"  • {bp}" for bp in example["best_practices"]]))
+                    validation = example.get("validation")
+                    if validation:
+                        print(f"\n🧪 Validation: {validation['status']}")
+                        print("\n".join([f"  • {err}" for err in validation["errors"]]))
+                    print("--- END OF EXAMPLE ---")
 
-                print("\n✅ Best Practices:")
-                print("\n".join([f"  • {bp}" for bp in example["best_practices"]]))
-                print("--- END OF EXAMPLE ---")
+                if i < len(use_cases) and input(
+                    "\n➡️  Continue to next example? (y/n): "
+                ).strip().lower() not in ["", "y", "yes"]:
+                    break
+            examples.close()
 
             # Store the complete results
             learned_libraries[library_name] = {
                 "library_info": library_info,
-                "examples": all_examples,
+                "sources": urls,
+                "crawl": crawl,
+                "examples": all_examples
+                + [e for u, e in done.items() if u not in use_cases],
             }
 
             # Step 4: Offer to save the results to a file
@@ -408,8 +1239,17 @@ def interactive_learning_session():
 
         except Exception as e:
             print(f"❌ An error occurred while learning {library_name}: {e}")
+        finally:
+            if examples is not None:
+                examples.close()  # cancel speculative generations not yet started
 
+    prefetcher.close()
     print("\n👋 Thanks for using the Interactive Library Learning System!")
+    if journal is not None:
+        journal.close()
+        print(f"📼 Session journal: {journal_path} (resume with --resume)")
+    if structured_adapter.stats["calls"]:
+        print(f"🧾 {structured_adapter.summary()}")
     if learned_libraries:
         print(f"\n🎉 Session Summary:")
         print(
@@ -418,4 +1258,27 @@ def interactive_learning_session():
 
 
 if __name__ == "__main__":
-    interactive_learning_session()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Interactive library learning")
+    parser.add_argument(
+        "--backend",
+        help=f"Backend profile: one of {', '.join(PROFILES)} or a JSON file "
+        f"(default: $LLM_BACKEND or 'default')",
+    )
+    parser.add_argument(
+        "--journal",
+        default=DEFAULT_JOURNAL_PATH,
+        help="Append-only session journal (default: $LEARNING_JOURNAL or %(default)s)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Replay the journal first instead of re-learning what it already holds",
+    )
+    args = parser.parse_args()
+    try:
+        print(f"⚙️  Backend profile: {use_profile(args.backend).name}")
+    except ValueError as e:
+        parser.error(str(e))
+    interactive_learning_session(args.journal, resume=args.resume)
@@ -0,0 +1,226 @@
+# notebook_extract.py
+# Purpose: Streams a Jupyter notebook's JSON and keeps only what an LLM needs:
+# code and markdown cells, plus an optional truncated slice of each cell's
+# text output, rendered as a "# %%" percent-format script. Images, execution
+# metadata and long outputs are dropped as they stream past instead of being
+# loaded whole.
+
+import codecs
+import json
+import os
+import re
+
+MAX_OUTPUT_BYTES = int(os.getenv("NOTEBOOK_OUTPUT_BYTES", "400"))
+CHUNK_SIZE = 64 * 1024
+
+_STRING_BODY = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.S)
+_SCALAR = re.compile(r"[^\s,:\]\}]+")  # numbers, true, false, null
+_WHITESPACE = re.compile(r"\s*")
+
+# JSON paths (object keys, "[]" for list items) of the nbformat 4 strings we
+# keep; every other string is skipped without being stored.
+_CELL = ("cells", "[]")
+_KEEP = {
+    _CELL + ("cell_type",): "cell_type",
+    _CELL + ("source",): "source",
+    _CELL + ("source", "[]"): "source",
+    _CELL + ("outputs", "[]", "text"): "output",
+    _CELL + ("outputs", "[]", "text", "[]"): "output",
+    _CELL + ("outputs", "[]", "data", "text/plain"): "output",
+    _CELL + ("outputs", "[]", "data", "text/plain", "[]"): "output",
+}
+
+
+def _unescape(raw: str) -> str:
+    """Decodes an escaped JSON string body that may have been cut mid-escape."""
+    while True:
+        try:
+            return json.loads(f'"{raw}"')
+        except ValueError:
+            cut = raw.rfind("\\")
+            if cut < 0:
+                return raw
+            raw = raw[:cut]
+
+
+def _commented(text: str) -> list[str]:
+    return [f"# {line}".rstrip() for line in text.splitlines()]
+
+
+class NotebookExtractor:
+    """
+    Incremental notebook-to-script converter. `feed()` raw bytes as they
+    arrive and call `text()` at the end. `done` turns True once `max_bytes`
+    of script exist, so the caller can stop downloading.
+    """
+
+    def __init__(self, max_bytes=None, max_output_bytes=MAX_OUTPUT_BYTES):
+        self.max_bytes = max_bytes
+        self.max_output_bytes = max_output_bytes
+        self.done = False
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._buf = ""
+        self._stack = []  # [kind, current key or "[]", expecting a key]
+        self._in_string = False
+        self._target = None  # what the current string feeds, None to skip it
+        self._pieces = []
+        self._left = None  # characters of the current string still worth keeping
+        self._cell = None
+        self._parts = []
+        self._size = 0
+
+    def feed(self, data: bytes) -> None:
+        if not self.done:
+            self._buf += self._decoder.decode(data)
+            self._parse(final=False)
+
+    def text(self) -> str:
+        if not self.done:
+            self._buf += self._decoder.decode(b"", final=True)
+            self._parse(final=True)
+        return "".join(self._parts)
+
+    # --- Tokenizer ---
+
+    def _parse(self, final: bool) -> None:
+        buf, pos, n = self._buf, 0, len(self._buf)
+        while pos < n and not self.done:
+            if self._in_string:
+                end = _STRING_BODY.match(buf, pos).end()
+                self._take(buf[pos:end])
+                pos = end
+                if end == n or buf[end] == "\\":
+                    break  # the rest of the string is in the next chunk
+                pos += 1
+                self._in_string = False
+                self._end_string()
+                continue
+            pos = _WHITESPACE.match(buf, pos).end()
+            if pos == n:
+                break
+            c = buf[pos]
+            if c == '"':
+                self._start_string()
+            elif c in "{[":
+                self._open(c)
+            elif c in "}]":
+                self._close()
+            elif c == ":":
+                self._top()[2] = False
+            elif c == ",":
+                self._top()[2] = self._top()[0] == "obj"
+            else:
+                end = _SCALAR.match(buf, pos).end()
+                if end == n and not final:
+                    break
+                pos = end
+                continue
+            pos += 1
+        self._buf = buf[pos:]
+
+    def _top(self):
+        if not self._stack:
+            raise ValueError("Malformed notebook JSON")
+        return self._stack[-1]
+
+    def _path(self) -> tuple:
+        return tuple(frame[1] for frame in self._stack)
+
+    def _open(self, c: str) -> None:
+        if c == "{" and self._path() == _CELL:
+            self._cell = {"type": None, "source": [], "output": [], "truncated": False}
+            self._output_left = self.max_output_bytes
+        elif c == "{" and self._path() == _CELL + ("outputs", "[]"):
+            output = self._cell["output"]
+            if output and not output[-1].endswith("\n"):
+                output.append("\n")  # one output per line block
+        self._stack.append(["obj", None, True] if c == "{" else ["arr", "[]", False])
+
+    def _close(self) -> None:
+        frame = self._top()
+        self._stack.pop()
+        if frame[0] == "obj" and self._cell is not None and self._path() == _CELL:
+            self._emit_cell(self._cell)
+            self._cell = None
+
+    def _start_string(self) -> None:
+        self._in_string = True
+        self._pieces = []
+        self._left = None
+        if self._stack and self._stack[-1][0] == "obj" and self._stack[-1][2]:
+            self._target = "key"
+            return
+        self._target = _KEEP.get(self._path())
+        if self._target == "output":
+            if self._output_left <= 0:
+                self._cell["truncated"] = True
+                self._target = None
+            self._left = self._output_left
+
+    def _take(self, piece: str) -> None:
+        if self._target is None:
+            return
+        if self._left is None:
+            self._pieces.append(piece)
+            return
+        if self._left > 0:
+            self._pieces.append(piece[: self._left])
+        self._left -= len(piece)
+
+    def _end_string(self) -> None:
+        target = self._target
+        if target is None:
+            return
+        value = _unescape("".join(self._pieces))
+        if target == "key":
+            self._stack[-1][1] = value
+        elif target == "cell_type":
+            self._cell["type"] = value
+        elif target == "source":
+            self._cell["source"].append(value)
+        elif target == "output":
+            self._cell["output"].append(value)
+            self._output_left -= len(value)
+            if self._left < 0:
+                self._cell["truncated"] = True
+
+    # --- Rendering ---
+
+    def _emit_cell(self, cell: dict) -> None:
+        source = "".join(cell["source"]).strip("\n")
+        if not source:
+            return
+        if cell["type"] == "markdown":
+            lines = ["# %% [markdown]", *_commented(source)]
+        elif cell["type"] == "code":
+            lines = ["# %%", source]
+        else:
+            return  # raw cells
+        output = "".join(cell["output"]).strip("\n")
+        if cell["truncated"] and "\n" in output:
+            output = output[: output.rfind("\n")]  # drop the partial last line
+        if output and self.max_output_bytes:
+            lines += ["# Output:", *_commented(output)]
+            if cell["truncated"]:
+                lines.append("# ... (output truncated)")
+        text = "\n".join(lines) + "\n\n"
+        size = len(text.encode("utf-8"))
+        if self.max_bytes is not None and self._size + size > self.max_bytes:
+            head = text.encode("utf-8")[: self.max_bytes - self._size]
+            text = head[: head.rfind(b"\n") + 1].decode("utf-8", errors="ignore")
+            text += "# ... truncated\n"
+            self.done = True
+        self._parts.append(text)
+        self._size += size
+
+
+def extract_notebook(
+    data: bytes, max_bytes=None, max_output_bytes=MAX_OUTPUT_BYTES
+) -> str:
+    """Converts a whole notebook held in memory; see NotebookExtractor."""
+    extractor = NotebookExtractor(max_bytes, max_output_bytes)
+    for start in range(0, len(data), CHUNK_SIZE):
+        extractor.feed(data[start : start + CHUNK_SIZE])
+        if extractor.done:
+            break
+    return extractor.text()
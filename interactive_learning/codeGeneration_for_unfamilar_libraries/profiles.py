@@ -0,0 +1,154 @@
+# profiles.py
+# Purpose: Backend profiles for the library-learning agent. A profile names
+# the LM and carries the tuning that suits its serving stack: how many
+# requests to keep in flight, how large a context to fill, how long the model
+# stays loaded, and how long to wait for a response.
+
+import json
+import os
+
+BACKEND_ENV = "LLM_BACKEND"
+DEFAULT_BACKEND = "default"
+
+
+class BackendProfile:
+    def __init__(
+        self,
+        name,
+        model,
+        api_base=None,
+        api_key="EMPTY",
+        example_concurrency=2,
+        analysis_concurrency=1,
+        context_tokens=12000,
+        max_shards=4,
+        num_ctx=None,
+        keep_alive=None,
+        timeout=300,
+        num_retries=3,
+        lm_concurrency=None,
+    ):
+        self.name = name
+        self.model = model
+        self.api_base = api_base
+        self.api_key = api_key
+        # Requests kept in flight: generate_examples threads and analysis shards.
+        self.example_concurrency = example_concurrency
+        self.analysis_concurrency = analysis_concurrency
+        # Global cap on LM calls in flight when several libraries run at once;
+        # None means the larger of the two settings above.
+        self.lm_concurrency = lm_concurrency
+        # Documentation tokens per analysis call, and how many calls to spread
+        # them over.
+        self.context_tokens = context_tokens
+        self.max_shards = max_shards
+        # Server-side context window (Ollama's num_ctx); None leaves the
+        # server default.
+        self.num_ctx = num_ctx
+        # How long Ollama keeps the model loaded between calls; None for
+        # servers without it.
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+        self.num_retries = num_retries
+
+    def lm_kwargs(self) -> dict:
+        """Keyword arguments for dspy.LM, minus the response format."""
+        kwargs = {
+            "api_base": self.api_base,
+            "api_key": self.api_key,
+            "timeout": self.timeout,
+            "num_retries": self.num_retries,
+        }
+        if self.num_ctx:
+            kwargs["num_ctx"] = self.num_ctx
+        if self.keep_alive:
+            kwargs["keep_alive"] = self.keep_alive
+        return kwargs
+
+    def agent_kwargs(self) -> dict:
+        """DocumentationLearningAgent tuning; the matching env vars still win."""
+        return {
+            "context_tokens": _env_int("DOCS_CONTEXT_TOKENS", self.context_tokens),
+            "max_shards": _env_int("DOCS_MAX_SHARDS", self.max_shards),
+            "analysis_concurrency": _env_int(
+                "DOCS_ANALYSIS_CONCURRENCY", self.analysis_concurrency
+            ),
+            "example_concurrency": _env_int(
+                "EXAMPLE_CONCURRENCY", self.example_concurrency
+            ),
+            "lm_concurrency": _env_int(
+                "LM_CONCURRENCY",
+                self.lm_concurrency
+                or max(self.example_concurrency, self.analysis_concurrency),
+            ),
+        }
+
+
+def _env_int(name, default):
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+# Ollama serves a handful of parallel slots (OLLAMA_NUM_PARALLEL) and pays a
+# full reload when a model is evicted, so its profiles keep concurrency low
+# and the model resident. vLLM batches continuously: the more requests in
+# flight, the better its throughput, up to its KV-cache capacity.
+PROFILES = {
+    "default": BackendProfile(
+        "default",
+        "ollama_chat/hf.co/Mungert/osmosis-mcp-4b-GGUF:Q4_K_M",
+        api_base="http://localhost:11434",
+        example_concurrency=2,
+        analysis_concurrency=2,
+        context_tokens=12000,
+        num_ctx=16384,
+        keep_alive="30m",
+        timeout=300,
+    ),
+    "ollama": BackendProfile(
+        "ollama",
+        "ollama_chat/hf.co/unsloth/Qwen3-Coder-30B-A3B-Instruct-GGUF:IQ2_XXS",
+        api_base="http://localhost:11434",
+        example_concurrency=2,
+        analysis_concurrency=1,
+        context_tokens=16000,
+        num_ctx=24576,
+        keep_alive="30m",
+        timeout=600,
+    ),
+    # vLLM's OpenAI-compatible server (`vllm serve <model>`, port 8000).
+    "vllm": BackendProfile(
+        "vllm",
+        "hosted_vllm/Qwen/Qwen3-Coder-30B-A3B-Instruct",
+        api_base="http://localhost:8000/v1",
+        example_concurrency=32,
+        analysis_concurrency=8,
+        context_tokens=24000,
+        max_shards=8,
+        timeout=600,
+    ),
+}
+
+
+def load_profile(name_or_path=None) -> BackendProfile:
+    """
+    Returns a built-in profile by name, or one read from a JSON file of
+    BackendProfile fields. Defaults to $LLM_BACKEND, then "default".
+    LLM_MODEL and LLM_API_BASE override the model and endpoint.
+    """
+    name_or_path = name_or_path or os.getenv(BACKEND_ENV) or DEFAULT_BACKEND
+    if name_or_path in PROFILES:
+        base = PROFILES[name_or_path]
+        fields = dict(vars(base))
+    elif os.path.isfile(name_or_path):
+        with open(name_or_path, encoding="utf-8") as f:
+            fields = json.load(f)
+        fields.setdefault("name", os.path.splitext(os.path.basename(name_or_path))[0])
+    else:
+        raise ValueError(
+            f"Unknown backend profile {name_or_path!r}; "
+            f"use one of {sorted(PROFILES)} or a JSON file"
+        )
+    fields["model"] = os.getenv("LLM_MODEL") or fields["model"]
+    fields["api_base"] = os.getenv("LLM_API_BASE") or fields.get("api_base")
+    return BackendProfile(**fields)
@@ -1,110 +1,239 @@
 # repo_helpers.py
 # Contains functions for interacting with the GitHub API.
+# The a-prefixed coroutines share the caller's httpx.AsyncClient so GitHub API
+# calls multiplex over one HTTP/2 connection; the plain functions wrap them.
 
-import requests
+import asyncio
+import httpx
 from dotenv import load_dotenv
 import os
 import base64
 
+from notebook_extract import NotebookExtractor
+
 # Load environment variables from a .env file
 load_dotenv()
 
+# Example files are ranked deterministically and packed into a byte budget
+# using the blob sizes the tree API already returns, so the same repository
+# always yields the same context (and the same cache key).
+EXAMPLE_BYTES_BUDGET = int(os.getenv("REPO_EXAMPLE_BYTES", "48000"))
+MAX_EXAMPLE_FILE_BYTES = int(os.getenv("REPO_EXAMPLE_FILE_BYTES", "12000"))
+MAX_EXAMPLE_FILES = int(os.getenv("REPO_EXAMPLE_FILES", "8"))
+EXAMPLE_FETCH_CONCURRENCY = 4
+EXAMPLE_KEYWORDS = ("examples", "example", "docs", "samples", "tutorial")
 
-def get_github_file_tree(repo_url):
-    """Get repository file structure from the GitHub API."""
+
+def _auth_headers():
     token = os.getenv("GITHUB_ACCESS_TOKEN")
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def _owner_repo(repo_url):
     parts = repo_url.strip("/").split("/")
-    owner, repo = parts[-2], parts[-1]
+    return parts[-2], parts[-1]
+
+
+async def afetch_github_blobs(client, repo_url):
+    """Get `{path: size}` for every file in the repository, or None on failure."""
+    owner, repo = _owner_repo(repo_url)
 
     api_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/main?recursive=1"
-    headers = {"Authorization": f"Bearer {token}"} if token else {}
 
     print(f"🌳 Fetching file tree for {owner}/{repo}...")
-    response = requests.get(api_url, headers=headers)
+    response = await client.get(api_url, headers=_auth_headers())
 
     if response.status_code == 200:
         tree_data = response.json()
         # Filter for files (blobs) only
-        file_paths = [
-            item["path"] for item in tree_data.get("tree", []) if item["type"] == "blob"
-        ]
-        return "\n".join(sorted(file_paths))
-    else:
-        print(
-            f"⚠️  Could not fetch repository tree (Status: {response.status_code}): {response.text}"
-        )
+        return {
+            item["path"]: item.get("size", 0)
+            for item in tree_data.get("tree", [])
+            if item["type"] == "blob"
+        }
+    print(
+        f"⚠️  Could not fetch repository tree (Status: {response.status_code}): {response.text}"
+    )
+    return None
+
+
+async def afetch_github_file_tree(client, repo_url):
+    """Get repository file structure from the GitHub API."""
+    blobs = await afetch_github_blobs(client, repo_url)
+    if blobs is None:
         return "Could not fetch repository file tree."
+    return "\n".join(sorted(blobs))
 
 
-def get_github_file_content(repo_url, file_path):
-    """Get specific file content from a GitHub repository."""
-    token = os.getenv("GITHUB_ACCESS_TOKEN")
-    parts = repo_url.strip("/").split("/")
-    owner, repo = parts[-2], parts[-1]
+def _truncate(data: bytes, max_bytes: int) -> str:
+    """Decodes at most `max_bytes`, cut back to a line boundary."""
+    if len(data) <= max_bytes:
+        return data.decode("utf-8", errors="replace")
+    head = data[:max_bytes]
+    cut = head.rfind(b"\n")
+    if cut > 0:
+        head = head[:cut]
+    text = head.decode("utf-8", errors="ignore")
+    return f"{text}\n# ... truncated ({len(data)} bytes total)"
+
+
+async def afetch_github_file_content(client, repo_url, file_path, max_bytes=None):
+    """
+    Get specific file content from a GitHub repository, truncated to
+    `max_bytes` if given.
+    """
+    owner, repo = _owner_repo(repo_url)
 
     api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
-    headers = {"Authorization": f"Bearer {token}"} if token else {}
 
-    response = requests.get(api_url, headers=headers)
+    response = await client.get(api_url, headers=_auth_headers())
 
     if response.status_code == 200:
-        content = base64.b64decode(response.json()["content"]).decode("utf-8")
-        return content
+        data = base64.b64decode(response.json()["content"])
+        if max_bytes is not None:
+            return _truncate(data, max_bytes)
+        return data.decode("utf-8")
     else:
         return f"Could not fetch {file_path}"
 
 
-def gather_repository_info(repo_url):
+async def afetch_github_notebook(client, repo_url, file_path, max_bytes=None):
     """
-    Gathers the file tree, README, and example files from a repository.
-    Focuses on README for overview and Python/Jupyter files for examples.
+    Streams a notebook from raw.githubusercontent.com through NotebookExtractor,
+    keeping code/markdown cells and short text outputs (at most `max_bytes`).
+    The download stops as soon as the budget is full.
     """
-    print(f"🔍 Gathering information from repository: {repo_url}")
-    file_tree_str = get_github_file_tree(repo_url)
+    owner, repo = _owner_repo(repo_url)
 
-    if "Could not fetch" in file_tree_str:
-        return "Could not access repository.", {}
+    raw_url = f"https://raw.githubusercontent.com/{owner}/{repo}/main/{file_path}"
 
-    readme_content = get_github_file_content(repo_url, "README.md")
+    extractor = NotebookExtractor(max_bytes)
+    async with client.stream("GET", raw_url, headers=_auth_headers()) as response:
+        if response.status_code != 200:
+            return f"Could not fetch {file_path}"
+        try:
+            async for chunk in response.aiter_bytes():
+                extractor.feed(chunk)
+                if extractor.done:
+                    break
+            return extractor.text()
+        except ValueError:
+            return f"Could not fetch {file_path}"
 
-    # --- Find and fetch example files ---
-    example_files = {}
-    file_paths = file_tree_str.split("\n")
 
-    # Look for common example directories or files
-    example_keywords = ["examples", "example", "docs", "samples", "tutorial"]
-    py_files = [p for p in file_paths if p.endswith(".py")]
-    ipynb_files = [p for p in file_paths if p.endswith(".ipynb")]
+def rank_example_files(blobs):
+    """
+    Orders candidate example files: Python files under example-like
+    directories, then notebooks there, then top-level Python files. Ties go
+    to shallower paths, then alphabetical order, so the ranking is stable.
+    """
 
-    # Prioritize files in example-related directories
-    potential_examples = [
-        p
-        for p in py_files + ipynb_files
-        if any(keyword in p.lower() for keyword in example_keywords)
+    def tier(path):
+        in_examples = any(keyword in path.lower() for keyword in EXAMPLE_KEYWORDS)
+        if in_examples and path.endswith(".py"):
+            return 0
+        if in_examples and path.endswith(".ipynb"):
+            return 1
+        if path.endswith(".py") and "/" not in path:
+            return 2
+        return None
+
+    ranked = [
+        (tier(path), path.count("/"), path)
+        for path, size in blobs.items()
+        if size and not path.endswith("__init__.py") and tier(path) is not None
     ]
+    return [path for _, _, path in sorted(ranked)]
 
-    # If not enough found, take a few from the root
-    if len(potential_examples) < 5:
-        potential_examples.extend(
-            [p for p in py_files if "/" not in p][:5]
-        )  # Top-level python files
-
-    # Fetch content for a limited number of examples to avoid being overwhelming
-    for i, file_path in enumerate(
-        list(set(potential_examples))[:5]
-    ):  # Limit to 5 unique examples
-        print(f"📄 Fetching example file: {file_path}")
-        content = get_github_file_content(repo_url, file_path)
-        if "Could not fetch" not in content:
-            example_files[file_path] = content
 
-    # --- Combine all info into a single string for the LLM ---
-    combined_content = f"# REPOSITORY OVERVIEW: {repo_url}\n\n"
-    combined_content += "## README.md\n\n" + readme_content + "\n\n---\n\n"
+def select_example_files(
+    blobs,
+    budget=EXAMPLE_BYTES_BUDGET,
+    max_file_bytes=MAX_EXAMPLE_FILE_BYTES,
+    max_files=MAX_EXAMPLE_FILES,
+):
+    """
+    Walks the ranking and keeps each file whose (per-file capped) size still
+    fits the remaining byte budget. Returns `[(path, bytes_to_read)]`.
+    """
+    selected = []
+    remaining = budget
+    for path in rank_example_files(blobs):
+        if len(selected) >= max_files:
+            break
+        cost = min(blobs[path], max_file_bytes)
+        if cost <= remaining:
+            selected.append((path, cost))
+            remaining -= cost
+    return selected
+
+
+async def agather_repository_info(client, repo_url, budget=EXAMPLE_BYTES_BUDGET):
+    """
+    Gathers the file tree, README, and example files from a repository.
+    Focuses on README for overview and Python/Jupyter files for examples;
+    the examples fill at most `budget` bytes and are fetched concurrently.
+    """
+    print(f"🔍 Gathering information from repository: {repo_url}")
+    blobs = await afetch_github_blobs(client, repo_url)
 
+    if blobs is None:
+        return "Could not access repository.", {}
+    file_tree_str = "\n".join(sorted(blobs))
+
+    selected = select_example_files(blobs, budget)
+    semaphore = asyncio.Semaphore(EXAMPLE_FETCH_CONCURRENCY)
+
+    async def fetch_example(file_path, max_bytes):
+        async with semaphore:
+            print(f"📄 Fetching example file: {file_path}")
+            if file_path.endswith(".ipynb"):
+                return await afetch_github_notebook(client, repo_url, file_path, max_bytes)
+            return await afetch_github_file_content(client, repo_url, file_path, max_bytes)
+
+    readme_content, *contents = await asyncio.gather(
+        afetch_github_file_content(client, repo_url, "README.md"),
+        *(fetch_example(path, max_bytes) for path, max_bytes in selected),
+    )
+    example_files = {
+        path: content
+        for (path, _), content in zip(selected, contents)
+        if content and "Could not fetch" not in content
+    }
+
+    # --- Combine all info into a single string for the LLM ---
+    parts = [
+        f"# REPOSITORY OVERVIEW: {repo_url}\n\n",
+        "## README.md\n\n",
+        readme_content,
+        "\n\n---\n\n",
+    ]
     if example_files:
-        combined_content += "## CODE EXAMPLES\n\n"
+        parts.append("## CODE EXAMPLES\n\n")
         for path, code in example_files.items():
-            combined_content += f"### File: {path}\n\n```python\n{code}\n```\n\n"
+            parts.append(f"### File: {path}\n\n```python\n{code}\n```\n\n")
+
+    return "".join(parts), {"file_tree": file_tree_str, **example_files}
+
+
+# --- Sync wrappers ---
 
-    return combined_content, {"file_tree": file_tree_str, **example_files}
+
+async def _with_client(fetch, *args):
+    async with httpx.AsyncClient(http2=True, follow_redirects=True, timeout=30) as client:
+        return await fetch(client, *args)
+
+
+def get_github_file_tree(repo_url):
+    """Get repository file structure from the GitHub API."""
+    return asyncio.run(_with_client(afetch_github_file_tree, repo_url))
+
+
+def get_github_file_content(repo_url, file_path):
+    """Get specific file content from a GitHub repository."""
+    return asyncio.run(_with_client(afetch_github_file_content, repo_url, file_path))
+
+
+def gather_repository_info(repo_url):
+    """Gathers the file tree, README, and example files from a repository."""
+    return asyncio.run(_with_client(agather_repository_info, repo_url))
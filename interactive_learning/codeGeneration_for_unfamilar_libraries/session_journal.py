@@ -0,0 +1,102 @@
+# session_journal.py
+# Purpose: Append-only JSONL journal of an interactive learning session.
+# Each learned library and each generated example is written as one line the
+# moment it completes, so a crash loses at most the line being written, and a
+# later session can replay the journal instead of fetching and calling the LM.
+
+import os
+import threading
+import time
+
+try:
+    import orjson
+
+    def _dumps(record) -> bytes:
+        return orjson.dumps(record, default=str) + b"\n"
+
+    _loads = orjson.loads
+except ImportError:  # orjson is a dev extra; the stdlib is slower but works
+    import json
+
+    def _dumps(record) -> bytes:
+        line = json.dumps(record, default=str, ensure_ascii=False) + "\n"
+        return line.encode("utf-8")
+
+    _loads = json.loads
+
+DEFAULT_JOURNAL_PATH = os.getenv("LEARNING_JOURNAL", "learning_session.jsonl")
+
+
+def replay(path) -> dict:
+    """
+    Rebuilds `learned_libraries` ({name: {"library_info", "sources", "crawl",
+    "examples"}}) from a journal. A torn last line from a crash is skipped.
+    """
+    learned = {}
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return learned
+    with f:
+        for line in f:
+            try:
+                record = _loads(line)
+            except ValueError:
+                continue
+            kind = record.get("type")
+            if kind == "library":
+                learned[record["library"]] = {
+                    "library_info": record["info"],
+                    "sources": record.get("sources", []),
+                    "crawl": record.get("crawl", False),
+                    "examples": [],
+                }
+            elif kind == "example" and record["library"] in learned:
+                examples = learned[record["library"]]["examples"]
+                # A regenerated use case replaces the earlier one.
+                use_case = record["example"]["use_case"]
+                examples[:] = [e for e in examples if e["use_case"] != use_case]
+                examples.append(record["example"])
+    return learned
+
+
+class SessionJournal:
+    """Appends records to a JSONL file; safe to call from worker threads."""
+
+    def __init__(self, path=DEFAULT_JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._file = None
+
+    def _append(self, record: dict) -> None:
+        line = _dumps({"ts": time.time(), **record})
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, "ab")
+            self._file.write(line)
+            self._file.flush()
+
+    def session_started(self) -> None:
+        self._append({"type": "session", "pid": os.getpid()})
+
+    def library_learned(
+        self, library_name: str, sources: list[str], info: dict, crawl: bool = False
+    ) -> None:
+        self._append(
+            {
+                "type": "library",
+                "library": library_name,
+                "sources": sources,
+                "crawl": crawl,
+                "info": info,
+            }
+        )
+
+    def example_generated(self, library_name: str, example: dict) -> None:
+        self._append({"type": "example", "library": library_name, "example": example})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
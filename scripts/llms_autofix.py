@@ -1,15 +1,32 @@
 # llms_autofix.py — make a minimal spec‑compliant llms.txt from a loose draft
-import re, sys
+#
+# Single file:  python llms_autofix.py [llms.txt]        -> llms_fixed.txt
+# Pipe:         cat draft.txt | python llms_autofix.py - > llms.txt
+# Batch:        python llms_autofix.py artifacts/ -j 8    -> fixes every *-llms.txt
+#               in place and rebuilds its -llms-ctx*.txt siblings in-process.
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 LINK_RE = re.compile(r"^- \[(?P<title>[^\]]+)\]\((?P<url>[^\)]+)\)(?:: (?P<note>.*))?$")
-
-def has_link_bullets(lines):
-    return any(LINK_RE.match(l.strip()) for l in lines)
+MANIFEST = ".llms_autofix.json"
 
 def prompt_repo():
+    # The prompt goes to stderr so it never ends up in a piped `-o -` result.
+    print(
+        "Enter GitHub repo (https://github.com/<owner>/<repo>) for Docs links"
+        " (or leave blank): ",
+        end="",
+        file=sys.stderr,
+        flush=True,
+    )
     try:
-        repo = input("Enter GitHub repo (https://github.com/<owner>/<repo>) for Docs links (or leave blank): ").strip()
+        repo = input().strip()
     except KeyboardInterrupt:
         print("\nCanceled.")
         sys.exit(1)
@@ -18,89 +35,83 @@ def prompt_repo():
     repo = repo.rstrip("/").removesuffix(".git")
     return repo
 
-def main():
-    src = Path("llms.txt")
-    if not src.exists():
-        print("No llms.txt in current directory.")
-        sys.exit(1)
-    raw = src.read_text(encoding="utf-8", errors="replace")
+def repo_from_path(path):
+    """Guess the repo URL from the generator's <owner>/<repo>/<repo>-llms.txt layout."""
+    path = Path(path).resolve()
+    owner, repo = path.parent.parent.name, path.parent.name
+    if owner and repo and path.name.lower() == f"{repo.lower()}-llms.txt":
+        return f"https://github.com/{owner}/{repo}"
+    return None
 
-    lines = raw.splitlines()
-    out = []
+def fix_lines(lines, repo_fallback=None):
+    """Yield the fixed llms.txt line by line from an iterable of draft lines.
 
-    # 1) Ensure H1 on first non-empty line
-    i = 0
-    while i < len(lines) and not lines[i].strip():
-        i += 1
-    if i == len(lines):
-        print("Empty file.")
-        sys.exit(1)
+    One pass, no lookahead: Remember bullets are written as soon as their
+    section is known not to be a link section, so only the current section
+    and the (small) Docs/Optional link lists are ever held in memory.
+    """
+    lines = (line.rstrip("\r\n") for line in lines)
 
-    first = lines[i].strip()
+    # 1) Ensure H1 on first non-empty line
+    first = next((line.strip() for line in lines if line.strip()), None)
+    if first is None:
+        raise ValueError("Empty file.")
     if not first.startswith("# "):
         # Turn first line into title
-        title = first.lstrip("# ").strip() or "Project"
-        out.append(f"# {title}")
-        i += 1
-    else:
-        out.append(first)
-        i += 1
+        first = f"# {first.lstrip('# ').strip() or 'Project'}"
+    yield first
 
     # 2) Ensure a one-line blockquote summary (reuse next non-empty line)
-    while i < len(lines) and not lines[i].strip():
-        i += 1
-    summary = ""
-    if i < len(lines):
-        summary = lines[i].strip().lstrip("> ").strip()
-        i += 1
-    out += ["", f"> {summary or 'Project overview.'}", ""]
-
-    remember = []
+    summary = next((line.strip() for line in lines if line.strip()), "")
+    summary = summary.lstrip("> ").strip()
+    yield from ["", f"> {summary or 'Project overview.'}", ""]
+
     docs_section = []
     optional_section = []
-    current_is_links = False
+    remember_started = False
 
-    # 3) Parse the rest; non-link sections become Remember bullets
-    while i < len(lines):
-        l = lines[i]
-        i += 1
-        s = l.strip()
+    def remember(block):
+        # demote to Remember bullets
+        nonlocal remember_started
+        for bs in block:
+            if not remember_started:
+                yield from ["Remember:", ""]
+                remember_started = True
+            yield f"- {bs[2:]}" if bs.startswith("- ") else f"- {bs}"
 
+    # 3) Parse the rest; non-link sections become Remember bullets.
+    # A section's lines are held in ``pending`` only until its first link
+    # bullet (→ Docs/Optional) or the next heading (→ Remember) decides it.
+    target = None      # Docs/Optional list once the section has a link
+    pending = None     # undecided section lines; None outside any heading
+    for line in lines:
+        s = line.strip()
         if s.startswith("## "):
-            # entering a heading → check if the following bullets are links
-            # lookahead a few lines
-            block = []
-            while i < len(lines) and not lines[i].strip().startswith("## "):
-                block.append(lines[i]); i += 1
-            if has_link_bullets(block):
-                # treat as Docs (or Optional if header contains 'optional')
-                target = optional_section if "optional" in s.lower() else docs_section
-                for b in block:
-                    bs = b.strip()
-                    if bs and bs.startswith("- "):
-                        if LINK_RE.match(bs):
-                            target.append(bs)
-                continue
-            else:
-                # demote to Remember bullets
-                for b in block:
-                    bs = b.strip()
-                    if bs.startswith("- "):
-                        remember.append(bs[2:])
-                    elif bs:
-                        remember.append(bs)
-
-        else:
+            if pending:
+                yield from remember(pending)
+            target = None
+            heading = s
+            pending = []
+        elif target is not None:
+            if LINK_RE.match(s):
+                target.append(s)
+        elif pending is None:
             # free text outside headings → remember bullet if looks like a list
             if s.startswith("- "):
-                remember.append(s[2:])
-
-    if remember:
-        out += ["Remember:", ""] + [f"- {r}" for r in remember]
+                yield from remember([s])
+        elif LINK_RE.match(s):
+            # treat as Docs (or Optional if header contains 'optional')
+            target = optional_section if "optional" in heading.lower() else docs_section
+            target.append(s)
+            pending = []
+        elif s:
+            pending.append(s)
+    if pending:
+        yield from remember(pending)
 
     # 4) Ensure at least one Docs link
-    if not docs_section:
-        repo = prompt_repo()
+    if not docs_section and repo_fallback:
+        repo = repo_fallback()
         if repo:
             docs_section = [
                 f"- [README]({repo}#readme): Overview",
@@ -108,15 +119,204 @@ def main():
             ]
 
     if docs_section:
-        out += ["", "## Docs"] + docs_section
+        yield from ["", "## Docs"] + docs_section
 
     if optional_section:
-        out += ["", "## Optional"] + optional_section
+        yield from ["", "## Optional"] + optional_section
+
+def fix_text(raw, repo_fallback=None):
+    """Return the fixed llms.txt for ``raw``.
+
+    ``repo_fallback()`` supplies the Docs links if the draft has none.
+    """
+    return "\n".join(fix_lines(raw.splitlines(), repo_fallback)) + "\n"
+
+def write_ctx(fixed, ctx_path, ctx_full_path):
+    """Build both ctx files in-process (what `llms_txt2ctx` does on the CLI)."""
+    # Prefer the canonical API, but fall back if needed
+    try:
+        from llms_txt import create_ctx
+    except ImportError:
+        from llm_ctx.core import create_ctx
+    Path(ctx_path).write_text(create_ctx(fixed, optional=False), encoding="utf-8")
+    Path(ctx_full_path).write_text(create_ctx(fixed, optional=True), encoding="utf-8")
+
+def sha256(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def fix_artifact(path, build_ctx=True):
+    """Fix one ``<name>-llms.txt`` in place; returns (path, fixed text digest)."""
+    path = Path(path)
+    raw = path.read_text(encoding="utf-8", errors="replace")
+    fixed = fix_text(raw, repo_fallback=lambda: repo_from_path(path))
+    if fixed != raw:
+        path.write_text(fixed, encoding="utf-8")
+    if build_ctx:
+        stem = path.name[: -len("-llms.txt")]
+        write_ctx(
+            fixed,
+            path.with_name(f"{stem}-llms-ctx.txt"),
+            path.with_name(f"{stem}-llms-ctx-full.txt"),
+        )
+    return str(path), sha256(fixed)
+
+def fix_tree(root, jobs=None, build_ctx=True, force=False):
+    """Fix every ``*-llms.txt`` under ``root`` in a process pool.
+
+    Files whose content hash matches the manifest from the last run are skipped.
+    """
+    root = Path(root)
+    manifest_path = root / MANIFEST
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        manifest = {}
+
+    todo, skipped = [], 0
+    for path in sorted(root.rglob("*-llms.txt")):
+        key = path.relative_to(root).as_posix()
+        digest = sha256(path.read_text(encoding="utf-8", errors="replace"))
+        if not force and manifest.get(key) == digest:
+            skipped += 1
+            continue
+        todo.append(path)
+
+    fixed, failed = 0, 0
+    if todo:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = {pool.submit(fix_artifact, p, build_ctx): p for p in todo}
+            for fut in as_completed(futures):
+                path = futures[fut]
+                try:
+                    _, digest = fut.result()
+                except Exception as e:
+                    failed += 1
+                    print(f"❌ {path}: {e}")
+                    continue
+                fixed += 1
+                manifest[path.relative_to(root).as_posix()] = digest
+                print(f"✅ {path}")
+
+    manifest_path.write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    print(f"Fixed {fixed}, unchanged {skipped}, failed {failed}.")
+    return failed == 0
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Make spec-compliant llms.txt files from loose drafts"
+    )
+    parser.add_argument(
+        "path",
+        nargs="?",
+        default="llms.txt",
+        help="llms.txt draft ('-' for stdin), or a directory of *-llms.txt "
+        "artifacts (batch mode)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="Where to write the fixed file ('-' for stdout; default: "
+        "llms_fixed.txt, or stdout when reading stdin)",
+    )
+    parser.add_argument(
+        "--repo",
+        help="GitHub repo URL for fallback Docs links (skips the interactive prompt)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Worker processes in batch mode",
+    )
+    parser.add_argument(
+        "--ctx",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Build -llms-ctx*.txt files in-process (default: on in batch mode, "
+        "off for a single file)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-fix files whose content hash is unchanged since the last run",
+    )
+    args = parser.parse_args(argv)
+
+    if args.path != "-" and Path(args.path).is_dir():
+        ok = fix_tree(
+            args.path, jobs=args.jobs, build_ctx=args.ctx is not False, force=args.force
+        )
+        sys.exit(0 if ok else 1)
+
+    if args.repo:
+        repo = args.repo.rstrip("/").removesuffix(".git")
+
+        def repo_fallback():
+            return repo
+
+    elif args.path == "-":
+        repo_fallback = None  # stdin is the draft, so there is nobody to prompt
+    else:
+        repo_fallback = prompt_repo
+
+    if args.path == "-":
+        src = sys.stdin
+    elif Path(args.path).exists():
+        src = open(args.path, encoding="utf-8", errors="replace")
+    else:
+        print(f"No {args.path} found.")
+        sys.exit(1)
+
+    fixed_lines = fix_lines(src, repo_fallback)
+    try:
+        # Pull the title first so an empty draft fails before any output exists.
+        title = next(fixed_lines)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    output = args.output
+    if not output:
+        default = str(Path(args.path).with_name("llms_fixed.txt"))
+        output = "-" if args.path == "-" else default
+    dst = sys.stdout if output == "-" else open(output, "w", encoding="utf-8")
+    # Status messages must not end up in a piped result.
+    log = sys.stderr if output == "-" else sys.stdout
+    try:
+        # Each line is written as soon as the parser knows it.
+        dst.write(title + "\n")
+        for line in fixed_lines:
+            dst.write(line + "\n")
+        dst.flush()
+    except BrokenPipeError:
+        # Reader went away (e.g. `| head`); silence the flush at exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
 
-    Path("llms_fixed.txt").write_text("\n".join(out) + "\n", encoding="utf-8")
-    print("Wrote llms_fixed.txt (spec‑compliant). Now run:")
-    print("  llms_txt2ctx llms_fixed.txt > llms-ctx.txt")
-    print("  llms_txt2ctx --optional True llms_fixed.txt > llms-ctx-full.txt")
+    if output == "-":
+        if args.ctx:
+            print("--ctx needs an output file; skipped.", file=log)
+        return
+    if args.ctx:
+        out = Path(output)
+        fixed = out.read_text(encoding="utf-8")
+        write_ctx(
+            fixed, out.with_name("llms-ctx.txt"), out.with_name("llms-ctx-full.txt")
+        )
+        print(f"Wrote {out}, llms-ctx.txt and llms-ctx-full.txt.", file=log)
+        return
+    print(f"Wrote {output} (spec‑compliant). Now run:", file=log)
+    print(f"  llms_txt2ctx {output} > llms-ctx.txt", file=log)
+    print(f"  llms_txt2ctx --optional True {output} > llms-ctx-full.txt", file=log)
+    print("or re-run with --ctx to build them in-process.", file=log)
 
 if __name__ == "__main__":
     main()
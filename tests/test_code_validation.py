@@ -0,0 +1,116 @@
+import importlib.util
+import pathlib
+import sys
+import types
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+# Sibling modules are imported by name, as when run as a script.
+sys.path.insert(0, str(MODULE_DIR))
+
+# Stub out the GitHub helpers so main imports without network access.
+dummymod = types.ModuleType("repo_helpers")
+dummymod.agather_repository_info = lambda _client, _url: ("", {})
+sys.modules["repo_helpers"] = dummymod
+
+spec = importlib.util.spec_from_file_location(
+    "interactive_learning_main", MODULE_DIR / "main.py"
+)
+module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+spec = importlib.util.spec_from_file_location(
+    "code_validation", MODULE_DIR / "code_validation.py"
+)
+code_validation = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(code_validation)  # type: ignore[attr-defined]
+
+
+def test_generated_examples_are_validated_and_only_failures_regenerated():
+    agent = module.DocumentationLearningAgent(
+        example_concurrency=3, max_regenerations=1, example_cache_path=None
+    )
+    calls = []
+
+    def fake_generate(library_info, use_case, requirements=""):
+        calls.append((use_case, requirements))
+        if use_case == "typo" and "failed validation" not in requirements:
+            return {"code": "print('hi'", "imports": []}
+        if use_case == "hallucinated":
+            return {"code": "import fastapi_magic", "imports": ["fastapi_magic"]}
+        return {
+            "code": "import json\nprint(json.dumps({}))",
+            "imports": ["import json"],
+        }
+
+    agent._generate_code_example = fake_generate
+    results = agent.generate_examples({}, ["fine", "typo", "hallucinated"])
+    agent.validator.close()
+
+    # An import that is not installed here may be the library being learned:
+    # reported as unverified, not failed, and not regenerated.
+    assert [r["validation"]["status"] for r in results] == [
+        "passed",
+        "passed",
+        "unverified",
+    ]
+    assert results[2]["validation"]["errors"] == ["unresolved imports: fastapi_magic"]
+    assert sorted(use_case for use_case, _ in calls) == [
+        "fine",
+        "hallucinated",
+        "typo",
+        "typo",
+    ]
+    retry = [r for u, r in calls if u == "typo"][1]
+    assert "syntax error on line 1" in retry
+
+
+def test_fenced_examples_are_unwrapped_before_validation():
+    agent = module.DocumentationLearningAgent(example_cache_path=None)
+    calls = []
+
+    def fake_generate(library_info, use_case, requirements=""):
+        calls.append(use_case)
+        return {
+            "code": "```python\nimport json\nprint(json.dumps({}))\n```",
+            "imports": ["import json"],
+        }
+
+    agent._generate_code_example = fake_generate
+    try:
+        results = agent.generate_examples({}, ["fenced"])
+        # Workers never fork the threaded parent.
+        start_method = agent.validator.pool._mp_context.get_start_method()
+    finally:
+        agent.validator.close()
+
+    assert results[0]["validation"] == {"status": "passed", "errors": []}
+    assert calls == ["fenced"]
+    assert start_method in ("forkserver", "spawn")
+    broken = code_validation.check_example("```py\nprint('hi'\n```", [])
+    assert broken["errors"] == ["syntax error on line 1: '(' was never closed"]
+
+
+def test_check_example_runs_snippets_isolated_with_a_timeout():
+    check_example = code_validation.check_example
+
+    assert check_example("raise SystemExit(3)", [], execute=True)["status"] == "failed"
+    failed = check_example("import json\njson.loads('{')", ["json"], execute=True)
+    assert failed["errors"][0].startswith(
+        "execution failed: json.decoder.JSONDecodeError"
+    )
+    # A snippet that blocks (a server, a UI loop) is cut off: unverified, not
+    # failed.
+    blocking = check_example(
+        "import time\ntime.sleep(30)", [], execute=True, timeout=0.5
+    )
+    assert blocking == {
+        "status": "unverified",
+        "errors": ["execution timed out after 0.5s"],
+    }
@@ -0,0 +1,124 @@
+import importlib.util
+import pathlib
+import sys
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+sys.path.insert(0, str(MODULE_DIR))
+
+spec = importlib.util.spec_from_file_location(
+    "context_budget", MODULE_DIR / "context_budget.py"
+)
+context_budget = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(context_budget)  # type: ignore[attr-defined]
+
+
+def test_assemble_context_fills_budget_with_ranked_chunks():
+    filler = " ".join(f"changelog entry {i} fixed a typo." for i in range(80))
+    docs = [
+        {
+            "url": "https://d.example/changelog",
+            "content": f"# Changelog\n\n{filler}\n\n## Older\n\n{filler}\n",
+        },
+        {
+            "url": "https://d.example/reference",
+            "content": (
+                "# API Reference\n\nwidgetlib.Widget(name) creates a widget.\n\n"
+                "## Examples\n\n```python\nimport widgetlib\n"
+                "w = widgetlib.Widget('a')\n```\n"
+            ),
+        },
+    ]
+    budget = 150
+
+    content, report = context_budget.assemble_context(
+        docs, "widgetlib", max_tokens=budget
+    )
+
+    assert report["tokens_used"] <= budget < report["tokens_in"]
+    assert "API Reference" in content and "import widgetlib" in content
+    # Oversized changelog paragraphs are split, but full-size pieces lose to
+    # the reference; only what the budget leaves over goes to the changelog.
+    assert "changelog entry 0 " not in content
+    assert "SOURCE: https://d.example/reference" in content
+
+    # Sections are chunked at headings, in document order.
+    chunks = context_budget.chunk_document(docs[1])
+    assert [c["heading"] for c in chunks] == ["API Reference", "Examples"]
+
+
+def test_assemble_shards_packs_ranked_chunks_in_document_order():
+    def topic(i):
+        return "widgetlib" if i % 2 == 0 else "misc"
+
+    docs = [
+        {
+            "url": f"https://d.example/api/{i}",
+            "content": f"# Page {i}\n\n"
+            + " ".join(f"{topic(i)} note {i}.{j}" for j in range(60)),
+        }
+        for i in range(5)
+    ]
+
+    shards, report = context_budget.assemble_shards(
+        docs, "widgetlib", max_tokens=300, max_shards=3
+    )
+
+    assert report["shards"] == len(shards) == 3
+    assert all(context_budget.estimate_tokens(s) <= 300 + 20 for s in shards)
+    assert [s.split("\n")[0] for s in shards] == [
+        "SOURCE: https://d.example/api/0",
+        "SOURCE: https://d.example/api/2",
+        "SOURCE: https://d.example/api/4",
+    ]
+
+
+def test_assemble_shards_never_exceeds_max_shards():
+    # Three ~60-token pages fit the 2 x 100 token budget, but packed in
+    # document order each would need a shard of its own.
+    docs = [
+        {
+            "url": f"https://d.example/api/{i}",
+            "content": f"# Page {i}\n\n" + " ".join(["widgetlib usage"] * 15),
+        }
+        for i in range(3)
+    ]
+    assert all(context_budget.chunk_document(doc)[0]["tokens"] > 50 for doc in docs)
+
+    shards, report = context_budget.assemble_shards(
+        docs, "widgetlib", max_tokens=100, max_shards=2
+    )
+
+    assert len(shards) <= 2
+    assert report["shards"] == len(shards)
+    assert report["chunks_dropped"] == 1
+    assert report["chunks_used"] == 2
+    assert report["tokens_used"] <= 100 * 2
+
+
+def test_blocks_larger_than_the_budget_are_split_not_dropped():
+    body = "\n".join(f"widgetlib.call({i}, 'argument number {i}')" for i in range(300))
+    docs = [
+        {
+            "url": "https://d.example/api",
+            "content": f"# API\n\n```python\n{body}\n```\n",
+        }
+    ]
+
+    shards, report = context_budget.assemble_shards(
+        docs, "widgetlib", max_tokens=200, max_shards=3
+    )
+
+    chunks = context_budget.chunk_document(docs[0], 200)
+    assert len(chunks) > 3
+    assert all(c["tokens"] <= 200 for c in chunks)
+    # Every piece of the split code block is fenced on its own.
+    assert all(c["text"].count("```python\n") == 1 for c in chunks)
+    assert all(c["text"].endswith("\n```") for c in chunks)
+    assert 1 <= len(shards) <= 3 and report["chunks_used"] > 0
+    assert "widgetlib.call(0," in "".join(c["text"] for c in chunks)
@@ -0,0 +1,140 @@
+import asyncio
+import importlib.util
+import pathlib
+import sys
+import types
+
+import httpx
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+# Sibling modules are imported by name, as when run as a script.
+sys.path.insert(0, str(MODULE_DIR))
+
+# Stub out the GitHub helpers so main imports without network access.
+dummymod = types.ModuleType("repo_helpers")
+dummymod.agather_repository_info = lambda _client, _url: ("", {})
+sys.modules["repo_helpers"] = dummymod
+
+spec = importlib.util.spec_from_file_location(
+    "interactive_learning_main", MODULE_DIR / "main.py"
+)
+module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+spec = importlib.util.spec_from_file_location("crawler", MODULE_DIR / "crawler.py")
+crawler = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(crawler)  # type: ignore[attr-defined]
+
+
+def test_canonicalize_url_collapses_variants():
+    expected = "https://docs.example/guide"
+    for variant in (
+        "https://docs.example/guide/",
+        "HTTPS://Docs.Example:443/guide#install",
+        "https://docs.example/guide/index.html",
+    ):
+        assert crawler.canonicalize_url(variant) == expected
+    assert (
+        crawler.canonicalize_url("https://d.example/a?b=2&a=1")
+        == "https://d.example/a?a=1&b=2"
+    )
+
+
+def test_crawl_dedupes_urls_and_content_within_limits(monkeypatch):
+    site = {
+        "https://d.example/docs": [
+            "/docs/a",
+            "/docs/b/",
+            "/blog/post",
+            "/docs/logo.png",
+        ],
+        "https://d.example/docs/a": ["/docs/", "/docs/c"],
+        "https://d.example/docs/b": ["/docs/a#top"],
+        "https://d.example/docs/c": [],
+    }
+    contents = {"https://d.example/docs/b": "same as a"}
+    fetched = []
+
+    class FakeFetcher:
+        async def afetch_website_url(self, client, url, limiter):
+            key = crawler.canonicalize_url(url)
+            fetched.append(key)
+            return {
+                "url": url,
+                "content": contents.get(
+                    key, "same as a" if key.endswith("/a") else key
+                ),
+                "links": [f"https://d.example{link}" for link in site.get(key, [])],
+                "success": key in site,
+            }
+
+    async def no_sitemap(*args):
+        return []
+
+    monkeypatch.setattr(crawler, "_sitemap_urls", no_sitemap)
+    docs = asyncio.run(
+        crawler.acrawl_site(FakeFetcher(), None, None, "https://d.example/docs/")
+    )
+
+    # Each URL is fetched once; /blog and images are out of scope; page b has
+    # the same content as page a and is dropped.
+    assert sorted(fetched) == sorted(site)
+    assert [crawler.canonicalize_url(d["url"]) for d in docs] == [
+        "https://d.example/docs",
+        "https://d.example/docs/a",
+        "https://d.example/docs/c",
+    ]
+
+    fetched.clear()
+    docs = asyncio.run(
+        crawler.acrawl_site(
+            FakeFetcher(), None, None, "https://d.example/docs/", max_pages=2
+        )
+    )
+    assert len(docs) == 2
+
+
+def test_offline_crawl_reads_the_sitemap_from_the_cache(tmp_path):
+    def no_network(request):
+        raise AssertionError(f"network access in offline mode: {request.url}")
+
+    fetcher = module.DocumentationFetcher(
+        cache_path=str(tmp_path / "docs.sqlite"), offline=True
+    )
+    sitemap = (
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        "<url><loc>https://d.example/docs/a</loc></url>"
+        "<url><loc>https://d.example/blog/post</loc></url></urlset>"
+    )
+    fetcher.cache.put(
+        "https://d.example/sitemap.xml",
+        {},
+        sitemap.encode(),
+        {"url": "https://d.example/sitemap.xml", "content": sitemap, "success": True},
+        lifetime=3600,
+    )
+    for url in ("https://d.example/docs/", "https://d.example/docs/a"):
+        page = {"url": url, "title": url, "content": f"page {url}", "success": True}
+        fetcher.cache.put(url, {}, b"", page, lifetime=3600)
+
+    async def crawl():
+        transport = httpx.MockTransport(no_network)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await crawler.acrawl_site(
+                fetcher, client, module.HostRateLimiter(), "https://d.example/docs/"
+            )
+
+    docs = asyncio.run(crawl())
+    fetcher.close()
+
+    assert [d["url"] for d in docs] == [
+        "https://d.example/docs/",
+        "https://d.example/docs/a",
+    ]
@@ -0,0 +1,51 @@
+import importlib.util
+import pathlib
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+spec = importlib.util.spec_from_file_location("dedup", MODULE_DIR / "dedup.py")
+dedup = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(dedup)  # type: ignore[attr-defined]
+
+
+def test_dedupe_documents_removes_boilerplate_and_near_duplicates():
+    nav = "Home | Guide | API | Blog"
+    footer = "Copyright 2024 Example Corp. Edit this page on GitHub."
+
+    def body(topic):
+        return " ".join(f"{topic} detail number {i}." for i in range(60))
+
+    def page(heading, text):
+        return f"{nav}\n\n# {heading}\n\n{text}\n\n{footer}\n"
+
+    fenced = "```python\nx = 1\n\ny = 2\n```"
+    docs = [
+        {"url": "https://d.example/a", "content": page("A", body("alpha"))},
+        {"url": "https://d.example/b", "content": page("B", body("beta"))},
+        {
+            "url": "https://d.example/b?ref=x",
+            "content": page("B", f"{body('beta')} Extra."),
+        },
+        {"url": "https://d.example/c", "content": page("C", fenced)},
+    ]
+
+    result, report = dedup.dedupe_documents(docs)
+
+    assert [d["url"] for d in result] == [
+        "https://d.example/a",
+        "https://d.example/b",
+        "https://d.example/c",
+    ]
+    assert report["near_duplicate_pages"] == ["https://d.example/b?ref=x"]
+    # Shared nav/footer survive once, on the first page only.
+    assert nav in result[0]["content"] and footer in result[0]["content"]
+    assert nav not in result[1]["content"] and footer not in result[2]["content"]
+    # Fenced code is one block even with a blank line inside.
+    assert "```python\nx = 1\n\ny = 2\n```" in result[2]["content"]
+    assert report["boilerplate_blocks_removed"] == 4
+    assert report["bytes_saved"] == report["bytes_before"] - report["bytes_after"] > 0
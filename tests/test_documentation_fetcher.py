@@ -0,0 +1,134 @@
+import asyncio
+import importlib.util
+import pathlib
+import sys
+import types
+
+import httpx
+
+MODULE_PATH = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+    / "main.py"
+)
+
+# Sibling modules (html_convert) are imported by name, as when run as a script.
+sys.path.insert(0, str(MODULE_PATH.parent))
+
+# Stub out the GitHub helpers so the module imports without network access.
+dummymod = types.ModuleType("repo_helpers")
+dummymod.agather_repository_info = lambda _client, _url: ("", {})
+sys.modules["repo_helpers"] = dummymod
+
+spec = importlib.util.spec_from_file_location("interactive_learning_main", MODULE_PATH)
+module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+
+def test_fetch_documentation_keeps_input_order_across_hosts(monkeypatch):
+    fetcher = module.DocumentationFetcher(
+        min_interval=60, max_per_host=1, cache_path=None
+    )
+    urls = [f"https://host{i}.example/page" for i in range(6)]
+    inside, all_inside = set(), asyncio.Event()
+
+    async def fake_fetch(client, url, limiter):
+        async with limiter.slot(url):
+            # Every host holds its slot at once: none waits on another's
+            # politeness delay.
+            inside.add(url)
+            if len(inside) == len(urls):
+                all_inside.set()
+            await asyncio.wait_for(all_inside.wait(), timeout=5)
+        return {"url": url, "success": True}
+
+    monkeypatch.setattr(fetcher, "afetch_website_url", fake_fetch)
+    results = fetcher.fetch_documentation(urls)
+
+    assert [r["url"] for r in results] == urls
+
+
+def test_host_rate_limiter_spaces_same_host_requests(monkeypatch):
+    # A frozen clock: the limiter's requested sleeps are the start offsets.
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(round(delay, 6))
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(module, "time", types.SimpleNamespace(monotonic=lambda: 100.0))
+    monkeypatch.setattr(
+        module,
+        "asyncio",
+        types.SimpleNamespace(Semaphore=asyncio.Semaphore, sleep=fake_sleep),
+    )
+    limiter = module.HostRateLimiter(max_per_host=2, min_interval=0.1)
+
+    async def hit(url):
+        async with limiter.slot(url):
+            pass
+
+    async def run():
+        await asyncio.gather(*(hit("https://docs.example/a") for _ in range(3)))
+        await hit("https://other.example/a")
+
+    asyncio.run(run())
+
+    # Same-host starts are 0.1s apart; another host does not wait at all.
+    assert sorted(sleeps) == [0.1, 0.2]
+
+
+def test_circuit_breaker_fails_fast_after_repeated_errors():
+    requests = []
+
+    def handler(request):
+        requests.append(str(request.url))
+        return httpx.Response(503, headers={"Retry-After": "0"})
+
+    fetcher = module.DocumentationFetcher(
+        max_retries=3,
+        delay=0.01,
+        breaker_threshold=2,
+        breaker_reset=60,
+        cache_path=None,
+    )
+
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return [
+                await fetcher.afetch_website_url(client, f"https://flaky.example/{i}")
+                for i in range(3)
+            ]
+
+    results = asyncio.run(run())
+
+    assert [r["success"] for r in results] == [False, False, False]
+    # Two failures open the circuit; later pages never reach the host.
+    assert requests == ["https://flaky.example/0", "https://flaky.example/0"]
+    assert fetcher.fetch_stats == {"retries": 1, "hedged": 0, "circuit_open": 2}
+
+
+def test_pages_convert_in_workers_started_without_fork():
+    html = "<html><head><title>Guide</title></head><body><h1>Intro</h1></body></html>"
+
+    def handler(request):
+        return httpx.Response(200, text=html, headers={"Content-Type": "text/html"})
+
+    fetcher = module.DocumentationFetcher(cache_path=None, convert_workers=1)
+
+    async def run():
+        transport = httpx.MockTransport(handler)
+        async with httpx.AsyncClient(transport=transport) as client:
+            return await fetcher.afetch_website_url(client, "https://docs.example/")
+
+    try:
+        document = asyncio.run(run())
+        start_method = fetcher.convert_pool._mp_context.get_start_method()
+    finally:
+        fetcher.close()
+
+    assert document["success"] and "# Intro" in document["content"]
+    assert start_method in ("forkserver", "spawn")
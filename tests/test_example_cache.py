@@ -0,0 +1,126 @@
+import importlib.util
+import pathlib
+import sqlite3
+import sys
+import types
+
+import dspy
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+# Sibling modules are imported by name, as when run as a script.
+sys.path.insert(0, str(MODULE_DIR))
+
+# Stub out the GitHub helpers so main imports without network access.
+dummymod = types.ModuleType("repo_helpers")
+dummymod.agather_repository_info = lambda _client, _url: ("", {})
+sys.modules["repo_helpers"] = dummymod
+
+spec = importlib.util.spec_from_file_location(
+    "interactive_learning_main", MODULE_DIR / "main.py"
+)
+module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+
+def test_generate_example_serves_near_duplicate_use_cases_from_cache(tmp_path):
+    path = str(tmp_path / "examples.sqlite")
+    info = {
+        "library": "FastAPI",
+        "core_concepts": ["routing"],
+        "patterns": [],
+        "methods": [],
+        "installation": "pip install fastapi",
+    }
+    calls = []
+
+    def fake_generate_code(library_info, use_case, requirements):
+        calls.append(use_case)
+        return dspy.Prediction(
+            code_example=f"# {use_case}",
+            explanation="",
+            best_practices=[],
+            imports_needed=[],
+        )
+
+    agent = module.DocumentationLearningAgent(
+        example_cache_path=path, validate_examples=False
+    )
+    agent.generate_code = fake_generate_code
+
+    first = agent.generate_example(info, "Basic setup and hello world example")
+    assert agent.generate_example(info, "Basic Setup & Hello World") == first
+    assert agent.generate_example(info, "  basic setup and hello-world!") == first
+    # Different use case, requirements or analysis: generated afresh.
+    agent.generate_example(info, "Database integration with SQLAlchemy")
+    agent.generate_example(info, "Database integration")
+    agent.generate_example(info, "Basic setup and hello world", requirements="async")
+    agent.generate_example(
+        {**info, "methods": ["FastAPI.get"]}, "Basic setup and hello world"
+    )
+    assert len(calls) == 5
+    agent.example_cache.close()
+
+    # The cache persists across agents; a failing cached example is dropped.
+    again = module.DocumentationLearningAgent(
+        example_cache_path=path, validate_examples=False
+    )
+    again.generate_code = fake_generate_code
+    assert again.generate_example(info, "Hello world basic setup") == first
+    again.example_cache.discard(info, "Basic setup and hello world")
+    again.generate_example(info, "Basic setup and hello world")
+    assert len(calls) == 6
+    again.example_cache.close()
+
+
+def test_example_cache_needs_shared_words_not_just_similar_spelling(tmp_path):
+    cache = module.ExampleCache(str(tmp_path / "examples.sqlite"))
+    info = {"library": "httpx"}
+    cache.put(info, "async http client", "", {"code": "async"})
+
+    assert cache.get(info, "Async HTTP client example") == {"code": "async"}
+    assert cache.get(info, "sync http client") is None
+    cache.close()
+
+
+def test_regenerated_examples_are_cached_under_the_original_requirements(tmp_path):
+    path = str(tmp_path / "examples.sqlite")
+    seen = []
+
+    def fake_generate_code(library_info, use_case, requirements):
+        seen.append(requirements)
+        broken = "failed validation" not in requirements
+        return dspy.Prediction(
+            code_example="print('hi'" if broken else "print('hi')",
+            explanation="",
+            best_practices=[],
+            imports_needed=[],
+        )
+
+    agent = module.DocumentationLearningAgent(
+        example_cache_path=path, max_regenerations=1
+    )
+    agent.generate_code = fake_generate_code
+    info = {
+        "library": "demo",
+        "core_concepts": [],
+        "patterns": [],
+        "methods": [],
+        "installation": "",
+    }
+
+    [result] = agent.generate_examples(info, ["hello"])
+    agent.validator.close()
+    agent.example_cache.close()
+
+    assert result["validation"]["status"] == "passed"
+    assert len(seen) == 2
+    with sqlite3.connect(path) as db:
+        rows = db.execute("SELECT use_case, requirements FROM examples").fetchall()
+    # The validation feedback is never a cache key.
+    assert rows == [("hello", "")]
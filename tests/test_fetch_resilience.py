@@ -0,0 +1,35 @@
+import asyncio
+import importlib.util
+import pathlib
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+spec = importlib.util.spec_from_file_location(
+    "fetch_resilience", MODULE_DIR / "fetch_resilience.py"
+)
+fetch_resilience = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(fetch_resilience)  # type: ignore[attr-defined]
+
+
+def test_hedged_request_beats_a_straggler():
+    latency = fetch_resilience.LatencyTracker(min_samples=4)
+    for _ in range(10):
+        latency.record(0.02)
+    attempts = []
+
+    async def request():
+        attempt = len(attempts)
+        attempts.append(attempt)
+        if attempt == 0:
+            await asyncio.Event().wait()  # the straggler never answers
+        return attempt
+
+    result = asyncio.run(fetch_resilience.hedged(request, latency.percentile(95)))
+
+    assert result == (1, True)
+    assert attempts == [0, 1]
@@ -0,0 +1,108 @@
+import importlib.util
+import pathlib
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+spec = importlib.util.spec_from_file_location(
+    "html_convert", MODULE_DIR / "html_convert.py"
+)
+html_convert = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(html_convert)  # type: ignore[attr-defined]
+
+
+def test_html_to_document_strips_chrome_in_one_pass():
+    html = (
+        "<html><head><title> Guide </title><style>p {}</style></head><body>"
+        "<header>Site</header><nav><ul><li>Menu</li></ul></nav>"
+        "<h1>Intro</h1><p>Use <code>run()</code>.</p>"
+        "<script>var x = '<p>';</script><footer>Copyright</footer></body></html>"
+    )
+    doc = html_convert.html_to_document("https://docs.example/guide", html)
+
+    assert doc["title"] == "Guide"
+    assert "# Intro" in doc["content"]
+    assert "`run()`" in doc["content"]
+    for chrome in ("Site", "Menu", "var x", "Copyright"):
+        assert chrome not in doc["content"]
+    assert doc["convert_ms"] >= 0
+
+
+def test_html_to_document_keeps_main_article_and_reports_ratio():
+    sidebar = "".join(
+        f'<li><a href="/api/{i}">API item {i}</a></li>' for i in range(40)
+    )
+    para = (
+        "<p>Declare request bodies with type hints, and get validation, docs, "
+        "and editor support.</p>"
+    )
+    html = (
+        "<html><head><title>Bodies</title></head><body>"
+        '<div class="cookie-banner">'
+        "We use cookies to improve your experience here.</div>"
+        f'<div class="wrapper"><div class="md-sidebar"><ul>{sidebar}</ul></div>'
+        f'<div class="md-content"><article><h1>Request Body</h1>{para * 5}'
+        "<pre><code>app = FastAPI()</code></pre>"
+        '<div class="toc"><ul><li><a href="#a">Section A</a></li></ul></div>'
+        f'{para}<a title="Edit this page" href="https://github.com/edit">Edit</a>'
+        "</article></div></div></body></html>"
+    )
+    doc = html_convert.html_to_document("https://docs.example/body", html)
+    full = html_convert.html_to_document(
+        "https://docs.example/body", html, main_content=False
+    )
+
+    assert "# Request Body" in doc["content"] and "app = FastAPI()" in doc["content"]
+    for chrome in ("API item", "cookies", "Section A", "Edit"):
+        assert chrome in full["content"]
+        assert chrome not in doc["content"]
+    assert 0.2 < doc["content_ratio"] < 0.8
+    assert full["content_ratio"] == 1.0
+    # Links from dropped chrome still map the site for the crawler.
+    assert "https://docs.example/api/7" in doc["links"]
+
+
+def test_autodoc_page_keeps_every_signature_and_the_title():
+    long_doc = (
+        "<p>Render a widget to HTML, resolving its template, theme and "
+        "children first, then caching the result by widget id, so that "
+        "repeated renders of the same widget are cheap. Raises RenderError "
+        "when the template is missing, or when a child fails to render, and "
+        "logs the widget path, template name and theme for debugging.</p>"
+    )
+
+    def entry(name, signature, body):
+        return (
+            f'<dl class="py function"><dt class="sig sig-object py" '
+            f'id="widgetlib.{name}"><span class="sig-name">{signature}</span>'
+            f'<a class="headerlink" href="#widgetlib.{name}">¶</a></dt>'
+            f"<dd>{body}</dd></dl>"
+        )
+
+    sidebar = "".join(f'<li><a href="/api/{i}">Module {i}</a></li>' for i in range(30))
+    section = (
+        '<section id="module-widgetlib"><h1>widgetlib API</h1>'
+        + entry("render", "render(widget)", long_doc)
+        + entry("find", "find(query)", "<p>Find widgets.</p>")
+        + entry("Widget", "Widget(name)", "<p>A widget.</p>")
+        + "</section>"
+    )
+
+    for main_attrs in (' role="main"', ""):
+        html = (
+            "<html><head><title>API</title></head><body>"
+            '<div class="sphinxsidebar" role="navigation" '
+            f'aria-label="main navigation"><ul>{sidebar}</ul></div>'
+            f'<div class="document"><div class="body"{main_attrs}>{section}</div>'
+            "</div></body></html>"
+        )
+        doc = html_convert.html_to_document("https://docs.example/api", html)
+
+        for kept in ("# widgetlib API", "render(widget)", "find(query)"):
+            assert kept in doc["content"], (main_attrs, kept)
+        assert "Widget(name)" in doc["content"] and "A widget." in doc["content"]
+        assert "Module 7" not in doc["content"]
@@ -0,0 +1,45 @@
+import importlib.util
+import pathlib
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+spec = importlib.util.spec_from_file_location(
+    "http_cache", MODULE_DIR / "http_cache.py"
+)
+http_cache = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(http_cache)  # type: ignore[attr-defined]
+
+
+def test_freshness_lifetime_honors_cache_control():
+    lifetime = http_cache.freshness_lifetime
+
+    assert lifetime({"cache-control": "public, max-age=600"}) == 600
+    assert lifetime({"cache-control": "no-cache", "etag": '"x"'}) == 0
+    assert lifetime({"cache-control": "no-store"}) is None
+    assert lifetime({}) == 0
+
+
+def test_http_cache_round_trip_and_lru_eviction(tmp_path):
+    cache = http_cache.HttpCache(tmp_path / "docs.sqlite", max_bytes=450)
+    doc = {"url": "https://a", "content": "x" * 50, "success": True}
+    headers = {"etag": '"v1"', "cache-control": "max-age=60"}
+    cache.put("https://a", headers, b"a" * 100, doc)
+
+    entry = cache.get("https://a")
+    assert entry.fresh
+    assert entry.body == b"a" * 100
+    assert entry.document == doc
+    assert entry.validators() == {"If-None-Match": '"v1"'}
+
+    # "https://a" was read most recently, so the unread "https://b" is evicted.
+    cache.put("https://b", {}, b"b" * 100, doc, lifetime=60)
+    cache.get("https://a")
+    cache.put("https://c", {}, b"c" * 100, doc, lifetime=60)
+    assert cache.get("https://b") is None
+    assert cache.get("https://a") is not None
+    assert cache.get("https://c") is not None
@@ -0,0 +1,86 @@
+import importlib.util
+import io
+import json
+import pathlib
+import types
+
+MODULE_PATH = (
+    pathlib.Path(__file__).parent.parent
+    / "tutorials"
+    / "multi-llmtxt_generator"
+    / "instrumentation.py"
+)
+
+spec = importlib.util.spec_from_file_location("instrumentation", MODULE_PATH)
+module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+
+def read_spans(stream):
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_nested_spans_roll_up_counters():
+    stream = io.StringIO()
+    recorder = module.SpanRecorder(stream)
+
+    with recorder.span("parent"):
+        with recorder.span("child") as child:
+            child["bytes_fetched"] = 10
+            recorder.add(prompt_tokens=5)
+
+    child, parent = read_spans(stream)
+    assert child["parent_id"] == parent["span_id"]
+    assert child["status"] == "ok"
+    assert parent["bytes_fetched"] == 10
+    assert parent["prompt_tokens"] == 5
+    assert parent["duration_ms"] >= child["duration_ms"]
+
+
+def test_span_records_errors():
+    stream = io.StringIO()
+    recorder = module.SpanRecorder(stream)
+
+    try:
+        with recorder.span("boom"):
+            raise RuntimeError("nope")
+    except RuntimeError:
+        pass
+
+    (span,) = read_spans(stream)
+    assert span["status"] == "error"
+    assert "nope" in span["error"]
+
+
+def test_lm_callback_charges_usage_to_open_span():
+    stream = io.StringIO()
+    recorder = module.SpanRecorder(stream)
+    callback = module.LMUsageCallback(recorder)
+    lm = types.SimpleNamespace(
+        history=[
+            {
+                "usage": {"prompt_tokens": 120, "completion_tokens": 30},
+                "response": types.SimpleNamespace(cache_hit=True),
+            }
+        ]
+    )
+
+    with recorder.span("analyze_repo"):
+        callback.on_lm_start("call-1", lm, {})
+        callback.on_lm_end("call-1", ["out"])
+        callback.on_adapter_parse_end("call-2", None, ValueError("bad json"))
+
+    (span,) = read_spans(stream)
+    assert span["lm_calls"] == 1
+    assert span["prompt_tokens"] == 120
+    assert span["completion_tokens"] == 30
+    assert span["cache_hits"] == 1
+    assert span["parse_failures"] == 1
+
+
+def test_disabled_recorder_is_silent():
+    recorder = module.SpanRecorder()
+    assert not recorder.enabled
+    with recorder.span("noop") as span:
+        span["bytes_fetched"] = 1
@@ -0,0 +1,64 @@
+import os
+import pathlib
+import subprocess
+import sys
+import time
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+# Wall-clock budget from `python main.py` to its first prompt. Nearly all of
+# it is `import dspy`; anything built at import time would blow it.
+STARTUP_BUDGET_S = 5.0
+
+IMPORT_CHECK = """
+import socket, sys
+def refuse(*args, **kwargs):
+    raise AssertionError("network access during import")
+socket.socket.connect = refuse
+sys.path.insert(0, ".")
+import main, learn_library, generate_examples, interactive_learning
+import dspy
+assert dspy.settings.lm is None, "LM configured at import time"
+assert main._agent is None
+"""
+
+
+def test_helper_modules_import_without_side_effects():
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_CHECK],
+        cwd=MODULE_DIR,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    # Importing must not start learning or generating anything.
+    assert "Learning" not in result.stdout and "Generating" not in result.stdout
+
+
+def test_cli_reaches_first_prompt_within_budget(tmp_path):
+    proc = subprocess.Popen(
+        [sys.executable, "-u", "main.py"],
+        cwd=MODULE_DIR,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        env={**os.environ, "LEARNING_JOURNAL": str(tmp_path / "session.jsonl")},
+    )
+    t0 = time.perf_counter()
+    output = ""
+    try:
+        while "Enter the library name" not in output:
+            char = proc.stdout.read(1)
+            assert char, f"CLI exited before prompting: {output!r}"
+            output += char
+        elapsed = time.perf_counter() - t0
+        proc.communicate("quit\n", timeout=30)
+    finally:
+        proc.kill()
+    assert elapsed < STARTUP_BUDGET_S, f"first prompt after {elapsed:.2f}s"
@@ -0,0 +1,96 @@
+import importlib.util
+import pathlib
+import sys
+import threading
+import types
+
+import dspy
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+# Sibling modules are imported by name, as when run as a script.
+sys.path.insert(0, str(MODULE_DIR))
+
+# Stub out the GitHub helpers so main imports without network access.
+dummymod = types.ModuleType("repo_helpers")
+dummymod.agather_repository_info = lambda _client, _url: ("", {})
+sys.modules["repo_helpers"] = dummymod
+
+spec = importlib.util.spec_from_file_location(
+    "interactive_learning_main", MODULE_DIR / "main.py"
+)
+module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+
+def test_learn_from_urls_reuses_stored_analysis(tmp_path):
+    agent = module.DocumentationLearningAgent(
+        knowledge_path=str(tmp_path / "knowledge.sqlite"), knowledge_ttl=3600
+    )
+    pages = {
+        "https://d.example/docs/": "# Widget\n\nwidgetlib.Widget() builds widgets."
+    }
+    fetches, analyses = [], []
+
+    class FakeFetcher:
+        def fetch_documentation(self, urls, crawl=False):
+            fetches.append(urls)
+            return [{"url": u, "content": pages[u], "success": True} for u in urls]
+
+    def fake_analyze(library_name, shards):
+        analyses.append(shards)
+        return dspy.Prediction(
+            core_concepts=["Widget"],
+            common_patterns=[],
+            key_methods=[],
+            installation_info="pip install widgetlib",
+            code_examples=[],
+        )
+
+    agent.fetcher = FakeFetcher()
+    agent.analyze_shards = fake_analyze
+
+    first = agent.learn_from_urls("widgetlib", ["https://d.example/docs/"])
+    # Same library and sources (modulo URL normalization): no fetch, no LM.
+    again = agent.learn_from_urls("WidgetLib", ["https://D.example/docs"])
+    assert again == first and len(fetches) == 1 and len(analyses) == 1
+
+    # Past the TTL the docs are re-fetched, but unchanged docs skip the LM.
+    agent.knowledge.ttl = 0
+    assert agent.learn_from_urls("widgetlib", ["https://d.example/docs/"]) == first
+    assert len(fetches) == 2 and len(analyses) == 1
+
+    pages["https://d.example/docs/"] += "\n\nNew in 2.0: Widget.resize()."
+    agent.learn_from_urls("widgetlib", ["https://d.example/docs/"])
+    assert len(fetches) == 3 and len(analyses) == 2
+
+
+def test_knowledge_store_is_safe_to_share_between_threads(tmp_path):
+    store = module.KnowledgeStore(str(tmp_path / "knowledge.sqlite"), ttl=3600)
+    start, errors = threading.Barrier(8), []
+
+    def work(i):
+        try:
+            start.wait(timeout=5)
+            for j in range(50):
+                urls = [f"https://d.example/{i}/{j}"]
+                store.put(f"lib{i}", urls, False, "fp", {"n": j})
+                stored = store.get(f"lib{i}", urls)
+                store.touch(stored)
+                assert stored.info == {"n": j}
+        except Exception as e:  # surfaced in the main thread below
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.close()
+
+    assert errors == []
@@ -0,0 +1,274 @@
+import asyncio
+import importlib.util
+import pathlib
+import sys
+import threading
+import time
+import types
+
+import dspy
+import httpx
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+# Sibling modules are imported by name, as when run as a script.
+sys.path.insert(0, str(MODULE_DIR))
+
+# Stub out the GitHub helpers so main imports without network access.
+dummymod = types.ModuleType("repo_helpers")
+dummymod.agather_repository_info = lambda _client, _url: ("", {})
+sys.modules["repo_helpers"] = dummymod
+
+spec = importlib.util.spec_from_file_location(
+    "interactive_learning_main", MODULE_DIR / "main.py"
+)
+module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+
+def test_analyze_shards_merges_partial_analyses():
+    agent = module.DocumentationLearningAgent(analysis_concurrency=2)
+    partials = [
+        dspy.Prediction(
+            core_concepts=["Widget", "Registry"],
+            common_patterns=["build then render"],
+            key_methods=["Widget.render()"],
+            installation_info="pip install widgetlib",
+            code_examples=["w = Widget()"],
+        ),
+        None,  # a failed shard
+        dspy.Prediction(
+            core_concepts=["registry", "Plugin"],
+            common_patterns=[],
+            key_methods=["Widget.render()", "register()"],
+            installation_info="pip install widgetlib",
+            code_examples=["w = Widget()"],
+        ),
+    ]
+    calls = {}
+
+    class FakeAnalyzer:
+        def batch(self, examples, num_threads, **kwargs):
+            calls["shards"] = [e.documentation_content for e in examples]
+            calls["num_threads"] = num_threads
+            calls["timeout"] = kwargs["timeout"]
+            return partials, [examples[1]], [RuntimeError("boom")]
+
+    agent.analyze_docs = FakeAnalyzer()
+    merged = agent.analyze_shards("widgetlib", ["s1", "s2", "s3"])
+
+    # timeout=0: a slow shard is never resubmitted as a straggler.
+    assert calls == {"shards": ["s1", "s2", "s3"], "num_threads": 2, "timeout": 0}
+    assert merged.core_concepts == ["Registry", "Widget", "Plugin"]
+    assert merged.key_methods == ["Widget.render()", "register()"]
+    assert merged.code_examples == ["w = Widget()"]
+    assert merged.installation_info == "pip install widgetlib"
+
+
+def test_generate_examples_runs_concurrently_in_order_with_isolated_errors():
+    agent = module.DocumentationLearningAgent(
+        example_concurrency=5, validate_examples=False
+    )
+    # All five generations must be in flight at once to get past the barrier.
+    all_running = threading.Barrier(5, timeout=5)
+
+    def fake_generate(library_info, use_case, requirements=""):
+        all_running.wait()
+        if use_case == "broken":
+            raise RuntimeError("backend hiccup")
+        return {"code": f"# {use_case}", "requirements": requirements}
+
+    agent.generate_example = fake_generate
+    results = agent.generate_examples(
+        {}, ["first", "broken", ("third", "fast"), "fourth", "fifth"], requirements="r"
+    )
+
+    assert [r["use_case"] for r in results] == [
+        "first",
+        "broken",
+        "third",
+        "fourth",
+        "fifth",
+    ]
+    assert results[1] == {"use_case": "broken", "error": "RuntimeError: backend hiccup"}
+    assert results[0]["requirements"] == "r" and results[2]["requirements"] == "fast"
+
+
+def test_iter_examples_generates_ahead_and_cancels_on_close():
+    agent = module.DocumentationLearningAgent(
+        example_concurrency=2, validate_examples=False
+    )
+    cases = [f"case {i}" for i in range(6)]
+    gates = {case: threading.Event() for case in cases}
+    started, starts = [], threading.Semaphore(0)
+
+    def fake_generate(library_info, use_case, requirements=""):
+        started.append(use_case)
+        starts.release()
+        assert gates[use_case].wait(timeout=5)
+        return {"code": f"# {use_case}"}
+
+    def wait_for_starts(count):
+        for _ in range(count):
+            assert starts.acquire(timeout=5)
+
+    agent.generate_example = fake_generate
+    reported = []
+    examples = agent.iter_examples(
+        {}, cases, on_example=lambda e: reported.append(e["use_case"])
+    )
+
+    gates["case 0"].set()
+    assert next(examples) == {"use_case": "case 0", "code": "# case 0"}
+    # While the reader looks at case 0, cases 1-2 are already generating.
+    wait_for_starts(3)
+    assert sorted(started) == ["case 0", "case 1", "case 2"]
+
+    gates["case 1"].set()
+    assert next(examples)["use_case"] == "case 1"
+    wait_for_starts(1)
+    gates["case 2"].set()
+    gates["case 3"].set()
+    examples.close()
+
+    # Only the lookahead window ever started; the rest were cancelled, and
+    # close waited for the running ones to report.
+    assert sorted(started) == ["case 0", "case 1", "case 2", "case 3"]
+    assert sorted(reported) == sorted(started)
+
+
+def test_session_prefetcher_runs_jobs_after_queued_prefetches(monkeypatch):
+    fetcher = module.DocumentationFetcher(cache_path=None)
+    fetching, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fake_fetch(urls, crawl=False):
+        fetching.set()
+        assert release.wait(timeout=5)
+        calls.append(list(urls))
+        return []
+
+    monkeypatch.setattr(fetcher, "fetch_documentation", fake_fetch)
+    prefetcher = module.SessionPrefetcher(fetcher)
+    prefetcher.prefetch("https://docs.example/a")
+    assert fetching.wait(timeout=5)
+    prefetcher.prefetch("https://docs.example/b")
+    prefetcher.prefetch("https://docs.example/c")
+    job = prefetcher.submit(lambda: [url for batch in calls for url in batch])
+    release.set()
+
+    assert job.result(timeout=5) == [
+        "https://docs.example/a",
+        "https://docs.example/b",
+        "https://docs.example/c",
+    ]
+    # URLs queued while a fetch runs are batched into the next one.
+    assert calls == [
+        ["https://docs.example/a"],
+        ["https://docs.example/b", "https://docs.example/c"],
+    ]
+    prefetcher.close()
+
+
+def test_session_prefetcher_fetches_each_url_once_and_quietly(monkeypatch, capsys):
+    html = "<html><head><title>Guide</title></head><body><h1>Intro</h1></body></html>"
+    requests = []
+
+    def handler(request):
+        requests.append(str(request.url))
+        return httpx.Response(200, text=html, headers={"Content-Type": "text/html"})
+
+    agent = module.DocumentationLearningAgent(knowledge_path=None)
+    agent.fetcher = module.DocumentationFetcher(cache_path=None, max_retries=1)
+    monkeypatch.setattr(
+        agent.fetcher,
+        "new_client",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    learned = {}
+
+    def fake_learn(library_name, doc_urls, crawl, docs, stored=None):
+        learned["docs"] = docs
+        return {"library": library_name}
+
+    monkeypatch.setattr(agent, "_learn_from_docs", fake_learn)
+    prefetcher = module.SessionPrefetcher(agent.fetcher)
+    try:
+        prefetcher.prefetch("https://docs.example/guide")
+        job = prefetcher.submit(
+            prefetcher.learn, agent, "widgetlib", ["https://docs.example/guide"]
+        )
+        assert job.result(timeout=30) == {"library": "widgetlib"}
+    finally:
+        prefetcher.close()
+        agent.fetcher.close()
+
+    assert requests == ["https://docs.example/guide"]
+    assert "# Intro" in learned["docs"][0]["content"]
+    out = capsys.readouterr().out
+    assert "Learning about widgetlib" in out
+    assert "Fetching Website" not in out
+
+
+def test_learn_libraries_overlaps_jobs_under_a_global_lm_limit():
+    from dspy.utils import DummyLM
+
+    lock, active, peak = threading.Lock(), [0], [0]
+    lm = DummyLM([{"answer": "ok"}] * 10)
+    forward = lm.forward
+
+    def slow_forward(*args, **kwargs):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.05)  # a window for a second call to show up in
+        try:
+            return forward(*args, **kwargs)
+        finally:
+            with lock:
+                active[0] -= 1
+
+    lm.forward = slow_forward
+
+    agent = module.DocumentationLearningAgent(knowledge_path=None, lm_concurrency=1)
+    fetching, both_fetching = set(), asyncio.Event()
+
+    async def fake_fetch(urls, crawl=False, limiter=None, client=None):
+        # Each library's fetch only finishes once the other's has started.
+        fetching.add(urls[0])
+        if len(fetching) == 2:
+            both_fetching.set()
+        await asyncio.wait_for(both_fetching.wait(), timeout=5)
+        return [{"url": url, "success": True, "content": url} for url in urls]
+
+    def fake_learn(library_name, urls, crawl, docs, stored=None):
+        predict = dspy.Predict("question -> answer")
+        for i in range(2):
+            predict(question=f"{library_name} {i}")
+        return {"library": library_name}
+
+    agent.fetcher.afetch_documentation = fake_fetch
+    agent._learn_from_docs = fake_learn
+    with dspy.context(lm=lm):
+        results = agent.learn_libraries(
+            [
+                {"library": "alpha", "urls": ["https://alpha.example/"]},
+                {"library": "beta", "urls": ["https://beta.example/"]},
+                {"library": "broken", "urls": []},
+            ]
+        )
+
+    assert [r["library"] for r in results] == ["alpha", "beta", "broken"]
+    assert results[0] == {
+        "library": "alpha",
+        "library_info": {"library": "alpha"},
+        "examples": [],
+    }
+    assert "error" in results[2]
+    # LM calls never exceed the limit.
+    assert peak[0] == 1
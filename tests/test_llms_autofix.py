@@ -0,0 +1,100 @@
+import importlib.util
+import io
+import pathlib
+import sys
+
+MODULE_PATH = pathlib.Path(__file__).parent.parent / "scripts" / "llms_autofix.py"
+
+spec = importlib.util.spec_from_file_location("llms_autofix", MODULE_PATH)
+module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+# Registered so the batch mode's process pool can pickle module functions.
+sys.modules["llms_autofix"] = module
+assert spec and spec.loader
+spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+DRAFT = """
+Demo Project
+
+A tiny demo.
+
+## Concepts
+- Sandboxes
+- Templates
+
+## Docs
+- [README](https://example.com/readme): overview
+- not a link
+
+## Optional
+- [License](https://example.com/license): legal
+"""
+
+FIXED = """# Demo Project
+
+> A tiny demo.
+
+Remember:
+
+- Sandboxes
+- Templates
+
+## Docs
+- [README](https://example.com/readme): overview
+
+## Optional
+- [License](https://example.com/license): legal
+"""
+
+
+def test_fix_text_builds_docs_optional_and_remember():
+    assert module.fix_text(DRAFT) == FIXED
+
+
+def test_fix_lines_streams_from_file_objects():
+    lines = module.fix_lines(io.StringIO(DRAFT))
+    assert next(lines) == "# Demo Project"
+    assert "\n".join(["# Demo Project", *lines]) + "\n" == FIXED
+
+
+def test_main_pipes_stdin_to_stdout(monkeypatch, capsys):
+    monkeypatch.setattr("sys.stdin", io.StringIO(DRAFT))
+    module.main(["-"])
+    assert capsys.readouterr().out == FIXED
+
+
+def test_repo_prompt_stays_out_of_piped_output(tmp_path, monkeypatch, capsys):
+    draft = tmp_path / "llms.txt"
+    draft.write_text("# Demo\n\n> Summary\n", encoding="utf-8")
+    monkeypatch.setattr("builtins.input", lambda: "https://github.com/o/r")
+    module.main([str(draft), "-o", "-"])
+    captured = capsys.readouterr()
+    assert captured.out.startswith("# Demo\n")
+    assert "Enter GitHub repo" not in captured.out
+    assert "Enter GitHub repo" in captured.err
+    assert "- [README](https://github.com/o/r#readme): Overview" in captured.out
+
+
+def test_fix_text_uses_repo_fallback_when_no_docs():
+    fixed = module.fix_text(
+        "# Demo\n\n> Summary\n", repo_fallback=lambda: "https://github.com/o/r"
+    )
+    assert "- [README](https://github.com/o/r#readme): Overview" in fixed
+
+
+def test_repo_from_path_uses_owner_repo_layout(tmp_path):
+    path = tmp_path / "owner" / "demo" / "demo-llms.txt"
+    assert module.repo_from_path(path) == "https://github.com/owner/demo"
+    assert module.repo_from_path(tmp_path / "llms.txt") is None
+
+
+def test_fix_tree_skips_unchanged_files(tmp_path, capsys):
+    draft = tmp_path / "owner" / "demo" / "demo-llms.txt"
+    draft.parent.mkdir(parents=True)
+    draft.write_text(DRAFT, encoding="utf-8")
+
+    assert module.fix_tree(tmp_path, jobs=1, build_ctx=False)
+    assert draft.read_text(encoding="utf-8") == FIXED
+    assert "Fixed 1, unchanged 0" in capsys.readouterr().out
+
+    assert module.fix_tree(tmp_path, jobs=1, build_ctx=False)
+    assert "Fixed 0, unchanged 1" in capsys.readouterr().out
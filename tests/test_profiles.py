@@ -0,0 +1,68 @@
+import importlib.util
+import json
+import pathlib
+import sys
+import types
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+# Sibling modules are imported by name, as when run as a script.
+sys.path.insert(0, str(MODULE_DIR))
+
+# Stub out the GitHub helpers so main imports without network access.
+dummymod = types.ModuleType("repo_helpers")
+dummymod.agather_repository_info = lambda _client, _url: ("", {})
+sys.modules["repo_helpers"] = dummymod
+
+spec = importlib.util.spec_from_file_location(
+    "interactive_learning_main", MODULE_DIR / "main.py"
+)
+module = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(module)  # type: ignore[attr-defined]
+
+spec = importlib.util.spec_from_file_location("profiles", MODULE_DIR / "profiles.py")
+profiles = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(profiles)  # type: ignore[attr-defined]
+
+
+def test_backend_profiles_tune_lm_and_agent(tmp_path, monkeypatch):
+    for var in ("LLM_BACKEND", "LLM_MODEL", "LLM_API_BASE", "EXAMPLE_CONCURRENCY"):
+        monkeypatch.delenv(var, raising=False)
+
+    ollama = profiles.load_profile("ollama")
+    vllm = profiles.load_profile("vllm")
+    assert ollama.lm_kwargs()["keep_alive"] == "30m" and "num_ctx" in ollama.lm_kwargs()
+    assert "keep_alive" not in vllm.lm_kwargs()
+    # The vLLM profile talks to vLLM's OpenAI-compatible server, not Ollama.
+    assert vllm.model.startswith("hosted_vllm/")
+    assert vllm.api_base == "http://localhost:8000/v1"
+    assert (
+        vllm.agent_kwargs()["example_concurrency"]
+        > ollama.agent_kwargs()["example_concurrency"]
+    )
+
+    monkeypatch.setenv("LLM_BACKEND", "vllm")
+    monkeypatch.setenv("LLM_MODEL", "hosted_vllm/test-model")
+    monkeypatch.setenv("EXAMPLE_CONCURRENCY", "5")
+    profile = module.use_profile()
+    assert profile.name == "vllm" and profile.model == "hosted_vllm/test-model"
+    assert profile.agent_kwargs()["example_concurrency"] == 5
+    lm = module.build_lm()
+    assert lm.model == "hosted_vllm/test-model" and lm.kwargs["timeout"] == 600
+
+    path = tmp_path / "tiny.json"
+    path.write_text(json.dumps({"model": "ollama_chat/tiny", "example_concurrency": 1}))
+    assert module.use_profile(str(path)).name == "tiny"
+    try:
+        profiles.load_profile("nope")
+    except ValueError as e:
+        assert "ollama" in str(e)
+    else:
+        raise AssertionError("unknown profile accepted")
+    module._profile = None
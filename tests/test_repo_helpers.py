@@ -0,0 +1,153 @@
+import asyncio
+import base64
+import importlib.util
+import json
+import pathlib
+import sys
+
+import httpx
+
+MODULE_DIR = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+)
+
+sys.path.insert(0, str(MODULE_DIR))
+
+spec = importlib.util.spec_from_file_location(
+    "repo_helpers", MODULE_DIR / "repo_helpers.py"
+)
+repo_helpers = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(repo_helpers)  # type: ignore[attr-defined]
+
+NOTEBOOK = {
+    "cells": [
+        {
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": ["# Walkthrough\n", 'Run "demo".'],
+        },
+        {
+            "cell_type": "code",
+            "execution_count": 1,
+            "metadata": {"tags": ["slow"]},
+            "outputs": [
+                {
+                    "output_type": "display_data",
+                    "data": {
+                        "image/png": "iVBORw0KGgo" * 5000,
+                        "text/plain": ["<Figure>"],
+                    },
+                },
+                {
+                    "output_type": "stream",
+                    "name": "stdout",
+                    "text": [f"step {i}\n" for i in range(500)],
+                },
+            ],
+            "source": ["import demo\n", "demo.run()"],
+        },
+    ],
+    "metadata": {"kernelspec": {"name": "python3"}},
+    "nbformat": 4,
+    "nbformat_minor": 5,
+}
+
+FILES = {
+    "README.md": b"# Demo\n",
+    "setup.py": b"from setuptools import setup\n",
+    "demo/__init__.py": b"",
+    "demo/core.py": b"x = 1\n" * 50,
+    "examples/basic.py": b"print('basic')\n" * 20,
+    "examples/big.py": b"print('big')\n" * 2000,
+    "examples/walkthrough.ipynb": json.dumps(NOTEBOOK, indent=1).encode(),
+    "docs/tutorial/advanced.py": b"print('advanced')\n" * 10,
+}
+
+
+def _handler(request):
+    path = request.url.path
+    if request.url.host == "raw.githubusercontent.com":
+        return httpx.Response(200, content=FILES[path.split("/main/", 1)[1]])
+    if "/git/trees/" in path:
+        tree = [
+            {"path": p, "type": "blob", "size": len(data)} for p, data in FILES.items()
+        ]
+        return httpx.Response(200, json={"tree": tree[::-1]})
+    file_path = path.split("/contents/", 1)[1]
+    content = base64.b64encode(FILES[file_path]).decode()
+    return httpx.Response(200, json={"content": content})
+
+
+def _gather(budget):
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(_handler)) as client:
+            return await repo_helpers.agather_repository_info(
+                client, "https://github.com/acme/demo", budget=budget
+            )
+
+    return asyncio.run(run())
+
+
+def test_example_ranking_is_deterministic_and_skips_non_examples():
+    blobs = {p: len(data) for p, data in FILES.items()}
+
+    assert repo_helpers.rank_example_files(blobs) == [
+        "examples/basic.py",
+        "examples/big.py",
+        "docs/tutorial/advanced.py",
+        "examples/walkthrough.ipynb",
+        "setup.py",
+    ]
+    assert repo_helpers.rank_example_files(dict(reversed(blobs.items()))) == (
+        repo_helpers.rank_example_files(blobs)
+    )
+
+
+def test_examples_fill_the_byte_budget_and_are_truncated_per_file():
+    combined, details = _gather(budget=12500)
+
+    # basic.py (300 B), big.py capped at 12000 B and advanced.py (180 B) fit;
+    # the notebook (capped at 12000 B) and setup.py would overflow the 20 B left.
+    assert [p for p in details if p != "file_tree"] == [
+        "examples/basic.py",
+        "examples/big.py",
+        "docs/tutorial/advanced.py",
+    ]
+    big = details["examples/big.py"]
+    total = len(FILES["examples/big.py"])
+    assert big.endswith(f"# ... truncated ({total} bytes total)")
+    assert len(big.encode()) <= repo_helpers.MAX_EXAMPLE_FILE_BYTES + 40
+    assert combined.startswith(
+        "# REPOSITORY OVERVIEW: https://github.com/acme/demo\n\n"
+        "## README.md\n\n# Demo\n"
+    )
+    assert combined == _gather(budget=12500)[0]
+
+
+def test_notebooks_are_streamed_as_cells_without_binary_outputs():
+    combined, details = _gather(budget=25000)
+
+    notebook = details["examples/walkthrough.ipynb"]
+    assert notebook.startswith(
+        '# %% [markdown]\n# # Walkthrough\n# Run "demo".\n\n'
+        "# %%\nimport demo\ndemo.run()\n"
+    )
+    assert "# Output:\n# <Figure>\n# step 0\n" in notebook
+    assert notebook.rstrip().endswith("# ... (output truncated)")
+    for dropped in ("iVBOR", "execution_count", "slow"):
+        assert dropped not in combined
+    assert len(notebook.encode()) < 1000
+
+
+def test_notebook_extractor_handles_any_chunking():
+    data = FILES["examples/walkthrough.ipynb"]
+    whole = repo_helpers.NotebookExtractor()
+    whole.feed(data)
+    pieces = repo_helpers.NotebookExtractor()
+    for start in range(0, len(data), 7):
+        pieces.feed(data[start : start + 7])
+
+    assert pieces.text() == whole.text()
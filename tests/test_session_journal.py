@@ -0,0 +1,51 @@
+import importlib.util
+import pathlib
+
+MODULE_PATH = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+    / "session_journal.py"
+)
+
+spec = importlib.util.spec_from_file_location("session_journal", MODULE_PATH)
+session_journal = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(session_journal)  # type: ignore[attr-defined]
+
+
+def test_replay_rebuilds_the_session_and_skips_a_torn_last_line(tmp_path):
+    path = tmp_path / "session.jsonl"
+    info = {"core_concepts": ["routing"], "installation_info": "pip install fastapi"}
+
+    journal = session_journal.SessionJournal(path)
+    journal.session_started()
+    journal.library_learned("FastAPI", ["https://fastapi.tiangolo.com/"], info)
+    journal.example_generated("FastAPI", {"use_case": "hello", "code": "v1"})
+    journal.example_generated("FastAPI", {"use_case": "auth", "code": "auth"})
+    journal.example_generated("FastAPI", {"use_case": "hello", "code": "v2"})
+    journal.close()
+    with open(path, "ab") as f:
+        f.write(b'{"type": "example", "library": "FastAPI", "exam')
+
+    learned = session_journal.replay(path)
+
+    assert list(learned) == ["FastAPI"]
+    assert learned["FastAPI"]["library_info"] == info
+    assert learned["FastAPI"]["sources"] == ["https://fastapi.tiangolo.com/"]
+    assert learned["FastAPI"]["crawl"] is False
+    assert learned["FastAPI"]["examples"] == [
+        {"use_case": "auth", "code": "auth"},
+        {"use_case": "hello", "code": "v2"},
+    ]
+    assert session_journal.replay(tmp_path / "missing.jsonl") == {}
+
+
+def test_replay_keeps_the_crawl_setting(tmp_path):
+    path = tmp_path / "session.jsonl"
+
+    journal = session_journal.SessionJournal(path)
+    journal.library_learned("httpx", ["https://www.python-httpx.org/"], {}, crawl=True)
+    journal.close()
+
+    assert session_journal.replay(path)["httpx"]["crawl"] is True
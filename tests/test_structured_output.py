@@ -0,0 +1,103 @@
+import importlib.util
+import pathlib
+
+import dspy
+from dspy.utils import DummyLM
+
+MODULE_PATH = (
+    pathlib.Path(__file__).parent.parent
+    / "interactive_learning"
+    / "codeGeneration_for_unfamilar_libraries"
+    / "structured_output.py"
+)
+
+spec = importlib.util.spec_from_file_location("structured_output", MODULE_PATH)
+structured_output = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
+assert spec and spec.loader
+spec.loader.exec_module(structured_output)  # type: ignore[attr-defined]
+
+
+class Summarize(dspy.Signature):
+    """Summarize a text."""
+
+    text: str = dspy.InputField()
+    summary: str = dspy.OutputField()
+    keywords: list[str] = dspy.OutputField()
+
+
+class SchemaLM(DummyLM):
+    """A DummyLM whose backend accepts JSON-schema response formats."""
+
+    supported_params = {"response_format"}
+    supports_response_schema = True
+
+
+def test_response_format_follows_the_signature_and_is_cached():
+    response_format = structured_output.response_format_for(Summarize)
+    schema = response_format["json_schema"]["schema"]
+
+    assert response_format["json_schema"]["name"] == "Summarize"
+    assert response_format["json_schema"]["strict"] is True
+    assert schema["required"] == ["summary", "keywords"]
+    assert schema["additionalProperties"] is False
+    assert schema["properties"]["keywords"] == {
+        "items": {"type": "string"},
+        "type": "array",
+    }
+    assert structured_output.response_format_for(Summarize) is response_format
+
+
+def test_open_mappings_make_the_schema_non_strict():
+    react = dspy.ReAct("claim -> titles: list[str]", tools=[lambda query: query])
+    response_format = structured_output.response_format_for(react.react.signature)
+
+    assert response_format["json_schema"]["strict"] is False
+    assert "next_tool_args" in response_format["json_schema"]["schema"]["properties"]
+
+
+def test_adapter_sends_schema_and_counts_parse_failures_and_retries():
+    adapter = structured_output.StructuredOutputAdapter(max_retries=1)
+    lm = SchemaLM(
+        [{"oops": "not the schema"}, {"summary": "short", "keywords": '["a", "b"]'}],
+        adapter=dspy.JSONAdapter(),
+    )
+    with dspy.context(lm=lm, adapter=adapter):
+        result = dspy.Predict(Summarize)(text="long text")
+
+    assert result.summary == "short" and result.keywords == ["a", "b"]
+    sent = lm.history[-1]["kwargs"]["response_format"]
+    assert sent["json_schema"]["name"] == "Summarize"
+    assert adapter.stats["calls"] == 2
+    assert adapter.stats["parse_failures"] == 1
+    assert adapter.stats["retries"] == 1
+
+
+def test_adapter_keeps_the_fallback_for_backends_without_schemas():
+    adapter = structured_output.StructuredOutputAdapter()
+    reply = [{"summary": "short", "keywords": '["a"]'}]
+
+    plain = DummyLM(reply, adapter=dspy.JSONAdapter())
+    with dspy.context(lm=plain, adapter=adapter):
+        dspy.Predict(Summarize)(text="long text")
+    assert "response_format" not in plain.history[-1]["kwargs"]
+
+    class JSONModeLM(DummyLM):
+        supported_params = {"response_format"}
+        supports_response_schema = False
+
+    json_mode = JSONModeLM(reply, adapter=dspy.JSONAdapter())
+    with dspy.context(lm=json_mode, adapter=adapter):
+        dspy.Predict(Summarize)(text="long text")
+    sent = json_mode.history[-1]["kwargs"]["response_format"]
+    assert sent == {"type": "json_object"}
+
+
+def test_script_directory_copies_stay_identical():
+    root = MODULE_PATH.parent.parent.parent
+    copies = [
+        root / "tutorials" / "agents" / "config" / "structured_output.py",
+        root / "tutorials" / "multi-llmtxt_generator" / "structured_output.py",
+    ]
+    canonical = MODULE_PATH.read_bytes().replace(b"\r\n", b"\n")
+    for copy in copies:
+        assert copy.read_bytes().replace(b"\r\n", b"\n") == canonical, copy
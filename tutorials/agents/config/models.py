@@ -1,4 +1,5 @@
 import dspy
+from config.structured_output import StructuredOutputAdapter
 
 
 def setup_models():
@@ -11,74 +12,6 @@ def setup_models():
         api_base="http://localhost:11434",  # Local Ollama server URL
         api_key="",
         streaming=False,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "project": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "description": {"type": "string"},
-                            },
-                            "required": ["name", "description"],
-                        },
-                        "key_concepts": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                        "architecture_overview": {"type": "string"},
-                        "important_directories": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                        "entry_points": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                        "development_info": {
-                            "type": "object",
-                            "properties": {
-                                "test_dependencies": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "minItems": 1,
-                                },
-                                "linting_tools": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "minItems": 1,
-                                },
-                                "optional_dependencies": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                },
-                            },
-                            "required": ["test_dependencies", "linting_tools"],
-                        },
-                        "usage_examples": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                    },
-                    "required": [
-                        "project",
-                        "key_concepts",
-                        "architecture_overview",
-                        "important_directories",
-                        "entry_points",
-                        "development_info",
-                        "usage_examples",
-                    ],
-                }
-            },
-        },
     )
 
     # Teacher model - a larger, more capable model for generating demonstrations
@@ -88,78 +21,11 @@ def setup_models():
         api_key="",
         streaming=False,
         temperature=0.7,
-        response_format={
-            "type": "json_schema",
-            "json_schema": {
-                "schema": {
-                    "type": "object",
-                    "properties": {
-                        "project": {
-                            "type": "object",
-                            "properties": {
-                                "name": {"type": "string"},
-                                "description": {"type": "string"},
-                            },
-                            "required": ["name", "description"],
-                        },
-                        "key_concepts": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                        "architecture_overview": {"type": "string"},
-                        "important_directories": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                        "entry_points": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                        "development_info": {
-                            "type": "object",
-                            "properties": {
-                                "test_dependencies": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "minItems": 1,
-                                },
-                                "linting_tools": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "minItems": 1,
-                                },
-                                "optional_dependencies": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                },
-                            },
-                            "required": ["test_dependencies", "linting_tools"],
-                        },
-                        "usage_examples": {
-                            "type": "array",
-                            "items": {"type": "string"},
-                            "minItems": 1,
-                        },
-                    },
-                    "required": [
-                        "project",
-                        "key_concepts",
-                        "architecture_overview",
-                        "important_directories",
-                        "entry_points",
-                        "development_info",
-                        "usage_examples",
-                    ],
-                }
-            },
-        },
     )
 
-    # Configure the default language model for dspy
-    dspy.configure(lm=llama3b)
+    # Configure the default language model for dspy; every call sends the
+    # calling signature's own output schema (ReAct steps, extraction, ...).
+    dspy.configure(lm=llama3b, adapter=StructuredOutputAdapter())
 
     #Return a dictionary of models for easy access
     return {"student": llama3b, "teacher": qwen3coder}
\ No newline at end of file
@@ -0,0 +1,155 @@
+# structured_output.py
+# Purpose: Structured-output schemas derived from each DSPy signature.
+# StructuredOutputAdapter attaches the calling signature's own JSON schema to
+# every LM request, instead of one hardcoded response_format for all of them,
+# and counts the parse failures and retries that a mismatched schema causes.
+# Each script directory imports its own copy; tutorials/agents/config and
+# tutorials/multi-llmtxt_generator hold identical copies of this file, which
+# tests/test_structured_output.py keeps in sync.
+
+import threading
+from typing import Any, get_args, get_origin
+
+import dspy
+import pydantic
+from dspy.utils.exceptions import AdapterParseError
+
+_schemas = {}
+_schemas_lock = threading.Lock()
+
+
+def _is_open_mapping(annotation) -> bool:
+    return annotation is dict or get_origin(annotation) is dict
+
+
+def _close_objects(schema: dict) -> None:
+    """Requires every declared property and forbids undeclared ones, recursively."""
+    if schema.get("type") == "object" and "properties" in schema:
+        schema["required"] = list(schema["properties"])
+        schema["additionalProperties"] = False
+    for value in schema.values():
+        children = value.values() if isinstance(value, dict) else value
+        if isinstance(value, (dict, list)):
+            for child in children:
+                if isinstance(child, dict):
+                    _close_objects(child)
+
+
+def signature_schema(signature) -> dict:
+    """
+    JSON schema for a signature's output fields. Open-ended mappings (such as
+    ReAct's next_tool_args: dict[str, Any]) stay open, so the schema is then
+    not strict.
+    """
+    fields = {
+        name: (field.annotation or str, ...)
+        for name, field in signature.output_fields.items()
+    }
+    model = pydantic.create_model(f"{signature.__name__}Output", **fields)
+    schema = model.model_json_schema()
+    for prop in schema.get("properties", {}).values():
+        prop.pop("title", None)
+    open_fields = [
+        name
+        for name, field in signature.output_fields.items()
+        if _is_open_mapping(field.annotation)
+        or any(_is_open_mapping(arg) for arg in get_args(field.annotation))
+    ]
+    if not open_fields:
+        _close_objects(schema)
+    else:
+        schema["required"] = list(fields)
+    return schema
+
+
+def response_format_for(signature) -> dict:
+    """The response_format for `signature`, built once per signature class."""
+    with _schemas_lock:
+        cached = _schemas.get(signature)
+    if cached is not None:
+        return cached
+    schema = signature_schema(signature)
+    response_format = {
+        "type": "json_schema",
+        "json_schema": {
+            "name": signature.__name__,
+            "schema": schema,
+            "strict": schema.get("additionalProperties") is False,
+        },
+    }
+    with _schemas_lock:
+        _schemas[signature] = response_format
+    return response_format
+
+
+class StructuredOutputAdapter(dspy.JSONAdapter):
+    """
+    JSONAdapter that sends the signature's own schema whenever JSONAdapter
+    would send a schema at all; backends without structured-output support
+    keep its JSON-mode or plain-text fallback. A reply that still fails to
+    parse is retried up to `max_retries` times. `stats` counts
+    calls, parse failures, retries and the completion tokens spent on replies
+    that had to be thrown away.
+    """
+
+    def __init__(self, max_retries: int = 1, **kwargs):
+        super().__init__(**kwargs)
+        self.max_retries = max_retries
+        self._lock = threading.Lock()
+        self.stats = {
+            "calls": 0,
+            "parse_failures": 0,
+            "retries": 0,
+            "wasted_completion_tokens": 0,
+        }
+
+    def _count(self, **counters: Any) -> None:
+        with self._lock:
+            for key, value in counters.items():
+                self.stats[key] += value
+
+    def _prepare_response_format(self, lm, lm_kwargs, signature):
+        # JSONAdapter checks lm.supported_params and supports_response_schema
+        # and picks a schema model, JSON mode or nothing; only its schema
+        # model is swapped for the cached per-signature schema.
+        super()._prepare_response_format(lm, lm_kwargs, signature)
+        chosen = lm_kwargs.get("response_format")
+        if isinstance(chosen, type) and issubclass(chosen, pydantic.BaseModel):
+            lm_kwargs["response_format"] = response_format_for(signature)
+
+    def __call__(self, lm, lm_kwargs, signature, demos, inputs):
+        for attempt in range(self.max_retries + 1):
+            self._count(calls=1)
+            try:
+                return super().__call__(lm, dict(lm_kwargs), signature, demos, inputs)
+            except AdapterParseError:
+                history = getattr(lm, "history", None)
+                usage = (history[-1].get("usage") or {}) if history else {}
+                self._count(
+                    parse_failures=1,
+                    wasted_completion_tokens=usage.get("completion_tokens") or 0,
+                )
+                if attempt == self.max_retries:
+                    raise
+                self._count(retries=1)
+
+    async def acall(self, lm, lm_kwargs, signature, demos, inputs):
+        for attempt in range(self.max_retries + 1):
+            self._count(calls=1)
+            try:
+                return await super().acall(
+                    lm, dict(lm_kwargs), signature, demos, inputs
+                )
+            except AdapterParseError:
+                self._count(parse_failures=1)
+                if attempt == self.max_retries:
+                    raise
+                self._count(retries=1)
+
+    def summary(self) -> str:
+        s = self.stats
+        return (
+            f"{s['calls']} structured calls, {s['parse_failures']} parse failures, "
+            f"{s['retries']} retries, "
+            f"{s['wasted_completion_tokens']} wasted completion tokens"
+        )
@@ -0,0 +1,164 @@
+# instrumentation.py — JSON-lines spans for analyzer stages and fetch helpers
+#
+# Each span is one JSON object per line with wall time, LM token usage,
+# cache hits, parse failures and bytes fetched. Tracing is off unless a sink
+# is configured, either via configure_tracing() or LLMS_TRACE_FILE.
+
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from dspy.utils.callback import BaseCallback
+
+TRACE_ENV = "LLMS_TRACE_FILE"
+
+# Counters every span carries, so downstream tooling can sum without KeyErrors.
+_COUNTERS = (
+    "lm_calls",
+    "lm_ms",
+    "prompt_tokens",
+    "completion_tokens",
+    "cache_hits",
+    "parse_failures",
+    "retries",
+    "bytes_fetched",
+)
+
+
+class SpanRecorder:
+    """Writes nested spans as JSON lines to a file path or text stream."""
+
+    def __init__(self, sink=None):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._owns_stream = False
+        self._stream = None
+        if sink == "-":
+            self._stream = sys.stderr
+        elif isinstance(sink, (str, os.PathLike)):
+            self._stream = open(sink, "a", encoding="utf-8")
+            self._owns_stream = True
+        elif sink is not None:
+            self._stream = sink
+
+    @property
+    def enabled(self) -> bool:
+        return self._stream is not None
+
+    def _stack(self):
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+    def current(self) -> Optional[Dict[str, Any]]:
+        """Return the innermost open span on this thread, if any."""
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def add(self, **counters) -> None:
+        """Accumulate counters onto the innermost open span."""
+        span = self.current()
+        if span is None:
+            return
+        for key, value in counters.items():
+            span[key] = span.get(key, 0) + value
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """Time a block; the yielded dict may be updated with extra attributes."""
+        stack = self._stack()
+        record = {
+            "name": name,
+            "span_id": uuid.uuid4().hex[:16],
+            "parent_id": stack[-1]["span_id"] if stack else None,
+            "start": time.time(),
+            **{key: 0 for key in _COUNTERS},
+            **attrs,
+        }
+        stack.append(record)
+        t0 = time.perf_counter()
+        try:
+            yield record
+            record["status"] = "ok"
+        except BaseException as exc:
+            record["status"] = "error"
+            record["error"] = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            record["duration_ms"] = round((time.perf_counter() - t0) * 1000, 3)
+            stack.pop()
+            # Roll LM and fetch counters up so parents report totals.
+            if stack:
+                for key in _COUNTERS:
+                    stack[-1][key] += record[key]
+            self.emit(record)
+
+    def emit(self, record: Dict[str, Any]) -> None:
+        if self._stream is None:
+            return
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self._stream.write(line + "\n")
+            self._stream.flush()
+
+    def close(self) -> None:
+        if self._owns_stream and self._stream is not None:
+            self._stream.close()
+        self._stream = None
+
+
+class LMUsageCallback(BaseCallback):
+    """DSPy callback that charges LM usage to the recorder's open span."""
+
+    def __init__(self, recorder: SpanRecorder):
+        self.recorder = recorder
+        self._calls = {}
+
+    def on_lm_start(self, call_id, instance, inputs):
+        self._calls[call_id] = (instance, time.perf_counter())
+
+    def on_lm_end(self, call_id, outputs, exception=None):
+        instance, t0 = self._calls.pop(call_id, (None, time.perf_counter()))
+        counters = {"lm_calls": 1, "lm_ms": (time.perf_counter() - t0) * 1000}
+        history = getattr(instance, "history", None)
+        if exception is None and history:
+            entry = history[-1]
+            usage = entry.get("usage") or {}
+            counters["prompt_tokens"] = usage.get("prompt_tokens") or 0
+            counters["completion_tokens"] = usage.get("completion_tokens") or 0
+            if getattr(entry.get("response"), "cache_hit", False):
+                counters["cache_hits"] = 1
+        self.recorder.add(**counters)
+
+    def on_adapter_parse_end(self, call_id, outputs, exception=None):
+        # A failed parse makes DSPy fall back to another adapter and call the
+        # LM again, so it doubles as our retry count.
+        if exception is not None:
+            self.recorder.add(parse_failures=1, retries=1)
+
+
+_recorder = SpanRecorder(os.getenv(TRACE_ENV) or None)
+_callback = LMUsageCallback(_recorder)
+
+
+def configure_tracing(sink) -> SpanRecorder:
+    """Route spans to ``sink`` (a path, ``"-"`` for stderr, or a text stream)."""
+    global _recorder, _callback
+    _recorder.close()
+    _recorder = SpanRecorder(sink)
+    _callback = LMUsageCallback(_recorder)
+    return _recorder
+
+
+def get_recorder() -> SpanRecorder:
+    return _recorder
+
+
+def lm_callbacks() -> list:
+    """Callbacks to install around traced DSPy calls (empty when disabled)."""
+    return [_callback] if _recorder.enabled else []
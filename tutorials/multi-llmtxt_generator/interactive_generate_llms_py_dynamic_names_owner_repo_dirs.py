@@ -9,6 +9,8 @@ from datetime import datetime, timezone
 
 import dspy
 from dotenv import load_dotenv
+from instrumentation import configure_tracing
+from structured_output import StructuredOutputAdapter
 from repository_analyzer import RepositoryAnalyzer
 from repo_helpers import gather_repository_info
 
@@ -78,7 +80,8 @@ def generate_llms_txt_for_dspy(repo_url: str):
         streaming=False,
         cache=False,
     )
-    dspy.configure(lm=lm)
+    # Each call sends its own signature's output schema.
+    dspy.configure(lm=lm, adapter=StructuredOutputAdapter())
 
     file_tree, readme_content, package_files = gather_repository_info(repo_url)
     from repository_analyzer import (
@@ -145,8 +148,16 @@ if __name__ == "__main__":
         action="store_true",
         help="Append a timestamp as a trailing comment in each text file",
     )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="Write per-stage JSON-lines spans to FILE ('-' for stderr)",
+    )
     args = parser.parse_args()
 
+    if args.trace:
+        configure_tracing(args.trace)
+
     repo_url = None
     if args.repo:
         try:
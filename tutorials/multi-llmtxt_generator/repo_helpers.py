@@ -4,6 +4,8 @@ import requests
 from dotenv import load_dotenv
 import os
 
+from instrumentation import get_recorder
+
 # os.environ["GITHUB_ACCESS_TOKEN"] = "<your_access_token>"
 # Load variables from .env file into environment
 load_dotenv()
@@ -15,10 +17,13 @@ def get_github_file_tree(repo_url):
     owner, repo = parts[-2], parts[-1]
 
     api_url = f"https://api.github.com/repos/{owner}/{repo}/git/trees/main?recursive=1"
-    response = requests.get(
-        api_url,
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    with get_recorder().span("github.file_tree", url=api_url) as span:
+        response = requests.get(
+            api_url,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        span["status_code"] = response.status_code
+        span["bytes_fetched"] = len(response.content)
 
     if response.status_code == 200:
         tree_data = response.json()
@@ -37,10 +42,13 @@ def get_github_file_content(repo_url, file_path):
     owner, repo = parts[-2], parts[-1]
 
     api_url = f"https://api.github.com/repos/{owner}/{repo}/contents/{file_path}"
-    response = requests.get(
-        api_url,
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    with get_recorder().span("github.file_content", path=file_path) as span:
+        response = requests.get(
+            api_url,
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        span["status_code"] = response.status_code
+        span["bytes_fetched"] = len(response.content)
 
     if response.status_code == 200:
         import base64
@@ -53,6 +61,11 @@ def get_github_file_content(repo_url, file_path):
 
 def gather_repository_info(repo_url):
     """Gather all necessary repository information."""
+    with get_recorder().span("gather_repository_info", repo_url=repo_url):
+        return _gather_repository_info(repo_url)
+
+
+def _gather_repository_info(repo_url):
     file_tree = get_github_file_tree(repo_url)
     readme_content = get_github_file_content(repo_url, "README.md")
 
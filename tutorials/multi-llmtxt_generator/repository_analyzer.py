@@ -9,6 +9,8 @@ from signatures import (
 )
 from typing import List, Tuple
 
+from instrumentation import get_recorder, lm_callbacks
+
 
 def _nicify_title(name: str) -> str:
     base = name.rsplit("/", 1)[-1]
@@ -125,22 +127,35 @@ class RepositoryAnalyzer(dspy.Module):
         self.final_lm = final_lm  # set to a plain-text LM
 
     def forward(self, repo_url, file_tree, readme_content, package_files):
-        repo_analysis = self.analyze_repo(
-            repo_url=repo_url,
-            file_tree=file_tree,
-            readme_content=readme_content,
-        )
-        structure_analysis = self.analyze_structure(
-            file_tree=file_tree,
-            package_files=package_files,
-        )
-        usage_examples = self.generate_examples(
-            repo_info=(
-                f"Purpose: {repo_analysis.project_purpose}\n\n"
-                f"Concepts: {', '.join(repo_analysis.key_concepts or [])}\n\n"
-                f"Entry points: {', '.join(structure_analysis.entry_points or [])}\n"
+        recorder = get_recorder()
+        callbacks = [*dspy.settings.callbacks, *lm_callbacks()]
+        with dspy.context(callbacks=callbacks), recorder.span(
+            "RepositoryAnalyzer.forward", repo_url=repo_url
+        ):
+            return self._forward(
+                recorder, repo_url, file_tree, readme_content, package_files
+            )
+
+    def _forward(self, recorder, repo_url, file_tree, readme_content, package_files):
+        with recorder.span("analyze_repo", input_chars=len(file_tree) + len(readme_content)):
+            repo_analysis = self.analyze_repo(
+                repo_url=repo_url,
+                file_tree=file_tree,
+                readme_content=readme_content,
+            )
+        with recorder.span("analyze_structure", input_chars=len(file_tree) + len(package_files)):
+            structure_analysis = self.analyze_structure(
+                file_tree=file_tree,
+                package_files=package_files,
+            )
+        with recorder.span("generate_examples"):
+            usage_examples = self.generate_examples(
+                repo_info=(
+                    f"Purpose: {repo_analysis.project_purpose}\n\n"
+                    f"Concepts: {', '.join(repo_analysis.key_concepts or [])}\n\n"
+                    f"Entry points: {', '.join(structure_analysis.entry_points or [])}\n"
+                )
             )
-        )
 
         # Derive a friendly project name
         try: